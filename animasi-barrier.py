@@ -1,11 +1,9 @@
-import pygame
 import numpy as np
-import heapq
 import math
-import time
 
-# Pygame Initialization
-pygame.init()
+from pathfinding.animation import GridRenderer, play_blocking, run_animation, with_path_events
+from pathfinding.barrier_index import BarrierIndex
+from pathfinding.priority_queue import PriorityQueue
 
 # Grid settings
 WIDTH, HEIGHT = 600, 600
@@ -42,7 +40,11 @@ def find_coordinates(grid, value):
     return tuple(result[0]) if result.size > 0 else None
 
 # Fungsi untuk menghitung Barrier Raster Coefficient (P)
-def compute_barrier_coefficient(current, goal, grid):
+# Jika index (BarrierIndex) diberikan, jumlah obstacle dihitung dalam O(1)
+def compute_barrier_coefficient(current, goal, grid, index=None):
+    if index is not None:
+        return index.coefficient(current, goal)
+    
     x1, y1 = current
     x2, y2 = goal
     x_min, x_max = min(x1, x2), max(x1, x2)
@@ -55,7 +57,8 @@ def compute_barrier_coefficient(current, goal, grid):
     return max(P, 0.01)  # Ensure P is non-zero to avoid log issues
 
 # A* Algorithm with Barrier Raster Coefficient and Turn Penalty
-def a_star_search(grid, draw_func, turn_penalty_coefficient=1.0, delay=0.5):
+# Generator: menghasilkan (state, node) untuk setiap event open/close, return jalur
+def a_star_steps(grid, turn_penalty_coefficient=1.0, barrier_index=None):
     start = find_coordinates(grid, 2)
     goal = find_coordinates(grid, 3)
     
@@ -63,8 +66,11 @@ def a_star_search(grid, draw_func, turn_penalty_coefficient=1.0, delay=0.5):
         raise ValueError("Start or Goal node not found in the grid.")
     
     rows, cols = grid.shape
-    open_list = []
-    heapq.heappush(open_list, (0, start))  # Priority queue (f_score, node)
+    # Prefix-sum obstacle dibangun sekali per peta (bisa dipakai ulang antar query)
+    if barrier_index is None:
+        barrier_index = BarrierIndex(grid)
+    open_list = PriorityQueue()
+    open_list.push(start, 0)  # Priority queue (node, f_score)
     came_from = {}  # Untuk melacak jalur
 
     # G-score (biaya dari start ke node saat ini)
@@ -76,12 +82,11 @@ def a_star_search(grid, draw_func, turn_penalty_coefficient=1.0, delay=0.5):
     neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
     
     while open_list:
-        current = heapq.heappop(open_list)[1]
+        current = open_list.pop()
         closed_list.add(current)  # Tambahkan ke closed list
         
         # Animasi untuk closed list
-        draw_func(current, 'close')
-        time.sleep(delay)
+        yield 'close', current
         
         # Jika goal tercapai, rekonstruksi jalur
         if current == goal:
@@ -92,6 +97,10 @@ def a_star_search(grid, draw_func, turn_penalty_coefficient=1.0, delay=0.5):
             path.append(start)
             return path[::-1]  # Balikkan jalur
         
+        # P hanya bergantung pada current dan goal, cukup dihitung sekali per node
+        P = compute_barrier_coefficient(current, goal, grid, barrier_index)
+        barrier_factor = 1 - math.log(P)
+        
         for offset in neighbors:
             neighbor = (current[0] + offset[0], current[1] + offset[1])
             
@@ -101,9 +110,8 @@ def a_star_search(grid, draw_func, turn_penalty_coefficient=1.0, delay=0.5):
                 
                 tentative_g_score = g_score[current] + (euclidean_distance(current, neighbor) if offset[0] != 0 and offset[1] != 0 else 1)
                 
-                # Hitung Barrier Raster Coefficient (P)
-                P = compute_barrier_coefficient(current, goal, grid)
-                h = (1 - math.log(P)) * euclidean_distance(neighbor, goal)
+                # Heuristik dengan Barrier Raster Coefficient
+                h = barrier_factor * euclidean_distance(neighbor, goal)
                 
                 # Hitung Turn Penalty
                 if current in came_from:
@@ -122,76 +130,38 @@ def a_star_search(grid, draw_func, turn_penalty_coefficient=1.0, delay=0.5):
                     g_score[neighbor] = tentative_g_score
                     f_score[neighbor] = f
 
-                    if not any(neighbor == item[1] for item in open_list):
-                        heapq.heappush(open_list, (f_score[neighbor], neighbor))
-                        draw_func(neighbor, 'open')  # Animasi untuk open list
-                        time.sleep(delay)
+                    # Tambahkan ke open list, atau perbarui prioritasnya jika sudah ada
+                    is_new = neighbor not in open_list
+                    open_list.push(neighbor, f_score[neighbor])
+                    if is_new:
+                        yield 'open', neighbor  # Animasi untuk open list
     
     return None  # Tidak ada jalur ditemukan
 
-# Fungsi untuk menggambar grid
-def draw_grid(screen, grid, open_nodes, close_nodes, path_nodes):
-    for row in range(ROWS):
-        for col in range(COLS):
-            x, y = col * TILE_WIDTH, row * TILE_HEIGHT
-            value = grid[row, col]
-            if value == 1:  # Obstacle
-                pygame.draw.rect(screen, BLACK, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            elif value == 2:  # Start
-                pygame.draw.rect(screen, GREEN, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            elif value == 3:  # Goal
-                pygame.draw.rect(screen, RED, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            else:  # Free space
-                pygame.draw.rect(screen, WHITE, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            
-            pygame.draw.rect(screen, GREY, (x, y, TILE_WIDTH, TILE_HEIGHT), 1)  # Grid lines
-    
-    for node in open_nodes:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, BLUE, (x, y, TILE_WIDTH, TILE_HEIGHT))
-    for node in close_nodes:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, YELLOW, (x, y, TILE_WIDTH, TILE_HEIGHT))
-    for node in path_nodes:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, CYAN, (x, y, TILE_WIDTH, TILE_HEIGHT))
+# Versi lama: draw_func + time.sleep per event (memblokir loop pygame)
+def a_star_search(grid, draw_func, turn_penalty_coefficient=1.0, delay=0.5, barrier_index=None):
+    return play_blocking(a_star_steps(grid, turn_penalty_coefficient, barrier_index), draw_func, delay)
+
+# Warna sel grid dan status node; status yang lebih akhir menimpa yang sebelumnya
+CELL_COLORS = {0: WHITE, 1: BLACK, 2: GREEN, 3: RED}
+STATE_COLORS = [('open', BLUE), ('close', YELLOW), ('path', CYAN)]
 
 # Fungsi utama animasi
 def main():
+    import pygame  # Hanya entry point visualisasi yang memuat pygame
+
+    pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("A* Pathfinding Visualization with Barrier Raster")
-    clock = pygame.time.Clock()
-    
-    running = True
-    open_nodes = []
-    close_nodes = []
-    path_nodes = []
-
-    def draw_func(node, state):
-        if state == 'open':
-            open_nodes.append(node)
-        elif state == 'close':
-            close_nodes.append(node)
-        screen.fill(WHITE)
-        draw_grid(screen, map_grid, open_nodes, close_nodes, path_nodes)
-        pygame.display.flip()
-    
-    # Jalankan A* dan dapatkan path
-    path = a_star_search(map_grid, draw_func, turn_penalty_coefficient=1.0, delay=0.5)
-    
-    if path:
-        path_nodes = path
-        for node in path_nodes:
-            draw_func(node, 'path')
-            time.sleep(0.2)
-    
-    # Tunggu hingga window ditutup
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-        clock.tick(60)
-    
+    screen.fill(WHITE)
+    # Hanya sel yang berubah yang digambar ulang (dirty rect)
+    renderer = GridRenderer(screen, map_grid, TILE_WIDTH, TILE_HEIGHT, CELL_COLORS, STATE_COLORS, GREY)
+
+    # Pencarian berjalan sebagai generator; run_animation mengambil event per frame
+    # (spasi = pause, atas/bawah = kecepatan, F = fast-forward) sampai window ditutup
+    steps = with_path_events(a_star_steps(map_grid, turn_penalty_coefficient=1.0))
+    run_animation(screen, steps, renderer.apply, renderer.present, events_per_second=2)
+
     pygame.quit()
 
 # Jalankan program
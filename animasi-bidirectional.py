@@ -1,11 +1,8 @@
-import pygame
 import numpy as np
-import heapq
 import math
-import time
 
-# Pygame Initialization
-pygame.init()
+from pathfinding.animation import GridRenderer, play_blocking, run_animation, with_path_events
+from pathfinding.priority_queue import PriorityQueue
 
 # Grid settings
 WIDTH, HEIGHT = 600, 600
@@ -43,7 +40,8 @@ def find_coordinates(grid, value):
     return tuple(result[0]) if result.size > 0 else None
 
 # Bidirectional A* Algorithm
-def bidirectional_a_star(grid, draw_func, delay=1):
+# Generator: menghasilkan (state, node) untuk setiap event open/close, return jalur
+def bidirectional_a_star_steps(grid):
     start = find_coordinates(grid, 2)
     goal = find_coordinates(grid, 3)
     
@@ -53,10 +51,10 @@ def bidirectional_a_star(grid, draw_func, delay=1):
     rows, cols = grid.shape
     
     # Open lists and closed lists for both directions
-    open_list_start = []
-    open_list_goal = []
-    heapq.heappush(open_list_start, (0, start))
-    heapq.heappush(open_list_goal, (0, goal))
+    open_list_start = PriorityQueue()
+    open_list_goal = PriorityQueue()
+    open_list_start.push(start, 0)
+    open_list_goal.push(goal, 0)
     closed_list_start = set()
     closed_list_goal = set()
 
@@ -74,155 +72,117 @@ def bidirectional_a_star(grid, draw_func, delay=1):
     neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
     
     def reconstruct_path(meeting_point):
-        # Rekonstruksi jalur dari start ke goal
-        path_start = []
+        # Rekonstruksi jalur: start -> meeting point -> goal
+        path_start = [meeting_point]
         current = meeting_point
         while current in came_from_start:
-            path_start.append(current)
             current = came_from_start[current]
-        path_start = path_start[::-1]
+            path_start.append(current)
+        path = path_start[::-1]
 
-        path_goal = []
         current = meeting_point
         while current in came_from_goal:
-            path_goal.append(current)
             current = came_from_goal[current]
-        
-        return path_start + path_goal[1:]  # Hindari duplikasi titik meeting point
+            path.append(current)
+        return path
+    
+    # mu: biaya jalur terbaik yang sudah ditemukan lewat meeting point
+    best_cost = 0 if start == goal else math.inf
+    meeting_point = start if start == goal else None
     
     while open_list_start and open_list_goal:
-        # Proses dari arah start
-        current_start = heapq.heappop(open_list_start)[1]
-        closed_list_start.add(current_start)
-        draw_func(current_start, 'close_start')  # Animasi untuk closed list (start)
-        time.sleep(delay)
-        
-        # Proses dari arah goal
-        current_goal = heapq.heappop(open_list_goal)[1]
-        closed_list_goal.add(current_goal)
-        draw_func(current_goal, 'close_goal')  # Animasi untuk closed list (goal)
-        time.sleep(delay)
+        # Berhenti jika tidak ada jalur yang bisa lebih murah dari mu
+        if open_list_start.peek_priority() >= best_cost or open_list_goal.peek_priority() >= best_cost:
+            break
         
-        # Jika kedua sisi bertemu
-        if current_start in closed_list_goal or current_goal in closed_list_start:
-            meeting_point = current_start if current_start in closed_list_goal else current_goal
-            return reconstruct_path(meeting_point)
-
-        # Proses neighbors untuk arah start
-        for offset in neighbors:
-            neighbor = (current_start[0] + offset[0], current_start[1] + offset[1])
-            if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and grid[neighbor] != 1:
-                if neighbor in closed_list_start:
-                    continue
-                
-                tentative_g_score = g_score_start[current_start] + (euclidean_distance(current_start, neighbor) if offset[0] != 0 and offset[1] != 0 else 1)
-                if neighbor not in g_score_start or tentative_g_score < g_score_start[neighbor]:
-                    came_from_start[neighbor] = current_start
-                    g_score_start[neighbor] = tentative_g_score
-                    f_score_start[neighbor] = tentative_g_score + euclidean_distance(neighbor, goal)
+        if len(open_list_start) <= len(open_list_goal):
+            # Proses dari arah start (frontier lebih kecil)
+            current_start = open_list_start.pop()
+            closed_list_start.add(current_start)
+            yield 'close_start', current_start  # Animasi untuk closed list (start)
+            
+            for offset in neighbors:
+                neighbor = (current_start[0] + offset[0], current_start[1] + offset[1])
+                if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and grid[neighbor] != 1:
+                    if neighbor in closed_list_start:
+                        continue
                     
-                    if not any(neighbor == item[1] for item in open_list_start):
-                        heapq.heappush(open_list_start, (f_score_start[neighbor], neighbor))
-                        draw_func(neighbor, 'open_start')  # Animasi untuk open list (start)
-                        time.sleep(delay)
-        
-        # Proses neighbors untuk arah goal
-        for offset in neighbors:
-            neighbor = (current_goal[0] + offset[0], current_goal[1] + offset[1])
-            if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and grid[neighbor] != 1:
-                if neighbor in closed_list_goal:
-                    continue
-                
-                tentative_g_score = g_score_goal[current_goal] + (euclidean_distance(current_goal, neighbor) if offset[0] != 0 and offset[1] != 0 else 1)
-                if neighbor not in g_score_goal or tentative_g_score < g_score_goal[neighbor]:
-                    came_from_goal[neighbor] = current_goal
-                    g_score_goal[neighbor] = tentative_g_score
-                    f_score_goal[neighbor] = tentative_g_score + euclidean_distance(neighbor, start)
+                    tentative_g_score = g_score_start[current_start] + (euclidean_distance(current_start, neighbor) if offset[0] != 0 and offset[1] != 0 else 1)
+                    if neighbor not in g_score_start or tentative_g_score < g_score_start[neighbor]:
+                        came_from_start[neighbor] = current_start
+                        g_score_start[neighbor] = tentative_g_score
+                        f_score_start[neighbor] = tentative_g_score + euclidean_distance(neighbor, goal)
+                        
+                        # Perbarui mu jika neighbor sudah dicapai dari arah goal
+                        if neighbor in g_score_goal and tentative_g_score + g_score_goal[neighbor] < best_cost:
+                            best_cost = tentative_g_score + g_score_goal[neighbor]
+                            meeting_point = neighbor
+                        
+                        # Tambahkan ke open list, atau perbarui prioritasnya jika sudah ada
+                        is_new = neighbor not in open_list_start
+                        open_list_start.push(neighbor, f_score_start[neighbor])
+                        if is_new:
+                            yield 'open_start', neighbor  # Animasi untuk open list (start)
+        else:
+            # Proses dari arah goal (frontier lebih kecil)
+            current_goal = open_list_goal.pop()
+            closed_list_goal.add(current_goal)
+            yield 'close_goal', current_goal  # Animasi untuk closed list (goal)
+            
+            for offset in neighbors:
+                neighbor = (current_goal[0] + offset[0], current_goal[1] + offset[1])
+                if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and grid[neighbor] != 1:
+                    if neighbor in closed_list_goal:
+                        continue
                     
-                    if not any(neighbor == item[1] for item in open_list_goal):
-                        heapq.heappush(open_list_goal, (f_score_goal[neighbor], neighbor))
-                        draw_func(neighbor, 'open_goal')  # Animasi untuk open list (goal)
-                        time.sleep(delay)
+                    tentative_g_score = g_score_goal[current_goal] + (euclidean_distance(current_goal, neighbor) if offset[0] != 0 and offset[1] != 0 else 1)
+                    if neighbor not in g_score_goal or tentative_g_score < g_score_goal[neighbor]:
+                        came_from_goal[neighbor] = current_goal
+                        g_score_goal[neighbor] = tentative_g_score
+                        f_score_goal[neighbor] = tentative_g_score + euclidean_distance(neighbor, start)
+                        
+                        # Perbarui mu jika neighbor sudah dicapai dari arah start
+                        if neighbor in g_score_start and tentative_g_score + g_score_start[neighbor] < best_cost:
+                            best_cost = tentative_g_score + g_score_start[neighbor]
+                            meeting_point = neighbor
+                        
+                        # Tambahkan ke open list, atau perbarui prioritasnya jika sudah ada
+                        is_new = neighbor not in open_list_goal
+                        open_list_goal.push(neighbor, f_score_goal[neighbor])
+                        if is_new:
+                            yield 'open_goal', neighbor  # Animasi untuk open list (goal)
+    
+    if meeting_point is not None:
+        return reconstruct_path(meeting_point)
     
     return None  # Tidak ada jalur ditemukan
 
-# Fungsi untuk menggambar grid
-def draw_grid(screen, grid, open_nodes_start, open_nodes_goal, close_nodes_start, close_nodes_goal, path_nodes):
-    for row in range(ROWS):
-        for col in range(COLS):
-            x, y = col * TILE_WIDTH, row * TILE_HEIGHT
-            value = grid[row, col]
-            if value == 1:  # Obstacle
-                pygame.draw.rect(screen, BLACK, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            elif value == 2:  # Start
-                pygame.draw.rect(screen, GREEN, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            elif value == 3:  # Goal
-                pygame.draw.rect(screen, RED, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            else:  # Free space
-                pygame.draw.rect(screen, WHITE, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            
-            # Garis grid
-            pygame.draw.rect(screen, GREY, (x, y, TILE_WIDTH, TILE_HEIGHT), 1)
-    
-    # Tampilkan node open, close, dan path
-    for node in open_nodes_start:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, BLUE, (x, y, TILE_WIDTH, TILE_HEIGHT))
-    for node in open_nodes_goal:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, MAGENTA, (x, y, TILE_WIDTH, TILE_HEIGHT))
-    for node in close_nodes_start:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, YELLOW, (x, y, TILE_WIDTH, TILE_HEIGHT))
-    for node in close_nodes_goal:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, CYAN, (x, y, TILE_WIDTH, TILE_HEIGHT))
-    for node in path_nodes:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, RED, (x, y, TILE_WIDTH, TILE_HEIGHT))
+# Versi lama: draw_func + time.sleep per event (memblokir loop pygame)
+def bidirectional_a_star(grid, draw_func, delay=1):
+    return play_blocking(bidirectional_a_star_steps(grid), draw_func, delay)
+
+# Warna sel grid dan status node; status yang lebih akhir menimpa yang sebelumnya
+CELL_COLORS = {0: WHITE, 1: BLACK, 2: GREEN, 3: RED}
+STATE_COLORS = [
+    ('open_start', BLUE), ('open_goal', MAGENTA), ('close_start', YELLOW), ('close_goal', CYAN), ('path', RED),
+]
 
 # Fungsi utama animasi
 def main():
+    import pygame  # Hanya entry point visualisasi yang memuat pygame
+
+    pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Bidirectional A* Pathfinding Visualization")
-    clock = pygame.time.Clock()
-    
-    running = True
-    open_nodes_start = []
-    open_nodes_goal = []
-    close_nodes_start = []
-    close_nodes_goal = []
-    path_nodes = []
-
-    def draw_func(node, state):
-        if state == 'open_start':
-            open_nodes_start.append(node)
-        elif state == 'open_goal':
-            open_nodes_goal.append(node)
-        elif state == 'close_start':
-            close_nodes_start.append(node)
-        elif state == 'close_goal':
-            close_nodes_goal.append(node)
-        screen.fill(WHITE)
-        draw_grid(screen, map_grid, open_nodes_start, open_nodes_goal, close_nodes_start, close_nodes_goal, path_nodes)
-        pygame.display.flip()
-    
-    # Jalankan Bidirectional A* dan dapatkan path
-    path = bidirectional_a_star(map_grid, draw_func, delay=0.5)
-    
-    if path:
-        path_nodes = path
-        for node in path_nodes:
-            draw_func(node, 'path')
-            time.sleep(0.2)
-    
-    # Tunggu hingga window ditutup
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-        clock.tick(60)
-    
+    screen.fill(WHITE)
+    # Hanya sel yang berubah yang digambar ulang (dirty rect)
+    renderer = GridRenderer(screen, map_grid, TILE_WIDTH, TILE_HEIGHT, CELL_COLORS, STATE_COLORS, GREY)
+
+    # Pencarian berjalan sebagai generator; run_animation mengambil event per frame
+    # (spasi = pause, atas/bawah = kecepatan, F = fast-forward) sampai window ditutup
+    steps = with_path_events(bidirectional_a_star_steps(map_grid))
+    run_animation(screen, steps, renderer.apply, renderer.present, events_per_second=2)
+
     pygame.quit()
 
 # Jalankan program
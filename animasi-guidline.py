@@ -1,11 +1,9 @@
-import pygame
 import numpy as np
-import heapq
 import math
-import time
 
-# Pygame Initialization
-pygame.init()
+from pathfinding.animation import GridRenderer, play_blocking, run_animation, with_path_events
+from pathfinding.heuristic_fields import guideline_heuristic_field
+from pathfinding.priority_queue import PriorityQueue
 
 # Grid settings
 WIDTH, HEIGHT = 600, 600
@@ -51,7 +49,9 @@ def find_coordinates(grid, value):
     return tuple(result[0]) if result.size > 0 else None
 
 # A* Algorithm dengan guideline cost
-def a_star_search(grid, draw_func, delay=0.5):
+# Generator: menghasilkan (state, node) untuk setiap event open/close, return jalur
+# precompute / field_cache: sama dengan a_star_with_guideline pada perhitungan-guidline.py
+def a_star_steps(grid, precompute=False, field_cache=None):
     start = find_coordinates(grid, 2)
     goal = find_coordinates(grid, 3)
     
@@ -59,20 +59,25 @@ def a_star_search(grid, draw_func, delay=0.5):
         raise ValueError("Start or Goal node not found in the grid.")
     
     rows, cols = grid.shape
-    open_list = []
-    heapq.heappush(open_list, (0, start))
+    heuristic_field = None
+    if precompute or field_cache is not None:
+        heuristic_field = guideline_heuristic_field(grid.shape, start, goal, field_cache)
+    open_list = PriorityQueue()
+    open_list.push(start, 0)
     came_from = {}
     g_score = {start: 0}
-    f_score = {start: euclidean_distance(start, goal) + guideline_cost(start, start, goal)}
+    if heuristic_field is not None:
+        f_score = {start: heuristic_field[start]}
+    else:
+        f_score = {start: euclidean_distance(start, goal) + guideline_cost(start, start, goal)}
     closed_list = set()
     neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
     
     while open_list:
-        current = heapq.heappop(open_list)[1]
+        current = open_list.pop()
         closed_list.add(current)
         
-        draw_func(current, 'close')  # Animasi untuk close list
-        time.sleep(delay)
+        yield 'close', current  # Animasi untuk close list
         
         if current == goal:
             path = []
@@ -89,75 +94,48 @@ def a_star_search(grid, draw_func, delay=0.5):
                     continue
                 
                 g_new = g_score[current] + (euclidean_distance(current, neighbor) if offset[0] != 0 and offset[1] != 0 else 1)
-                h_new = euclidean_distance(neighbor, goal)
-                c_new = guideline_cost(neighbor, start, goal)
-                f_new = g_new + h_new + c_new
+                if heuristic_field is not None:
+                    f_new = g_new + heuristic_field[neighbor]  # H + C dari field
+                else:
+                    h_new = euclidean_distance(neighbor, goal)
+                    c_new = guideline_cost(neighbor, start, goal)
+                    f_new = g_new + h_new + c_new
 
                 if neighbor not in g_score or g_new < g_score[neighbor]:
                     came_from[neighbor] = current
                     g_score[neighbor] = g_new
                     f_score[neighbor] = f_new
-                    if not any(neighbor == item[1] for item in open_list):
-                        heapq.heappush(open_list, (f_new, neighbor))
-                        draw_func(neighbor, 'open')  # Animasi untuk open list
-                        time.sleep(delay)
+                    # Tambahkan ke open list, atau perbarui prioritasnya jika sudah ada
+                    is_new = neighbor not in open_list
+                    open_list.push(neighbor, f_new)
+                    if is_new:
+                        yield 'open', neighbor  # Animasi untuk open list
     return None
 
-# Fungsi untuk menggambar grid
-def draw_grid(screen, grid, open_nodes, close_nodes, path_nodes):
-    for row in range(ROWS):
-        for col in range(COLS):
-            x, y = col * TILE_WIDTH, row * TILE_HEIGHT
-            value = grid[row, col]
-            if value == 1:  # Obstacle
-                pygame.draw.rect(screen, BLACK, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            elif value == 2:  # Start
-                pygame.draw.rect(screen, GREEN, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            elif value == 3:  # Goal
-                pygame.draw.rect(screen, RED, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            else:  # Free space
-                pygame.draw.rect(screen, WHITE, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            pygame.draw.rect(screen, GREY, (x, y, TILE_WIDTH, TILE_HEIGHT), 1)
-    for node in open_nodes:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, BLUE, (x, y, TILE_WIDTH, TILE_HEIGHT))
-    for node in close_nodes:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, YELLOW, (x, y, TILE_WIDTH, TILE_HEIGHT))
-    for node in path_nodes:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, CYAN, (x, y, TILE_WIDTH, TILE_HEIGHT))
+# Versi lama: draw_func + time.sleep per event (memblokir loop pygame)
+def a_star_search(grid, draw_func, delay=0.5, precompute=False, field_cache=None):
+    return play_blocking(a_star_steps(grid, precompute, field_cache), draw_func, delay)
+
+# Warna sel grid dan status node; status yang lebih akhir menimpa yang sebelumnya
+CELL_COLORS = {0: WHITE, 1: BLACK, 2: GREEN, 3: RED}
+STATE_COLORS = [('open', BLUE), ('close', YELLOW), ('path', CYAN)]
 
 # Fungsi utama animasi
 def main():
+    import pygame  # Hanya entry point visualisasi yang memuat pygame
+
+    pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("A* Pathfinding Visualization")
-    clock = pygame.time.Clock()
-    running = True
-    open_nodes, close_nodes, path_nodes = [], [], []
-
-    def draw_func(node, state):
-        if state == 'open':
-            open_nodes.append(node)
-        elif state == 'close':
-            close_nodes.append(node)
-        elif state == 'path':
-            path_nodes.append(node)
-        screen.fill(WHITE)
-        draw_grid(screen, map_grid, open_nodes, close_nodes, path_nodes)
-        pygame.display.flip()
-
-    path = a_star_search(map_grid, draw_func, delay=0.5)
-    if path:
-        for node in path:
-            draw_func(node, 'path')
-            time.sleep(0.2)
-
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-        clock.tick(60)
+    screen.fill(WHITE)
+    # Hanya sel yang berubah yang digambar ulang (dirty rect)
+    renderer = GridRenderer(screen, map_grid, TILE_WIDTH, TILE_HEIGHT, CELL_COLORS, STATE_COLORS, GREY)
+
+    # Pencarian berjalan sebagai generator; run_animation mengambil event per frame
+    # (spasi = pause, atas/bawah = kecepatan, F = fast-forward) sampai window ditutup
+    steps = with_path_events(a_star_steps(map_grid))
+    run_animation(screen, steps, renderer.apply, renderer.present, events_per_second=2)
+
     pygame.quit()
 
 if __name__ == "__main__":
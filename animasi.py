@@ -1,11 +1,8 @@
-import pygame
 import numpy as np
-import heapq
 import math
-import time
 
-# Pygame Initialization
-pygame.init()
+from pathfinding.animation import GridRenderer, play_blocking, run_animation, with_path_events
+from pathfinding.priority_queue import PriorityQueue
 
 # Grid settings
 WIDTH, HEIGHT = 600, 600
@@ -42,7 +39,8 @@ def find_coordinates(grid, value):
     return tuple(result[0]) if result.size > 0 else None
 
 # A* Algorithm
-def a_star_search(grid, draw_func, delay=0.2):
+# Generator: menghasilkan (state, node) untuk setiap event open/close, return jalur
+def a_star_steps(grid):
     start = find_coordinates(grid, 2)
     goal = find_coordinates(grid, 3)
     
@@ -50,8 +48,8 @@ def a_star_search(grid, draw_func, delay=0.2):
         raise ValueError("Start or Goal node not found in the grid.")
     
     rows, cols = grid.shape
-    open_list = []
-    heapq.heappush(open_list, (0, start))
+    open_list = PriorityQueue()
+    open_list.push(start, 0)
     came_from = {}
     g_score = {start: 0}
     f_score = {start: euclidean_distance(start, goal)}
@@ -59,12 +57,11 @@ def a_star_search(grid, draw_func, delay=0.2):
     neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
     
     while open_list:
-        current = heapq.heappop(open_list)[1]
+        current = open_list.pop()
         closed_list.add(current)
         
         # Animasi untuk closed list
-        draw_func(current, 'close')
-        time.sleep(delay)
+        yield 'close', current
         
         if current == goal:
             path = []
@@ -86,79 +83,38 @@ def a_star_search(grid, draw_func, delay=0.2):
                     g_score[neighbor] = tentative_g_score
                     f_score[neighbor] = tentative_g_score + euclidean_distance(neighbor, goal)
                     
-                    # Tambahkan ke open list jika belum ada
-                    if not any(neighbor == item[1] for item in open_list):
-                        heapq.heappush(open_list, (f_score[neighbor], neighbor))
-                        draw_func(neighbor, 'open')  # Animasi untuk open list
-                        time.sleep(delay)
+                    # Tambahkan ke open list, atau perbarui prioritasnya jika sudah ada
+                    is_new = neighbor not in open_list
+                    open_list.push(neighbor, f_score[neighbor])
+                    if is_new:
+                        yield 'open', neighbor  # Animasi untuk open list
     
     return None
 
-# Fungsi untuk menggambar grid
-def draw_grid(screen, grid, open_nodes, close_nodes, path_nodes):
-    for row in range(ROWS):
-        for col in range(COLS):
-            x, y = col * TILE_WIDTH, row * TILE_HEIGHT  # Kolom (x), Baris (y)
-            value = grid[row, col]
-            if value == 1:  # Obstacle
-                pygame.draw.rect(screen, BLACK, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            elif value == 2:  # Start
-                pygame.draw.rect(screen, GREEN, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            elif value == 3:  # Goal
-                pygame.draw.rect(screen, RED, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            else:  # Free space
-                pygame.draw.rect(screen, WHITE, (x, y, TILE_WIDTH, TILE_HEIGHT))
-            
-            # Garis grid
-            pygame.draw.rect(screen, GREY, (x, y, TILE_WIDTH, TILE_HEIGHT), 1)
-    
-    # Tampilkan node open, close, dan path
-    for node in open_nodes:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, BLUE, (x, y, TILE_WIDTH, TILE_HEIGHT))
-    for node in close_nodes:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, YELLOW, (x, y, TILE_WIDTH, TILE_HEIGHT))
-    for node in path_nodes:
-        x, y = node[1] * TILE_WIDTH, node[0] * TILE_HEIGHT
-        pygame.draw.rect(screen, CYAN, (x, y, TILE_WIDTH, TILE_HEIGHT))
+# Versi lama: draw_func + time.sleep per event (memblokir loop pygame)
+def a_star_search(grid, draw_func, delay=0.2):
+    return play_blocking(a_star_steps(grid), draw_func, delay)
+
+# Warna sel grid dan status node; status yang lebih akhir menimpa yang sebelumnya
+CELL_COLORS = {0: WHITE, 1: BLACK, 2: GREEN, 3: RED}
+STATE_COLORS = [('open', BLUE), ('close', YELLOW), ('path', CYAN)]
 
 # Fungsi utama animasi
 def main():
+    import pygame  # Hanya entry point visualisasi yang memuat pygame
+
+    pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("A* Pathfinding Visualization")
-    clock = pygame.time.Clock()
-    
-    running = True
-    open_nodes = []
-    close_nodes = []
-    path_nodes = []
+    screen.fill(WHITE)
+    # Hanya sel yang berubah yang digambar ulang (dirty rect)
+    renderer = GridRenderer(screen, map_grid, TILE_WIDTH, TILE_HEIGHT, CELL_COLORS, STATE_COLORS, GREY)
+
+    # Pencarian berjalan sebagai generator; run_animation mengambil event per frame
+    # (spasi = pause, atas/bawah = kecepatan, F = fast-forward) sampai window ditutup
+    steps = with_path_events(a_star_steps(map_grid))
+    run_animation(screen, steps, renderer.apply, renderer.present, events_per_second=5)
 
-    def draw_func(node, state):
-        if state == 'open':
-            open_nodes.append(node)
-        elif state == 'close':
-            close_nodes.append(node)
-        screen.fill(WHITE)
-        draw_grid(screen, map_grid, open_nodes, close_nodes, path_nodes)
-        pygame.display.flip()
-    
-    # Jalankan A* dan dapatkan path
-    path = a_star_search(map_grid, draw_func, delay=0.2)
-    
-    if path:
-        path_nodes = path
-        for node in path_nodes:
-            draw_func(node, 'path')
-            time.sleep(0.2)
-    
-    # Tunggu hingga window ditutup
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-        clock.tick(60)
-    
     pygame.quit()
 
 # Jalankan program
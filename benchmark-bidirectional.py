@@ -0,0 +1,85 @@
+import math
+import time
+
+import numpy as np
+
+from pathfinding.astar_engine import ArrayAStarPathfinder
+from pathfinding.bidirectional import BidirectionalAStarPathfinder
+from pathfinding.tracing import NODE_EXPANDED, EventCounter, Tracer
+
+# Ukuran peta (sisi) yang diuji
+GRID_SIZES = [64, 128, 256]
+
+
+def make_serpentine(size):
+    """Koridor berkelok: dinding horizontal dengan celah bergantian di kiri/kanan"""
+    grid = np.zeros((size, size), dtype=int)
+    for index, row in enumerate(range(2, size - 1, 3)):
+        grid[row, :] = 1
+        if index % 2 == 0:
+            grid[row, size - 2:] = 0
+        else:
+            grid[row, :2] = 0
+    return grid, (0, 0), (size - 1, size - 1)
+
+
+def make_corridor(size):
+    """Koridor panjang lebar 3 sel dengan sekat pendek bergantian"""
+    grid = np.ones((size, size), dtype=int)
+    middle = size // 2
+    grid[middle - 1:middle + 2, :] = 0
+    for col in range(8, size - 8, 8):
+        grid[middle - 1 + (col // 8) % 2 * 2, col] = 1
+    return grid, (middle, 0), (middle, size - 1)
+
+
+def make_trap(size):
+    """Start di dalam kantong berbentuk U yang terbuka menjauhi goal"""
+    grid = np.zeros((size, size), dtype=int)
+    low, high = size // 4, 3 * size // 4
+    grid[low, low:high] = 1
+    grid[high, low:high] = 1
+    grid[low:high + 1, high] = 1
+    middle = size // 2
+    return grid, (middle, high - 2), (middle, size - 1)
+
+
+def make_random(size, seed=0):
+    rng = np.random.default_rng(seed)
+    grid = (rng.random((size, size)) < 0.3).astype(int)
+    grid[:2, :2] = 0
+    grid[size - 2:, size - 2:] = 0
+    return grid, (0, 0), (size - 1, size - 1)
+
+
+MAP_FAMILIES = {
+    "serpentine": make_serpentine,
+    "corridor": make_corridor,
+    "trap": make_trap,
+    "random-30%": make_random,
+}
+
+
+def run(pathfinder, start, goal):
+    counter = EventCounter()
+    start_time = time.perf_counter()
+    path = pathfinder.find_path(start, goal, tracer=Tracer(counter))
+    elapsed = time.perf_counter() - start_time
+    cost = sum(math.dist(a, b) for a, b in zip(path, path[1:])) if path else float("nan")
+    return elapsed, counter.counts[NODE_EXPANDED], cost
+
+
+def main():
+    print(f"{'map':>12} {'size':>6} {'engine':>14} {'time (s)':>10} {'expanded':>10} {'cost':>10} {'ratio':>7}")
+    for family, make_map in MAP_FAMILIES.items():
+        for size in GRID_SIZES:
+            grid, start, goal = make_map(size)
+            uni_time, uni_expanded, uni_cost = run(ArrayAStarPathfinder(grid), start, goal)
+            bi_time, bi_expanded, bi_cost = run(BidirectionalAStarPathfinder(grid), start, goal)
+            print(f"{family:>12} {size:>6} {'A*':>14} {uni_time:>10.3f} {uni_expanded:>10} {uni_cost:>10.2f} {'':>7}")
+            ratio = uni_expanded / bi_expanded if bi_expanded else float("nan")
+            print(f"{family:>12} {size:>6} {'bidirectional':>14} {bi_time:>10.3f} {bi_expanded:>10} {bi_cost:>10.2f} {ratio:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
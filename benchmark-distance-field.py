@@ -0,0 +1,50 @@
+import time
+
+import numpy as np
+
+from pathfinding.astar_engine import ArrayAStarPathfinder
+from pathfinding.distance_field import DistanceFieldPlanner
+
+# Ukuran peta (sisi) dan jumlah agen yang menuju satu dock
+GRID_SIZES = [128, 256, 512]
+AGENT_COUNTS = [1, 10, 100]
+OBSTACLE_DENSITY = 0.2
+
+
+def make_agents(size, count, seed=0):
+    """Peta acak, dock di pojok kanan bawah, dan count start acak yang bebas"""
+    rng = np.random.default_rng(seed)
+    grid = (rng.random((size, size)) < OBSTACLE_DENSITY).astype(int)
+    dock = (size - 1, size - 1)
+    grid[dock] = 0
+    free = np.argwhere(grid == 0)
+    starts = [tuple(int(v) for v in cell) for cell in free[rng.choice(len(free), count, replace=False)]]
+    return grid, dock, starts
+
+
+def main():
+    print(f"{'size':>6} {'agents':>7} {'A* (s)':>14} {'field (s)':>10} {'build (s)':>10} "
+          f"{'paths (s)':>10} {'speedup':>8}")
+    for size in GRID_SIZES:
+        for count in AGENT_COUNTS:
+            grid, dock, starts = make_agents(size, count)
+
+            engine = ArrayAStarPathfinder(grid)
+            start_time = time.perf_counter()
+            expected = [engine.find_path(start, dock) for start in starts]
+            astar_time = time.perf_counter() - start_time
+
+            planner = DistanceFieldPlanner(grid)
+            start_time = time.perf_counter()
+            planner.field(dock)
+            build_time = time.perf_counter() - start_time
+            paths = planner.find_paths(starts, dock)
+            field_time = time.perf_counter() - start_time
+
+            assert [path is None for path in paths] == [path is None for path in expected]
+            print(f"{size:>6} {count:>7} {astar_time:>14.3f} {field_time:>10.3f} {build_time:>10.3f} "
+                  f"{field_time - build_time:>10.4f} {astar_time / field_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import time
+
+import numpy as np
+
+from pathfinding import BatchPlanner, scripts
+from pathfinding.heuristic_fields import GoalDistanceCache
+
+guideline_script = scripts.guideline
+
+# Ukuran peta (sisi) dan jumlah agen yang menuju satu goal (dock)
+GRID_SIZES = [64, 128, 256]
+AGENTS = 16
+OBSTACLE_DENSITY = 0.2
+
+
+def make_batch(size, seed=0):
+    """Peta acak dan AGENTS grid bertanda start berbeda dengan goal yang sama"""
+    rng = np.random.default_rng(seed)
+    grid = (rng.random((size, size)) < OBSTACLE_DENSITY).astype(int)
+    goal = (size - 1, size - 1)
+    grid[goal] = 3
+    free = np.argwhere(grid == 0)
+    grids = []
+    for row, col in free[rng.choice(len(free), AGENTS, replace=False)]:
+        marked = grid.copy()
+        marked[row, col] = 2
+        grids.append(marked)
+    return grids
+
+
+def run_batch(grids, **options):
+    start_time = time.perf_counter()
+    found = sum(guideline_script.a_star_with_guideline(grid, **options) is not None for grid in grids)
+    return time.perf_counter() - start_time, found
+
+
+def run_engine(grids, **options):
+    """Batch yang sama lewat GuidelineAStarPathfinder (BatchPlanner.find_paths)"""
+    grid = np.where(grids[0] == 2, 0, grids[0])
+    pairs = [[*np.argwhere(marked == 2)[0], *np.argwhere(marked == 3)[0]] for marked in grids]
+    planner = BatchPlanner(grid, "guideline")
+    start_time = time.perf_counter()
+    found = int(planner.find_paths(pairs, **options).found.sum())
+    return time.perf_counter() - start_time, found
+
+
+def main():
+    print(f"{'size':>6} {'heuristic':>22} {'time (s)':>10} {'found':>6} {'speedup':>8}")
+    for size in GRID_SIZES:
+        grids = make_batch(size)
+        cache = GoalDistanceCache()
+        runs = [
+            ("per neighbor", run_batch, {}),
+            ("field per query", run_batch, {"precompute": True}),
+            ("field + goal cache", run_batch, {"field_cache": cache}),
+            ("engine per neighbor", run_engine, {}),
+            ("engine + goal cache", run_engine, {"field_cache": GoalDistanceCache()}),
+        ]
+        baseline = None
+        for name, run, options in runs:
+            elapsed, found = run(grids, **options)
+            baseline = baseline or elapsed
+            print(f"{size:>6} {name:>22} {elapsed:>10.3f} {found:>6} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import math
+import sys
+import time
+
+import numpy as np
+
+from pathfinding.astar_engine import ArrayAStarPathfinder
+from pathfinding.hpa import HierarchicalPathfinder
+from pathfinding.tracing import NODE_EXPANDED, EventCounter, Tracer
+from perhitungan import AStarPathfinder
+
+# Ukuran peta (sisi) yang diuji; ukuran tambahan bisa diberikan lewat argv
+GRID_SIZES = [128, 256, 512, 1024]
+CLUSTER_SIZE = 16
+QUERY_COUNT = 5
+# AStarPathfinder berbasis dict lambat pada peta besar, batasi ukurannya
+DICT_ASTAR_MAX_SIZE = 512
+
+
+def make_open_map(size, seed=0):
+    """Peta terbuka: obstacle acak 15% dan beberapa dinding panjang dengan celah"""
+    rng = np.random.default_rng(seed)
+    grid = (rng.random((size, size)) < 0.15).astype(int)
+    for row in range(size // 8, size, size // 4):
+        grid[row, :] = 1
+        for gap in rng.choice(size, size=max(2, size // 64), replace=False):
+            grid[row, gap:gap + 3] = 0
+    grid[:2, :2] = 0
+    grid[-2:, -2:] = 0
+    return grid
+
+
+def make_queries(grid, count, seed=1):
+    """Pasangan start/goal acak yang berjauhan (di sisi peta yang berlawanan)"""
+    rng = np.random.default_rng(seed)
+    size = grid.shape[0]
+    free = np.argwhere(grid != 1)
+    top = free[free[:, 0] < size // 8]
+    bottom = free[free[:, 0] >= size - size // 8]
+    return [(tuple(map(int, top[rng.integers(len(top))])), tuple(map(int, bottom[rng.integers(len(bottom))])))
+            for _ in range(count)]
+
+
+def path_cost(path):
+    return sum(math.dist(a, b) for a, b in zip(path, path[1:]))
+
+
+def with_endpoints(grid, start, goal):
+    """AStarPathfinder membaca start/goal dari sel 2 dan 3"""
+    marked = grid.copy()
+    marked[start] = 2
+    marked[goal] = 3
+    return marked
+
+
+def run(find_path):
+    counter = EventCounter()
+    start_time = time.perf_counter()
+    path = find_path(Tracer(counter))
+    elapsed = time.perf_counter() - start_time
+    return elapsed, counter.counts[NODE_EXPANDED], path_cost(path)
+
+
+def main():
+    sizes = GRID_SIZES + [int(size) for size in sys.argv[1:]]
+    print(f"{'size':>6} {'engine':>10} {'build (s)':>10} {'query (ms)':>11} {'expanded':>10} {'cost':>10} {'vs A*':>7}")
+    for size in sizes:
+        grid = make_open_map(size)
+        queries = make_queries(grid, QUERY_COUNT)
+
+        start_time = time.perf_counter()
+        hpa = HierarchicalPathfinder(grid, CLUSTER_SIZE)
+        build_time = time.perf_counter() - start_time
+
+        array_astar = ArrayAStarPathfinder(grid)
+        results = {"A*": [], "array A*": [], "HPA*": []}
+        for start, goal in queries:
+            if size <= DICT_ASTAR_MAX_SIZE:
+                pathfinder = AStarPathfinder(with_endpoints(grid, start, goal))
+                results["A*"].append(run(lambda tracer: pathfinder.find_path(tracer=tracer)))
+            results["array A*"].append(run(lambda tracer: array_astar.find_path(start, goal, tracer=tracer)))
+            results["HPA*"].append(run(lambda tracer: hpa.find_path(start, goal, tracer=tracer)))
+
+        optimal = np.mean([cost for _, _, cost in results["array A*"]])
+        for engine, runs in results.items():
+            if not runs:
+                continue
+            elapsed, expanded, cost = (np.mean(values) for values in zip(*runs))
+            build = f"{build_time:>10.2f}" if engine == "HPA*" else f"{'':>10}"
+            print(f"{size:>6} {engine:>10} {build} {elapsed * 1000:>11.1f} {expanded:>10.0f} {cost:>10.1f} {cost / optimal:>6.3f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+# Nama target -> kode impor yang diukur dalam interpreter baru
+TARGETS = {
+    "numpy": "import numpy",
+    "pathfinding": "import pathfinding",
+    "scripts.astar": "from pathfinding import scripts; scripts.astar",
+    "scripts.barrier": "from pathfinding import scripts; scripts.barrier",
+    "scripts.guideline": "from pathfinding import scripts; scripts.guideline",
+    "scripts.bidirectional": "from pathfinding import scripts; scripts.bidirectional",
+    "scripts.animasi": "from pathfinding import scripts; scripts.animasi",
+    "pygame": "import pygame",
+}
+# Target yang tidak boleh memuat pygame (worker headless)
+HEADLESS_TARGETS = [name for name in TARGETS if name != "pygame"]
+
+PROBE = """
+import sys, time
+begin = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - begin
+print(elapsed, "pygame" in sys.modules)
+"""
+
+
+def measure(code, repeat):
+    """(median detik, pygame ikut dimuat?) dari repeat interpreter baru"""
+    times = []
+    loaded_pygame = False
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(code=code)],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+            env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"},
+        )
+        elapsed, pygame_loaded = result.stdout.split()
+        times.append(float(elapsed))
+        loaded_pygame = loaded_pygame or pygame_loaded == "True"
+    return statistics.median(times), loaded_pygame
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Waktu impor paket dan skrip pada interpreter baru")
+    parser.add_argument("--targets", nargs="+", default=list(TARGETS), choices=list(TARGETS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="gagal (exit 1) jika target headless mana pun lebih lambat dari ini")
+    parser.add_argument("--output", help="file JSON untuk melacak hasil antar revisi")
+    args = parser.parse_args()
+
+    print(f"{'target':>22} {'import (ms)':>12} {'pygame':>7}")
+    results = []
+    failed = False
+    for name in args.targets:
+        elapsed, loaded_pygame = measure(TARGETS[name], args.repeat)
+        results.append({"target": name, "import_ms": elapsed * 1000, "pygame_loaded": loaded_pygame})
+        print(f"{name:>22} {elapsed * 1000:>12.1f} {'ya' if loaded_pygame else '-':>7}")
+        if name in HEADLESS_TARGETS:
+            if loaded_pygame:
+                print(f"  {name} memuat pygame saat di-import")
+                failed = True
+            if args.max_ms is not None and elapsed * 1000 > args.max_ms:
+                print(f"  {name} lebih lambat dari {args.max_ms:g} ms")
+                failed = True
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"python": sys.version.split()[0], "repeat": args.repeat, "results": results}, file, indent=2)
+        print(f"\nHasil disimpan ke {args.output}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
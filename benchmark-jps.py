@@ -0,0 +1,61 @@
+import math
+import time
+
+import numpy as np
+
+from pathfinding.astar_engine import ArrayAStarPathfinder
+from pathfinding.jps import JumpPointPathfinder
+from pathfinding.tracing import NODE_EXPANDED, NODE_OPENED, EventCounter, Tracer
+from perhitungan import AStarPathfinder
+
+# Ukuran peta gudang (sisi) yang diuji
+GRID_SIZES = [64, 128, 256, 512]
+# AStarPathfinder berbasis dict lambat pada peta besar, batasi ukurannya
+DICT_ASTAR_MAX_SIZE = 256
+
+
+def make_warehouse(size, seed=0):
+    """Peta gudang: rak horizontal dengan lorong dan celah acak"""
+    rng = np.random.default_rng(seed)
+    grid = np.zeros((size, size), dtype=int)
+    for row in range(4, size - 4, 4):
+        grid[row, 2:size - 2] = 1
+        for gap in rng.choice(np.arange(4, size - 4), size=max(1, size // 32), replace=False):
+            grid[row, gap:gap + 2] = 0
+    grid[0, 0] = 2
+    grid[size - 1, size - 1] = 3
+    return grid
+
+
+def path_cost(path):
+    return sum(math.dist(a, b) for a, b in zip(path, path[1:]))
+
+
+def run(name, grid, find_path):
+    counter = EventCounter()
+    start_time = time.perf_counter()
+    path = find_path(Tracer(counter))
+    elapsed = time.perf_counter() - start_time
+    cost = path_cost(path) if path else float("nan")
+    return name, elapsed, counter.counts[NODE_EXPANDED], counter.counts[NODE_OPENED], cost
+
+
+def main():
+    print(f"{'size':>6} {'engine':>12} {'time (s)':>10} {'expanded':>10} {'pushed':>10} {'cost':>10}")
+    for size in GRID_SIZES:
+        grid = make_warehouse(size)
+        runs = []
+        if size <= DICT_ASTAR_MAX_SIZE:
+            runs.append(("find_path", lambda tracer: AStarPathfinder(grid).find_path(tracer=tracer)))
+        runs.append(("array A*", lambda tracer: ArrayAStarPathfinder(grid).find_path(tracer=tracer)))
+        runs.append(("JPS", lambda tracer: JumpPointPathfinder(grid).find_path(tracer=tracer)))
+        jps_plus = JumpPointPathfinder(grid, precompute=True)  # Prapemrosesan di luar waktu query
+        runs.append(("JPS+", lambda tracer: jps_plus.find_path(tracer=tracer)))
+
+        for name, find_path in runs:
+            name, elapsed, expanded, pushed, cost = run(name, grid, find_path)
+            print(f"{size:>6} {name:>12} {elapsed:>10.3f} {expanded:>10} {pushed:>10} {cost:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
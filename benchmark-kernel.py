@@ -0,0 +1,107 @@
+import time
+
+import numpy as np
+
+from pathfinding import scripts
+
+from pathfinding.astar_engine import ArrayAStarPathfinder
+from pathfinding.barrier_astar import BarrierAStarPathfinder
+from pathfinding.bidirectional import BidirectionalAStarPathfinder
+from pathfinding.guideline_astar import GuidelineAStarPathfinder
+from pathfinding.search_stats import SearchStats
+from perhitungan import AStarPathfinder
+
+
+barrier_script = scripts.barrier
+guideline_script = scripts.guideline
+bidirectional_script = scripts.bidirectional
+
+# Ukuran peta (sisi) yang diuji
+GRID_SIZES = [128, 256, 512]
+OBSTACLE_DENSITY = 0.2
+REPEAT = 3
+
+
+def make_random(size, seed=0):
+    rng = np.random.default_rng(seed)
+    grid = (rng.random((size, size)) < OBSTACLE_DENSITY).astype(int)
+    grid[:2, :2] = 0
+    grid[-2:, -2:] = 0
+    return grid
+
+
+def with_endpoints(grid, start, goal):
+    """Skrip perhitungan membaca start/goal dari sel 2 dan 3"""
+    marked = grid.copy()
+    marked[start] = 2
+    marked[goal] = 3
+    return marked
+
+
+def variants(grid, start, goal):
+    """
+    varian -> [(implementasi, fungsi(stats) -> path)]; engine dibangun di
+    luar pengukuran. "array" adalah engine default (loop NumPy), "kernel"
+    engine yang sama dengan ExpansionKernel (kernel=True).
+    """
+    marked = with_endpoints(grid, start, goal)
+    engine_classes = {
+        "astar": ArrayAStarPathfinder,
+        "guideline": GuidelineAStarPathfinder,
+        "barrier": BarrierAStarPathfinder,
+        "bidirectional": BidirectionalAStarPathfinder,
+    }
+    engines = {}
+    for variant, engine_class in engine_classes.items():
+        engines[f"array {variant}"] = engine_class(grid)
+        engines[f"kernel {variant}"] = engine_class(grid, kernel=True)
+    barrier_index = engines["kernel barrier"].barrier_index
+    script_astar = AStarPathfinder(marked)
+    script_runs = {
+        "astar": lambda stats: script_astar.find_path(stats=stats),
+        "guideline": lambda stats: guideline_script.a_star_with_guideline(marked, stats=stats),
+        "barrier": lambda stats: barrier_script.a_star_search(marked, barrier_index=barrier_index, stats=stats),
+        "bidirectional": lambda stats: bidirectional_script.bidirectional_a_star(marked, stats=stats),
+    }
+
+    def engine(name):
+        return name, lambda stats: engines[name].find_path(start, goal, stats=stats)
+
+    return {
+        variant: [("script", script_run), engine(f"array {variant}"), engine(f"kernel {variant}")]
+        for variant, script_run in script_runs.items()
+    }
+
+
+def run(find_path):
+    """(waktu terbaik, node expanded); expanded dihitung pada jalannya terpisah"""
+    elapsed = min(_timed(find_path) for _ in range(REPEAT))
+    stats = SearchStats()
+    find_path(stats)
+    return elapsed, stats.expanded
+
+
+def _timed(find_path):
+    start_time = time.perf_counter()
+    find_path(None)
+    return time.perf_counter() - start_time
+
+
+def main():
+    print(f"{'size':>6} {'variant':>14} {'implementation':>22} {'time (s)':>10} {'expanded':>10} "
+          f"{'expanded/s':>12} {'vs script':>10}")
+    for size in GRID_SIZES:
+        grid = make_random(size)
+        start, goal = (0, 0), (size - 1, size - 1)
+        for variant, runs in variants(grid, start, goal).items():
+            script_rate = None
+            for name, find_path in runs:
+                elapsed, expanded = run(find_path)
+                rate = expanded / elapsed
+                script_rate = script_rate or rate
+                print(f"{size:>6} {variant:>14} {name:>22} {elapsed:>10.3f} {expanded:>10} "
+                      f"{rate:>12.0f} {rate / script_rate:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
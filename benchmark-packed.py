@@ -0,0 +1,98 @@
+import time
+import tracemalloc
+
+import numpy as np
+
+from pathfinding.astar_engine import ArrayAStarPathfinder
+from pathfinding.jps import JumpPointPathfinder
+from pathfinding.packed_grid import PackedGrid
+from pathfinding.tracing import NODE_EXPANDED, EventCounter, Tracer
+
+# Ukuran peta (sisi) yang diuji
+GRID_SIZES = [256, 512, 1024]
+OBSTACLE_DENSITY = 0.2
+
+
+def make_random(size, seed=0):
+    rng = np.random.default_rng(seed)
+    grid = np.array((rng.random((size, size)) < OBSTACLE_DENSITY).astype(int))  # int64 seperti skrip
+    grid[:2, :2] = 0
+    grid[-2:, -2:] = 0
+    return grid
+
+
+def make_warehouse(size, seed=0):
+    """Peta gudang: rak horizontal dengan lorong dan celah acak"""
+    rng = np.random.default_rng(seed)
+    grid = np.zeros((size, size), dtype=int)
+    for row in range(4, size - 4, 4):
+        grid[row, 2:size - 2] = 1
+        for gap in rng.choice(np.arange(4, size - 4), size=max(1, size // 32), replace=False):
+            grid[row, gap:gap + 2] = 0
+    return grid
+
+
+def make_open(size):
+    """Peta terbuka dengan satu dinding panjang"""
+    grid = np.zeros((size, size), dtype=int)
+    grid[size // 3, :size - 5] = 1
+    return grid
+
+
+MAP_FAMILIES = {
+    "random-20%": make_random,
+    "warehouse": make_warehouse,
+    "open": make_open,
+}
+
+
+def allocated(build):
+    """Memori (byte) yang dialokasikan oleh build()"""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def run(pathfinder, start, goal):
+    counter = EventCounter()
+    start_time = time.perf_counter()
+    pathfinder.find_path(start, goal, tracer=Tracer(counter))
+    elapsed = time.perf_counter() - start_time
+    return elapsed, counter.counts[NODE_EXPANDED]
+
+
+def compare_speed(family, grid):
+    size = grid.shape[0]
+    start, goal = (0, 0), (size - 1, size - 1)
+    runs = [
+        ("A* bool", ArrayAStarPathfinder(grid)),
+        ("A* packed", ArrayAStarPathfinder(grid, packed=True)),
+        ("JPS bytearray", JumpPointPathfinder(grid)),
+        ("JPS packed", JumpPointPathfinder(grid, packed=True)),
+    ]
+    for name, pathfinder in runs:
+        elapsed, expanded = run(pathfinder, start, goal)
+        print(f"{family:>11} {size:>6} {name:>16} {elapsed:>10.3f} {expanded:>10} {expanded / elapsed:>12.0f}")
+
+
+def main():
+    print(f"{'size':>6} {'representation':>16} {'bytes':>12} {'bytes/cell':>11}")
+    for size in GRID_SIZES:
+        grid = make_random(size)
+        cells = grid.size
+        _, bool_bytes = allocated(lambda: grid != 1)
+        _, packed_bytes = allocated(lambda: PackedGrid(grid))
+        for name, nbytes in (("int64 grid", grid.nbytes), ("bool mask", bool_bytes), ("PackedGrid", packed_bytes)):
+            print(f"{size:>6} {name:>16} {nbytes:>12} {nbytes / cells:>11.3f}")
+
+    print()
+    print(f"{'map':>11} {'size':>6} {'engine':>16} {'time (s)':>10} {'expanded':>10} {'expanded/s':>12}")
+    for family, make_map in MAP_FAMILIES.items():
+        for size in GRID_SIZES:
+            compare_speed(family, make_map(size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+from pathfinding.batch import BatchPlanner
+from pathfinding.parallel import ParallelPlanner
+
+# Ukuran peta, jumlah query dan varian yang diuji
+GRID_SIZE = 256
+QUERY_COUNT = 400
+VARIANTS = ["astar", "barrier"]
+
+
+def make_random(size, density=0.25, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.random((size, size)) < density).astype(np.int8)
+
+
+def make_pairs(grid, count, seed=1):
+    """Pasangan (start, goal) acak pada sel bebas"""
+    rng = np.random.default_rng(seed)
+    free = np.flatnonzero(grid.ravel() != 1)
+    cells = rng.choice(free, size=(count, 2))
+    rows, cols = np.divmod(cells, grid.shape[1])
+    return np.stack([rows[:, 0], cols[:, 0], rows[:, 1], cols[:, 1]], axis=1)
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    grid = make_random(GRID_SIZE)
+    pairs = make_pairs(grid, QUERY_COUNT)
+    print(f"{GRID_SIZE}x{GRID_SIZE}, {QUERY_COUNT} queries, {os.cpu_count()} CPU")
+    print(f"{'variant':>10} {'workers':>8} {'time (s)':>10} {'queries/s':>10} {'speedup':>8} {'efficiency':>11}")
+    for variant in VARIANTS:
+        start_time = time.perf_counter()
+        serial = BatchPlanner(grid, variant).find_paths(pairs)
+        serial_time = time.perf_counter() - start_time
+        print(f"{variant:>10} {'serial':>8} {serial_time:>10.3f} {QUERY_COUNT / serial_time:>10.1f} {1.0:>7.2f}x {'':>11}")
+
+        for workers in range(1, max_workers + 1):
+            with ParallelPlanner(grid, variant, workers=workers) as planner:
+                start_time = time.perf_counter()  # Termasuk start worker dan prapemrosesan per worker
+                packed = planner.find_paths(pairs)
+                elapsed = time.perf_counter() - start_time
+            assert np.allclose(packed.costs, serial.costs)
+            speedup = serial_time / elapsed
+            print(f"{variant:>10} {workers:>8} {elapsed:>10.3f} {QUERY_COUNT / elapsed:>10.1f} "
+                  f"{speedup:>7.2f}x {speedup / workers:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
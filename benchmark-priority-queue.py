@@ -0,0 +1,101 @@
+import heapq
+import math
+import time
+
+import numpy as np
+
+from pathfinding.priority_queue import PriorityQueue
+
+# Ukuran grid (sisi) yang diuji dan kepadatan obstacle acak
+GRID_SIZES = [32, 64, 128, 256, 512]
+OBSTACLE_DENSITY = 0.2
+# Open list lama bersifat kuadratik, batasi ukuran yang dijalankan
+LINEAR_SCAN_MAX_SIZE = 256
+
+neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+
+class LinearScanOpenList:
+    """Open list lama: heapq + pemeriksaan keanggotaan dengan scan linear"""
+
+    def __init__(self):
+        self.heap = []
+
+    def __bool__(self):
+        return bool(self.heap)
+
+    def __contains__(self, item):
+        return any(item == entry[1] for entry in self.heap)
+
+    def push(self, item, priority):
+        if item not in self:
+            heapq.heappush(self.heap, (priority, item))
+
+    def pop(self):
+        return heapq.heappop(self.heap)[1]
+
+
+def euclidean_distance(node1, node2):
+    return math.sqrt((node1[0] - node2[0]) ** 2 + (node1[1] - node2[1]) ** 2)
+
+
+def make_grid(size, seed=0):
+    rng = np.random.default_rng(seed)
+    grid = (rng.random((size, size)) < OBSTACLE_DENSITY).astype(int)
+    grid[0, 0] = 2
+    grid[size - 1, size - 1] = 3
+    return grid
+
+
+def a_star_expansions(grid, open_list):
+    """A* sederhana yang mengembalikan jumlah node yang di-expand"""
+    rows, cols = grid.shape
+    start, goal = (0, 0), (rows - 1, cols - 1)
+    open_list.push(start, 0)
+    g_score = {start: 0}
+    closed_list = set()
+    expanded = 0
+
+    while open_list:
+        current = open_list.pop()
+        if current in closed_list:
+            continue
+        closed_list.add(current)
+        expanded += 1
+        if current == goal:
+            break
+
+        for offset in neighbors:
+            neighbor = (current[0] + offset[0], current[1] + offset[1])
+            if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and grid[neighbor] != 1:
+                if neighbor in closed_list:
+                    continue
+                tentative_g_score = g_score[current] + (math.sqrt(2) if offset[0] != 0 and offset[1] != 0 else 1)
+                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+                    g_score[neighbor] = tentative_g_score
+                    open_list.push(neighbor, tentative_g_score + euclidean_distance(neighbor, goal))
+
+    return expanded
+
+
+def measure(grid, open_list_class):
+    start_time = time.perf_counter()
+    expanded = a_star_expansions(grid, open_list_class())
+    elapsed = time.perf_counter() - start_time
+    return expanded, elapsed
+
+
+def main():
+    print(f"{'size':>6} {'open list':>12} {'expanded':>10} {'time (s)':>10} {'exp/s':>12}")
+    for size in GRID_SIZES:
+        grid = make_grid(size)
+        for name, open_list_class in (("linear-scan", LinearScanOpenList), ("indexed", PriorityQueue)):
+            if open_list_class is LinearScanOpenList and size > LINEAR_SCAN_MAX_SIZE:
+                print(f"{size:>6} {name:>12} {'-':>10} {'-':>10} {'skipped':>12}")
+                continue
+            expanded, elapsed = measure(grid, open_list_class)
+            print(f"{size:>6} {name:>12} {expanded:>10} {elapsed:>10.3f} {expanded / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
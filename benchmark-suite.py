@@ -0,0 +1,282 @@
+import argparse
+import csv
+import json
+import math
+import platform
+import subprocess
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from pathfinding import scripts
+from pathfinding.astar_engine import ArrayAStarPathfinder
+from pathfinding.barrier_astar import BarrierAStarPathfinder
+from pathfinding.bidirectional import BidirectionalAStarPathfinder
+from pathfinding.guideline_astar import GuidelineAStarPathfinder
+from pathfinding.jps import JumpPointPathfinder
+from pathfinding.tracing import NODE_EXPANDED, EventCounter, Tracer
+
+ROOT = Path(__file__).resolve().parent
+
+# Ukuran peta (sisi) bawaan; --sizes menerima 64 sampai 4096
+GRID_SIZES = [64, 128, 256, 512]
+MAP_SEED = 2024
+RANDOM_DENSITY = 0.25
+# Varian skrip berbasis dict lambat dan boros memori pada peta besar
+SCRIPT_MAX_SIZE = 512
+
+
+# ---------------------------------------------------------------- peta
+
+def make_random(size, rng):
+    """Obstacle acak dengan kepadatan RANDOM_DENSITY"""
+    return (rng.random((size, size)) < RANDOM_DENSITY).astype(int)
+
+
+def make_maze(size, rng):
+    """
+    Labirin binary-tree: sel di koordinat genap, dinding di koordinat
+    ganjil. Setiap sel membuka jalan ke utara atau ke barat secara acak
+    (seluruhnya vektor), sehingga setiap sel terhubung ke pojok kiri atas.
+    """
+    grid = np.ones((size, size), dtype=int)
+    cells = grid[0::2, 0::2]
+    cells[:] = 0
+    rows, cols = cells.shape
+    north = rng.random((rows, cols)) < 0.5
+    north[0, :] = False   # Baris pertama hanya bisa ke barat
+    north[:, 0] = True    # Kolom pertama hanya bisa ke utara
+    north[0, 0] = False
+    cell_rows, cell_cols = np.nonzero(north)
+    grid[2 * cell_rows - 1, 2 * cell_cols] = 0
+    cell_rows, cell_cols = np.nonzero(~north)
+    west = cell_cols > 0
+    grid[2 * cell_rows[west], 2 * cell_cols[west] - 1] = 0
+    return grid
+
+
+def make_rooms(size, rng, room_size=16):
+    """Ruangan persegi dengan dinding tebal 1 dan satu pintu acak di setiap dinding"""
+    grid = np.zeros((size, size), dtype=int)
+    walls = np.arange(room_size, size, room_size)
+    grid[walls, :] = 1
+    grid[:, walls] = 1
+    door = max(2, room_size // 8)
+    for wall in walls:
+        for begin in range(0, size, room_size):
+            span = min(room_size, size - begin) - 1
+            if span <= door:
+                continue
+            offset = begin + int(rng.integers(1, span - door + 1))
+            grid[wall, offset:offset + door] = 0   # Pintu pada dinding horizontal
+            offset = begin + int(rng.integers(1, span - door + 1))
+            grid[offset:offset + door, wall] = 0   # Pintu pada dinding vertikal
+    return grid
+
+
+def make_open(size, rng):
+    """Lapangan terbuka dengan beberapa obstacle persegi kecil yang jarang"""
+    grid = np.zeros((size, size), dtype=int)
+    count = max(1, size * size // 2048)
+    tops = rng.integers(0, size, count)
+    lefts = rng.integers(0, size, count)
+    heights = rng.integers(2, 9, count)
+    widths = rng.integers(2, 9, count)
+    for top, left, height, width in zip(tops, lefts, heights, widths):
+        grid[top:top + height, left:left + width] = 1
+    return grid
+
+
+MAP_FAMILIES = {
+    "random": make_random,
+    "maze": make_maze,
+    "rooms": make_rooms,
+    "open": make_open,
+}
+
+
+def nearest_free(grid, corner):
+    """Sel bebas terdekat ke pojok peta"""
+    free = np.argwhere(grid != 1)
+    if free.size == 0:
+        return None
+    return tuple(int(v) for v in free[np.abs(free - corner).sum(axis=1).argmin()])
+
+
+def make_map(family, size, seed):
+    """Peta dan pasangan start/goal (pojok kiri atas ke kanan bawah) yang reproducible"""
+    family_index = list(MAP_FAMILIES).index(family)
+    rng = np.random.default_rng([seed, family_index, size])
+    grid = MAP_FAMILIES[family](size, rng)
+    start = nearest_free(grid, (0, 0))
+    goal = nearest_free(grid, (size - 1, size - 1))
+    return grid, start, goal
+
+
+# ------------------------------------------------------------- varian
+
+def with_endpoints(grid, start, goal):
+    """Skrip perhitungan membaca start/goal dari sel 2 dan 3"""
+    marked = grid.copy()
+    marked[start] = 2
+    marked[goal] = 3
+    return marked
+
+
+def build_variants():
+    """nama -> (fungsi(grid, start, goal, tracer) -> path, berbasis skrip?)"""
+    perhitungan = scripts.astar
+    barrier = scripts.barrier
+    guideline = scripts.guideline
+    bidirectional = scripts.bidirectional
+    return {
+        "astar-script": (lambda grid, start, goal, tracer: perhitungan.AStarPathfinder(
+            with_endpoints(grid, start, goal)).find_path(tracer=tracer), True),
+        "barrier-script": (lambda grid, start, goal, tracer: barrier.a_star_search(
+            with_endpoints(grid, start, goal), tracer=tracer), True),
+        "guideline-script": (lambda grid, start, goal, tracer: guideline.a_star_with_guideline(
+            with_endpoints(grid, start, goal), tracer=tracer), True),
+        "bidirectional-script": (lambda grid, start, goal, tracer: bidirectional.bidirectional_a_star(
+            with_endpoints(grid, start, goal), tracer=tracer), True),
+        "astar": (lambda grid, start, goal, tracer: ArrayAStarPathfinder(grid).find_path(
+            start, goal, tracer=tracer), False),
+        "barrier": (lambda grid, start, goal, tracer: BarrierAStarPathfinder(grid).find_path(
+            start, goal, tracer=tracer), False),
+        "guideline": (lambda grid, start, goal, tracer: GuidelineAStarPathfinder(grid).find_path(
+            start, goal, tracer=tracer), False),
+        "bidirectional": (lambda grid, start, goal, tracer: BidirectionalAStarPathfinder(grid).find_path(
+            start, goal, tracer=tracer), False),
+        "jps": (lambda grid, start, goal, tracer: JumpPointPathfinder(grid).find_path(
+            start, goal, tracer=tracer), False),
+    }
+
+
+# ------------------------------------------------------------- metrik
+
+def path_metrics(path):
+    """(jumlah sel, panjang geometris, jumlah belokan) dari sebuah jalur"""
+    if not path:
+        return 0, None, 0
+    steps = np.diff(np.asarray(path, dtype=np.int64).reshape(-1, 2), axis=0)
+    if len(steps) == 0:
+        return len(path), 0.0, 0
+    diagonal = np.count_nonzero(np.abs(steps).sum(axis=1) == 2)
+    cost = len(steps) - diagonal + math.sqrt(2) * diagonal
+    turns = np.count_nonzero(np.any(steps[1:] != steps[:-1], axis=1))
+    return len(path), float(cost), int(turns)
+
+
+def measure(find_path, grid, start, goal, repeat):
+    """
+    Waktu (terbaik dari repeat), node expanded, jalur, dan puncak memori.
+    Run yang diukur waktunya berjalan tanpa tracer. Jumlah expanded
+    (lewat Tracer) dan puncak memori (lewat tracemalloc) diambil dari satu
+    run terpisah, sehingga overhead keduanya tidak ikut masuk ke waktu.
+    """
+    elapsed = math.inf
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        path = find_path(grid, start, goal, None)
+        elapsed = min(elapsed, time.perf_counter() - start_time)
+
+    counter = EventCounter()
+    tracemalloc.start()
+    find_path(grid, start, goal, Tracer(counter))
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, counter.counts[NODE_EXPANDED], path, peak_bytes
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(variants, families, sizes, variant_names, seed, repeat, script_max_size):
+    results = []
+    for family in families:
+        for size in sizes:
+            grid, start, goal = make_map(family, size, seed)
+            for name in variant_names:
+                find_path, is_script = variants[name]
+                if is_script and size > script_max_size:
+                    continue
+                elapsed, expanded, path, peak_bytes = measure(find_path, grid, start, goal, repeat)
+                cells, cost, turns = path_metrics(path)
+                result = {
+                    "family": family,
+                    "size": size,
+                    "variant": name,
+                    "found": bool(path),
+                    "time_s": elapsed,
+                    "expanded": expanded,
+                    "expanded_per_s": expanded / elapsed if elapsed > 0 else None,
+                    "peak_memory_bytes": peak_bytes,
+                    "path_cells": cells,
+                    "path_cost": cost,
+                    "turns": turns,
+                }
+                results.append(result)
+                cost_text = f"{cost:>9.2f}" if path else f"{'-':>9}"
+                print(f"{family:>7} {size:>5} {name:>21} {elapsed:>9.3f} {expanded:>9} "
+                      f"{peak_bytes / 2**20:>9.1f} {cells:>7} {cost_text} {turns:>6}")
+    return results
+
+
+def write_results(results, metadata, output):
+    """Menulis output.csv (satu baris per run) dan output.json (metadata + hasil)"""
+    output = Path(output)
+    with open(output.with_suffix(".csv"), "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(results[0]) if results else ["family"])
+        writer.writeheader()
+        writer.writerows(results)
+    with open(output.with_suffix(".json"), "w") as file:
+        json.dump({"metadata": metadata, "results": results}, file, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark semua varian pencarian pada keluarga peta seeded")
+    parser.add_argument("--families", nargs="+", default=list(MAP_FAMILIES), choices=list(MAP_FAMILIES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=GRID_SIZES)
+    parser.add_argument("--variants", nargs="+", default=None,
+                        help="nama varian (bawaan: semua)")
+    parser.add_argument("--seed", type=int, default=MAP_SEED)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--script-max-size", type=int, default=SCRIPT_MAX_SIZE)
+    parser.add_argument("--output", default="benchmark-results",
+                        help="prefix file; menghasilkan <prefix>.csv dan <prefix>.json")
+    args = parser.parse_args()
+
+    variants = build_variants()
+    variant_names = args.variants or list(variants)
+    unknown = sorted(set(variant_names) - set(variants))
+    if unknown:
+        parser.error(f"unknown variant(s) {unknown}, expected one of {list(variants)}")
+    metadata = {
+        "seed": args.seed,
+        "sizes": args.sizes,
+        "families": args.families,
+        "variants": variant_names,
+        "repeat": args.repeat,
+        "random_density": RANDOM_DENSITY,
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+    }
+
+    print(f"{'map':>7} {'size':>5} {'variant':>21} {'time (s)':>9} {'expanded':>9} "
+          f"{'peak MiB':>9} {'cells':>7} {'cost':>9} {'turns':>6}")
+    results = run_suite(variants, args.families, args.sizes, variant_names, args.seed, args.repeat, args.script_max_size)
+    write_results(results, metadata, args.output)
+    print(f"\nHasil disimpan ke {args.output}.csv dan {args.output}.json")
+
+
+if __name__ == "__main__":
+    main()
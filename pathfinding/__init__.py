@@ -0,0 +1,79 @@
+"""
+Paket mesin pencarian jalur untuk grid 8-arah.
+
+Format grid sama dengan skrip perhitungan*.py:
+    0 = Free space
+    1 = Obstacle/Wall
+    2 = Start point
+    3 = Goal/Target
+"""
+
+from .astar_engine import ArrayAStarPathfinder
+from .barrier_astar import BarrierAStarPathfinder
+from .barrier_index import BarrierIndex
+from .batch import BatchPlanner, PackedPaths, find_paths
+from .bidirectional import BidirectionalAStarPathfinder
+from .clearance import ClearanceMap, chamfer_distance
+from .distance_field import DistanceField, DistanceFieldPlanner, build_distance_field
+from .dstar_lite import DStarLitePlanner
+from .grid_map import GridMap
+from .guideline_astar import GuidelineAStarPathfinder
+from .heuristic_fields import GoalDistanceCache, goal_distance_field, guideline_field
+from .hpa import HierarchicalPathfinder
+from .jps import JumpPointPathfinder
+from .kernel import ExpansionKernel
+from .map_format import MapFile, load_map, save_map
+from .packed_grid import PackedGrid
+from .parallel import ParallelPlanner
+from .path_cache import CachedPlanner, PathCache
+from .polyline import PathSmoother, SmoothingResult, smooth_path
+from .priority_queue import PriorityQueue
+from .recording import TraceRecorder, expansion_heatmap, load_recording, record_search, render_frames, save_recording
+from .search_stats import SearchStats
+from .tracing import BinaryTraceWriter, NdjsonTraceWriter, Tracer, read_binary_trace
+
+__all__ = [
+    "ArrayAStarPathfinder",
+    "BarrierAStarPathfinder",
+    "BarrierIndex",
+    "BatchPlanner",
+    "BidirectionalAStarPathfinder",
+    "CachedPlanner",
+    "BinaryTraceWriter",
+    "ClearanceMap",
+    "DStarLitePlanner",
+    "DistanceField",
+    "DistanceFieldPlanner",
+    "ExpansionKernel",
+    "GoalDistanceCache",
+    "GridMap",
+    "GuidelineAStarPathfinder",
+    "HierarchicalPathfinder",
+    "JumpPointPathfinder",
+    "MapFile",
+    "NdjsonTraceWriter",
+    "PackedGrid",
+    "PackedPaths",
+    "ParallelPlanner",
+    "PathCache",
+    "PathSmoother",
+    "PriorityQueue",
+    "SearchStats",
+    "SmoothingResult",
+    "TraceRecorder",
+    "Tracer",
+    "build_distance_field",
+    "chamfer_distance",
+    "expansion_heatmap",
+    "find_paths",
+    "goal_distance_field",
+    "guideline_field",
+    "load_map",
+    "load_recording",
+    "read_binary_trace",
+    "record_search",
+    "render_frames",
+    "save_map",
+    "save_recording",
+    "smooth_path",
+]
@@ -0,0 +1,249 @@
+import time
+
+import numpy as np
+
+# Kecepatan animasi (event per detik) yang bisa dipilih dengan tombol atas/bawah
+MIN_SPEED = 0.5
+MAX_SPEED = 1_000_000
+# Di atas jumlah sel kotor ini satu frame di-present dengan flip, bukan daftar rect
+MAX_DIRTY_RECTS = 1024
+
+
+class StepPlayer:
+    def __init__(self, steps, events_per_second=5.0, fps=60):
+        """
+        Pemutar event dari generator pencarian (mis. a_star_steps pada
+        animasi*.py). Generator menghasilkan (state, node) untuk setiap
+        event dan mengembalikan jalur lewat return; pencarian tidak lagi
+        tidur di dalam loop-nya.
+
+        Setiap frame, advance(dt) mengambil sejumlah event sesuai
+        kecepatan (events_per_second dikali waktu frame), sehingga banyak
+        event digabung dalam satu frame. Dalam mode fast-forward event
+        diambil sampai anggaran waktu frame habis, jadi pencarian berjalan
+        secepat mungkin sambil jendela tetap responsif.
+        """
+        self.steps = steps
+        self.events_per_second = events_per_second
+        self.frame_budget = 0.8 / fps  # Sisa frame dipakai untuk menggambar
+        self.paused = False
+        self.fast_forward = False
+        self.finished = False
+        self.result = None
+        self._credit = 0.0  # Pecahan event yang belum diambil
+
+    def take(self, count):
+        """Mengambil paling banyak count event berikutnya"""
+        events = []
+        steps = self.steps
+        try:
+            for _ in range(count):
+                events.append(next(steps))
+        except StopIteration as stop:
+            self.finished = True
+            self.result = stop.value
+        return events
+
+    def advance(self, dt):
+        """Event untuk satu frame yang berdurasi dt detik"""
+        if self.finished or self.paused:
+            return []
+        if self.fast_forward:
+            events = []
+            deadline = time.perf_counter() + self.frame_budget
+            while not self.finished and time.perf_counter() < deadline:
+                events.extend(self.take(256))
+            return events
+        self._credit += dt * self.events_per_second
+        count = int(self._credit)
+        self._credit -= count
+        return self.take(count)
+
+    def step(self):
+        """Satu event (untuk maju per langkah saat pause)"""
+        return [] if self.finished else self.take(1)
+
+    def faster(self, factor=2.0):
+        self.events_per_second = min(self.events_per_second * factor, MAX_SPEED)
+
+    def slower(self, factor=2.0):
+        self.events_per_second = max(self.events_per_second / factor, MIN_SPEED)
+
+    def status(self):
+        if self.finished:
+            return "selesai"
+        if self.paused:
+            return "pause"
+        if self.fast_forward:
+            return "fast-forward"
+        return f"{self.events_per_second:g} event/s"
+
+
+class GridRenderer:
+    def __init__(self, screen, grid, tile_width, tile_height, cell_colors, state_colors, line_color):
+        """
+        Renderer inkremental untuk animasi grid: hanya sel yang berubah yang
+        digambar ulang, lalu present() mengembalikan dirty rect untuk
+        pygame.display.update. Biaya per event konstan, tidak bergantung
+        pada ukuran peta atau jumlah event sebelumnya; frame dengan lebih
+        dari MAX_DIRTY_RECTS sel berubah (mis. fast-forward) tetap hanya
+        menggambar sel itu dan menampilkannya dengan satu flip.
+
+        cell_colors: warna per nilai grid (0 bebas, 1 obstacle, 2 start, 3 goal)
+        state_colors: [(state, warna), ...] dengan urutan gambar seperti
+            draw_grid lama: state yang lebih akhir menimpa state sebelumnya
+            (mis. close menimpa open, path menimpa semuanya).
+        Status tampil setiap sel disimpan di array uint8 (0 = warna grid,
+        i = state_colors[i - 1]), bukan di list node yang terus bertambah.
+        """
+        self.screen = screen
+        self.grid = np.asarray(grid)
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self.cell_colors = cell_colors
+        self.line_color = line_color
+        self.ranks = {state: rank for rank, (state, _) in enumerate(state_colors, 1)}
+        self.colors = [None] + [color for _, color in state_colors]
+        self.states = np.zeros(self.grid.shape, dtype=np.uint8)
+        self._dirty = []
+        self._full = True  # Frame pertama menggambar seluruh grid
+
+    def mark(self, node, state):
+        """Memberi node status state; diabaikan jika status tampilnya lebih tinggi"""
+        rank = self.ranks[state]
+        row, col = int(node[0]), int(node[1])
+        if rank <= self.states[row, col]:
+            return
+        self.states[row, col] = rank
+        if not self._full:
+            rect = self._paint(row, col, self.colors[rank])
+            if self._dirty is not None:
+                self._dirty.append(rect)
+                if len(self._dirty) > MAX_DIRTY_RECTS:
+                    self._dirty = None  # Sel tetap digambar satu per satu, present() cukup flip
+
+    def apply(self, events):
+        for state, node in events:
+            self.mark(node, state)
+
+    def present(self):
+        """Menggambar perubahan; mengembalikan list dirty rect, atau None jika seluruh layar perlu di-flip"""
+        if self._full:
+            self.draw_all()
+            self._full = False
+            self._dirty = []
+            return None
+        dirty, self._dirty = self._dirty, []
+        return dirty
+
+    def draw_all(self):
+        """
+        Seluruh grid dalam satu blit: warna sel lewat lookup table, garis
+        grid hanya pada sel tanpa status (sama seperti _paint per sel)
+        """
+        import pygame
+
+        rows, cols = self.grid.shape
+        tile_width, tile_height = self.tile_width, self.tile_height
+        values = self.grid.astype(np.int64)
+        cell_lut = np.empty((max(int(values.max()), *self.cell_colors) + 1, 3), dtype=np.uint8)
+        cell_lut[:] = self.cell_colors[0]
+        for value, color in self.cell_colors.items():
+            cell_lut[value] = color
+        state_lut = np.array([(0, 0, 0)] + self.colors[1:], dtype=np.uint8)
+        marked = self.states > 0
+        colors = np.where(marked[..., None], state_lut[self.states], cell_lut[values])
+
+        pixels = colors.repeat(tile_height, axis=0).repeat(tile_width, axis=1)
+        y = np.arange(rows * tile_height) % tile_height
+        x = np.arange(cols * tile_width) % tile_width
+        edge = ((y == 0) | (y == tile_height - 1))[:, None] | ((x == 0) | (x == tile_width - 1))[None, :]
+        edge &= ~marked.repeat(tile_height, axis=0).repeat(tile_width, axis=1)
+        pixels[edge] = self.line_color
+        self.screen.blit(pygame.surfarray.make_surface(pixels.swapaxes(0, 1)), (0, 0))
+
+    def _paint(self, row, col, color):
+        import pygame
+
+        rect = pygame.Rect(col * self.tile_width, row * self.tile_height, self.tile_width, self.tile_height)
+        if color is None:
+            pygame.draw.rect(self.screen, self.cell_colors.get(int(self.grid[row, col]), self.cell_colors[0]), rect)
+            pygame.draw.rect(self.screen, self.line_color, rect, 1)  # Garis grid
+        else:
+            pygame.draw.rect(self.screen, color, rect)  # Node open/close/path menutupi garis grid
+        return rect
+
+
+def with_path_events(steps, state="path"):
+    """Meneruskan event steps, lalu (state, node) untuk setiap node jalur hasilnya"""
+    path = yield from steps
+    for node in path or ():
+        yield state, node
+    return path
+
+
+def play_blocking(steps, draw_func, delay):
+    """Perilaku lama: draw_func(node, state) lalu time.sleep(delay) per event"""
+    while True:
+        try:
+            state, node = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        draw_func(node, state)
+        time.sleep(delay)
+
+
+def run_animation(screen, steps, apply_events, draw, events_per_second=5.0, fps=60, caption=None):
+    """
+    Loop animasi pygame: memompa event jendela, mengambil event pencarian
+    per frame lewat StepPlayer, memanggil apply_events(events) lalu
+    draw() sekali per frame. Jika draw() mengembalikan list rect (mis.
+    GridRenderer.present) hanya rect itu yang di-update, jika None seluruh
+    layar di-flip. Berjalan sampai jendela ditutup dan mengembalikan hasil
+    generator (jalur).
+
+    Tombol: spasi = pause, atas/kanan = lebih cepat, bawah/kiri = lebih
+    lambat, F = fast-forward, N = satu langkah saat pause.
+    """
+    import pygame
+
+    player = StepPlayer(steps, events_per_second, fps)
+    clock = pygame.time.Clock()
+    caption = caption or pygame.display.get_caption()[0]
+    shown_status = None
+    running = True
+    dt = 0.0
+    _present(pygame, draw())
+    while running:
+        events = []
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    player.paused = not player.paused
+                elif event.key in (pygame.K_UP, pygame.K_RIGHT):
+                    player.faster()
+                elif event.key in (pygame.K_DOWN, pygame.K_LEFT):
+                    player.slower()
+                elif event.key == pygame.K_f:
+                    player.fast_forward = not player.fast_forward
+                elif event.key == pygame.K_n and player.paused:
+                    events.extend(player.step())
+        events.extend(player.advance(dt))
+        if events:
+            apply_events(events)
+            _present(pygame, draw())
+        status = player.status()
+        if status != shown_status:
+            pygame.display.set_caption(f"{caption} [{status}]")
+            shown_status = status
+        dt = clock.tick(fps) / 1000
+    return player.result
+
+
+def _present(pygame, dirty):
+    if dirty is None:
+        pygame.display.flip()
+    elif dirty:
+        pygame.display.update(dirty)
@@ -0,0 +1,414 @@
+import heapq
+import math
+import time
+
+import numpy as np
+
+from .clearance import clearance_costs
+from .kernel import CLOSED, NEIGHBORS, SQRT2, ExpansionKernel
+from .packed_grid import PackedGrid
+from .tracing import NODE_EXPANDED, NODE_OPENED, PATH_FOUND, get_emitter
+
+class SearchState:
+    def __init__(self, size):
+        """
+        State satu arah pencarian: g_score, parent dan flag closed dalam
+        array datar berukuran size. Reset hanya mengembalikan sel yang
+        disentuh query sebelumnya.
+        """
+        self.g_score = np.full(size, np.inf, dtype=np.float64)
+        self.came_from = np.full(size, -1, dtype=np.int32 if size < 2**31 else np.int64)
+        self.closed = np.zeros(size, dtype=bool)
+        self.touched = []  # Id yang diubah oleh query terakhir
+
+    def reset(self):
+        if self.touched:
+            touched = np.fromiter(self.touched, dtype=np.int64, count=len(self.touched))
+            self.g_score[touched] = np.inf
+            self.came_from[touched] = -1
+            self.closed[touched] = False
+            self.touched.clear()
+
+    def visited(self):
+        """Jumlah node yang punya state (g/parent) pada query terakhir"""
+        return len(np.unique(np.fromiter(self.touched, dtype=np.int64, count=len(self.touched))))
+
+    def expanded(self):
+        """Jumlah node yang di-expand pada query terakhir"""
+        touched = np.unique(np.fromiter(self.touched, dtype=np.int64, count=len(self.touched)))
+        return int(np.count_nonzero(self.closed[touched]))
+
+    @property
+    def nbytes(self):
+        return self.g_score.nbytes + self.came_from.nbytes + self.closed.nbytes
+
+
+class ArrayAStarPathfinder:
+    use_kernel = True  # False untuk varian yang tidak bisa berjalan di atas ExpansionKernel (JPS)
+
+    def __init__(self, grid, clearance=None, safety_margin=0.0, clearance_weight=0.0, packed=False, kernel=False,
+                 field_cache=None):
+        """
+        A* dengan state berbasis array NumPy datar.
+
+        Setiap sel diberi id row * cols + col. g_score, parent dan flag
+        closed disimpan dalam array berukuran rows * cols yang dialokasikan
+        sekali per peta, sehingga memori per query tetap (13 byte per sel)
+        dan heap hanya berisi pasangan (f_score, id).
+
+        clearance: ClearanceMap (atau array jarak ke obstacle) opsional.
+            safety_margin: sel dengan jarak < safety_margin dianggap obstacle
+            clearance_weight: biaya tambahan clearance_weight / jarak saat
+                memasuki sel, sehingga jalur menjauhi obstacle
+            Keduanya tanpa clearance ditolak dengan ValueError.
+        packed: simpan mask passable sebagai PackedGrid (1 bit per sel);
+            grid juga boleh berupa PackedGrid, dengan start dan goal
+            diberikan ke find_path
+        kernel: opt-in. Jika True, pada peta padat (ndarray, tanpa packed
+            dan tanpa clearance_weight) pencarian berjalan di atas
+            ExpansionKernel: state list Python per id padded, sehingga inner
+            loop cukup satu perbandingan g. Hasil sama dengan loop array dan
+            sekitar 2x lebih cepat, tetapi memori tidak lagi tetap: 17 byte
+            per sel ditambah objek float/int untuk setiap sel yang disentuh
+            query (lihat KernelState.nbytes).
+        field_cache: GoalDistanceCache opsional. Jarak ke goal dibaca dari
+            field yang dihitung sekali per goal (dipakai ulang oleh query
+            lain dengan goal dan ukuran peta yang sama), sehingga heuristik
+            cukup satu pembacaan array per neighbor. Hasil sama persis.
+
+        Aturan endpoint (sama untuk semua engine dan planner, lihat
+        _open_endpoints): start atau goal di atas obstacle dan goal di
+        dalam safety_margin menghasilkan None tanpa pencarian; start di
+        dalam safety_margin tetap dicari agar agen bisa keluar dari margin.
+        """
+        self.grid = grid
+        self.rows, self.cols = grid.shape
+        self.size = self.rows * self.cols
+        self.passable = self._build_passable(grid)
+        # Mask tanpa safety_margin, hanya untuk aturan endpoint start
+        self.traversable = self.passable
+        blocked, step_penalty = clearance_costs(clearance, safety_margin, clearance_weight)
+        if blocked is not None:
+            self.passable = self.passable & ~blocked.ravel()
+        self.step_penalty = step_penalty.ravel() if step_penalty is not None else None
+        if packed and not isinstance(self.passable, PackedGrid):
+            self.passable = PackedGrid(mask=np.asarray(self.passable).reshape(self.rows, self.cols))
+            if blocked is None:
+                self.traversable = self.passable
+            elif not isinstance(self.traversable, PackedGrid):
+                self.traversable = PackedGrid(mask=np.asarray(self.traversable).reshape(self.rows, self.cols))
+        self.start = self._find_coordinates(2)
+        self.goal = self._find_coordinates(3)
+        self.field_cache = field_cache
+
+        self.kernel = None
+        if kernel and self.use_kernel and self.step_penalty is None and isinstance(self.passable, np.ndarray):
+            self.kernel = ExpansionKernel(grid, passable=self.passable.reshape(self.rows, self.cols))
+        self.state = self._new_state()
+        if self.kernel is None:
+            self.g_score = self.state.g_score
+            self.came_from = self.state.came_from
+            self.closed = self.state.closed
+            self._touched = self.state.touched
+
+    def _new_state(self):
+        """State satu arah pencarian: KernelState jika memakai kernel, selain itu SearchState"""
+        return self.kernel.new_state() if self.kernel is not None else SearchState(self.size)
+
+    def _build_passable(self, grid):
+        """
+        Mask datar sel yang bisa dilalui (bukan obstacle). Peta yang punya
+        passable() sendiri (mis. MapFile) memberi mask yang memuat tile
+        hanya saat diakses.
+        """
+        if hasattr(grid, "passable"):
+            return grid.passable()
+        return (np.asarray(grid) != 1).ravel()
+
+    def _find_coordinates(self, value):
+        """Mencari koordinat dari nilai tertentu, None jika tidak ada"""
+        if not isinstance(self.grid, np.ndarray):
+            return None  # PackedGrid tidak punya sel 2/3; MapFile tidak dipindai per tile
+        result = np.argwhere(self.grid == value)
+        return tuple(int(v) for v in result[0]) if result.size > 0 else None
+
+    def to_id(self, node):
+        return int(node[0]) * self.cols + int(node[1])
+
+    def to_node(self, node_id):
+        return divmod(int(node_id), self.cols)
+
+    def _endpoints(self, start, goal):
+        """
+        (start, goal) sebagai tuple int; default sel bernilai 2 dan 3.
+        Koordinat di luar grid ditolak karena id datarnya akan menunjuk
+        sel lain.
+        """
+        start = self.start if start is None else (int(start[0]), int(start[1]))
+        goal = self.goal if goal is None else (int(goal[0]), int(goal[1]))
+        if start is None or goal is None:
+            raise ValueError("Start or Goal node not found in the grid.")
+        if not all(0 <= row < self.rows and 0 <= col < self.cols for row, col in (start, goal)):
+            raise ValueError("Start or Goal node is outside the grid.")
+        return start, goal
+
+    def _open_endpoints(self, start_ids, goal_ids):
+        """
+        Aturan endpoint bersama semua engine dan planner: start tidak boleh
+        obstacle (start di dalam safety_margin tetap dicari) dan goal harus
+        passable (bukan obstacle dan di luar safety_margin). start_ids,
+        goal_ids: id datar atau array id; mengembalikan list bool per
+        pasangan.
+        """
+        start_ids = np.atleast_1d(start_ids)
+        goal_ids = np.atleast_1d(goal_ids)
+        traversable, passable = self.traversable, self.passable
+        if isinstance(traversable, np.ndarray) and isinstance(passable, np.ndarray):
+            return (traversable[start_ids] & passable[goal_ids]).tolist()
+        return [bool(traversable[s] and passable[g]) for s, g in zip(start_ids.tolist(), goal_ids.tolist())]
+
+    def _goal_distances(self, goal):
+        """
+        Field jarak ke goal dari field_cache sebagai array datar berindeks id
+        (list berindeks id padded jika memakai kernel), None tanpa
+        field_cache. Jarak hanya bergantung pada selisih koordinat, jadi
+        untuk id padded dipakai field peta berbingkai dengan goal bergeser
+        satu sel.
+        """
+        if self.field_cache is None:
+            return None
+        if self.kernel is not None:
+            shape = (self.rows + 2, self.kernel.width)
+            return self.field_cache.get(shape, (goal[0] + 1, goal[1] + 1), flat_list=True)
+        return self.field_cache.get((self.rows, self.cols), goal).ravel()
+
+    def _reset_state(self):
+        """Mengembalikan hanya sel yang disentuh query sebelumnya"""
+        self.state.reset()
+
+    def find_path(self, start=None, goal=None, tracer=None, stats=None):
+        """
+        Mencari jalur dari start ke goal.
+        start, goal: (row, col); default memakai sel bernilai 2 dan 3.
+        tracer: Tracer opsional yang menerima event expanded/opened/path_found
+        stats: SearchStats opsional yang menerima statistik kerja query ini
+        Mengembalikan list koordinat dari start ke goal, atau None.
+        """
+        start, goal = self._endpoints(start, goal)
+        if not self._open_endpoints(self.to_id(start), self.to_id(goal))[0]:
+            return None
+        if self.kernel is not None:
+            return self._find_path_kernel(start, goal, tracer, stats)
+
+        self._reset_state()
+        emit = get_emitter(tracer)
+        rows, cols = self.rows, self.cols
+        passable = self.passable
+        g_score = self.g_score
+        came_from = self.came_from
+        closed = self.closed
+        touched = self._touched
+        step_penalty = self.step_penalty
+        goal_row, goal_col = goal
+        goal_id = goal_row * cols + goal_col
+        distances = self._goal_distances(goal)
+
+        start_id = start[0] * cols + start[1]
+        g_score[start_id] = 0.0
+        touched.append(start_id)
+        open_list = [(0, start_id)]
+        heap_peak = 0
+        timing = stats is not None  # Waktu heuristik hanya diukur jika stats diminta
+        heuristic_time = 0.0
+        search_begin = time.perf_counter()
+
+        while open_list:
+            if stats is not None and len(open_list) > heap_peak:
+                heap_peak = len(open_list)
+            f_score, current_id = heapq.heappop(open_list)
+            if closed[current_id]:
+                continue  # Entri basi (lazy deletion)
+
+            if current_id == goal_id:
+                if emit is not None:
+                    emit(PATH_FOUND, goal, float(g_score[goal_id]), float(g_score[goal_id]))
+                return self._finish(stats, start_id, goal_id, open_list, heap_peak, search_begin, heuristic_time)
+
+            closed[current_id] = True
+            row, col = divmod(current_id, cols)
+            current_g = float(g_score[current_id])
+            if emit is not None:
+                emit(NODE_EXPANDED, (row, col), current_g, f_score)
+
+            for d_row, d_col in NEIGHBORS:
+                n_row = row + d_row
+                n_col = col + d_col
+                if not (0 <= n_row < rows and 0 <= n_col < cols):
+                    continue
+                neighbor_id = n_row * cols + n_col
+                if not passable[neighbor_id] or closed[neighbor_id]:
+                    continue
+
+                tentative_g_score = current_g + (SQRT2 if d_row and d_col else 1.0)
+                if step_penalty is not None:
+                    tentative_g_score += step_penalty[neighbor_id]  # Biaya clearance, O(1)
+                if tentative_g_score < g_score[neighbor_id]:
+                    came_from[neighbor_id] = current_id
+                    g_score[neighbor_id] = tentative_g_score
+                    touched.append(neighbor_id)
+                    if timing:
+                        h_begin = time.perf_counter()
+                    if distances is not None:
+                        h_score = distances[neighbor_id]
+                    else:
+                        h_score = math.sqrt((n_row - goal_row) ** 2 + (n_col - goal_col) ** 2)
+                    if timing:
+                        heuristic_time += time.perf_counter() - h_begin
+                    heapq.heappush(open_list, (tentative_g_score + h_score, neighbor_id))
+                    if emit is not None:
+                        emit(NODE_OPENED, (n_row, n_col), tentative_g_score, tentative_g_score + h_score)
+
+        return self._finish(stats, start_id, None, open_list, heap_peak, search_begin, heuristic_time)
+
+    def _find_path_kernel(self, start, goal, tracer, stats):
+        """
+        find_path di atas ExpansionKernel. g[p] = CLOSED untuk node yang
+        sudah di-expand, sehingga inner loop hanya berisi satu perbandingan
+        t < g[tetangga] yang sekaligus memeriksa obstacle, closed dan
+        perbaikan g. Urutan tie-break id padded sama dengan id biasa.
+        """
+        kernel = self.kernel
+        state = self.state
+        state.reset()
+        emit = get_emitter(tracer)
+        g = state.g
+        parent = state.parent
+        touched = state.touched
+        offsets = kernel.offsets
+        width = kernel.width
+        sqrt = math.sqrt
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        start_p = kernel.to_padded(start)
+        goal_p = kernel.to_padded(goal)
+        goal_row, goal_col = divmod(goal_p, width)
+        distances = self._goal_distances(goal)
+
+        g[start_p] = 0.0
+        parent[start_p] = -1
+        touched.append(start_p)
+        open_list = [(0, start_p)]
+        heap_peak = 0
+        timing = stats is not None  # Waktu heuristik hanya diukur jika stats diminta
+        heuristic_time = 0.0
+        perf_counter = time.perf_counter
+        search_begin = perf_counter()
+
+        while open_list:
+            if stats is not None and len(open_list) > heap_peak:
+                heap_peak = len(open_list)
+            f_score, current = heappop(open_list)
+            current_g = g[current]
+            if current_g == CLOSED:
+                continue  # Entri basi (lazy deletion)
+
+            if current == goal_p:
+                if emit is not None:
+                    emit(PATH_FOUND, goal, current_g, current_g)
+                return self._finish(stats, start_p, goal_p, open_list, heap_peak, search_begin, heuristic_time)
+
+            g[current] = CLOSED
+            row, col = divmod(current, width)
+            if emit is not None:
+                emit(NODE_EXPANDED, (row - 1, col - 1), current_g, f_score)
+            h_row = row - goal_row
+            h_col = col - goal_col
+
+            for offset, d_row, d_col, cost in offsets:
+                neighbor = current + offset
+                tentative_g_score = current_g + cost
+                if tentative_g_score < g[neighbor]:
+                    g[neighbor] = tentative_g_score
+                    parent[neighbor] = current
+                    touched.append(neighbor)
+                    if timing:
+                        h_begin = perf_counter()
+                    if distances is not None:
+                        h = distances[neighbor]
+                    else:
+                        n_row = h_row + d_row
+                        n_col = h_col + d_col
+                        h = sqrt(n_row * n_row + n_col * n_col)
+                    if timing:
+                        heuristic_time += perf_counter() - h_begin
+                    f = tentative_g_score + h
+                    heappush(open_list, (f, neighbor))
+                    if emit is not None:
+                        emit(NODE_OPENED, (row - 1 + d_row, col - 1 + d_col), tentative_g_score, f)
+
+        return self._finish(stats, start_p, None, open_list, heap_peak, search_begin, heuristic_time)
+
+    def _finish(self, stats, start_id, goal_id, open_list, heap_peak, search_begin, heuristic_time):
+        """
+        Merekonstruksi jalur (None jika goal_id None) dan, jika stats
+        diberikan, mencatat statistik query dari state pencarian.
+        heuristic_time: waktu heuristik yang diakumulasi di loop pencarian.
+        """
+        search_time = time.perf_counter() - search_begin
+        reconstruction_begin = time.perf_counter()
+        path = self._reconstruct_path(start_id, goal_id) if goal_id is not None else None
+        reconstruction_time = time.perf_counter() - reconstruction_begin
+        if stats is not None:
+            self._record_stats(
+                stats, (self.state,), len(open_list), heap_peak, path is not None, int(path is not None),
+                search_time, heuristic_time, reconstruction_time,
+            )
+        return path
+
+    def _record_stats(self, stats, states, remaining, heap_peak, found, goal_pops,
+                      search_time, heuristic_time, reconstruction_time, not_pushed=0):
+        """
+        Statistik diturunkan dari state (SearchState atau KernelState):
+        setiap push menambah satu id ke touched (kecuali not_pushed id yang
+        tidak di-push), sehingga pop = push - sisa heap dan pop basi = pop -
+        expanded - goal_pops (pop goal yang tidak di-expand).
+        """
+        pushed = sum(len(state.touched) for state in states) - not_pushed
+        expanded = sum(state.expanded() for state in states)
+        stats.record(
+            found=found,
+            expanded=expanded,
+            pushed=pushed,
+            stale_pops=pushed - remaining - expanded - goal_pops,
+            heap_peak=heap_peak,
+            state_peak=sum(state.visited() for state in states),
+            state_bytes=sum(state.nbytes for state in states),
+            search_time=search_time,
+            heuristic_time=heuristic_time,
+            reconstruction_time=reconstruction_time,
+        )
+
+    def _reconstruct_path(self, start_id, goal_id):
+        """Merekonstruksi jalur dari goal ke start lewat array parent (id padded jika memakai kernel)"""
+        if self.kernel is not None:
+            return self.kernel.path(self.state.parent, start_id, goal_id)
+        came_from = self.came_from
+        path = []
+        current = goal_id
+        while current != start_id:
+            path.append(divmod(current, self.cols))
+            current = int(came_from[current])
+        path.append(divmod(start_id, self.cols))
+        return path[::-1]
+
+    def mark_path_on_grid(self, path):
+        """Menandai jalur pada grid dengan nilai 5"""
+        grid = self.grid if isinstance(self.grid, np.ndarray) else self.grid.read()  # PackedGrid/MapFile
+        if path is None:
+            return grid
+
+        marked_grid = grid.copy()
+        for x, y in path:
+            if marked_grid[x, y] not in (2, 3):  # Jangan ubah start dan goal
+                marked_grid[x, y] = 5
+        return marked_grid
@@ -0,0 +1,230 @@
+import heapq
+import math
+import time
+
+from .astar_engine import CLOSED, NEIGHBORS, SQRT2, ArrayAStarPathfinder
+from .barrier_index import BarrierIndex
+from .tracing import NODE_EXPANDED, NODE_OPENED, PATH_FOUND, get_emitter
+
+
+class BarrierAStarPathfinder(ArrayAStarPathfinder):
+    def __init__(self, grid, turn_penalty_coefficient=1.0, barrier_index=None, **kwargs):
+        """
+        Varian Barrier Raster Coefficient + Turn Penalty dari
+        perhitungan-barrier.py di atas state array ArrayAStarPathfinder.
+
+        h = (1 - ln P) * jarak(neighbor, goal), dengan P dihitung sekali
+        per node yang di-expand lewat BarrierIndex (O(1)). barrier_index
+        bisa diberikan agar prefix-sum dipakai bersama oleh banyak query.
+
+        Jika memakai ExpansionKernel, prefix-sum disalin ke list datar
+        (snapshot peta saat engine dibuat) agar P dihitung langsung di loop,
+        dan f aktif per node disimpan di list live_f.
+        """
+        super().__init__(grid, **kwargs)
+        self.turn_penalty_coefficient = turn_penalty_coefficient
+        self.barrier_index = barrier_index if barrier_index is not None else BarrierIndex(grid)
+        if self.kernel is not None:
+            self.table = self.barrier_index.table.ravel().tolist()
+            self.live_f = [0.0] * self.kernel.size  # Hanya dibaca untuk sel yang di-push query ini
+
+    def find_path(self, start=None, goal=None, tracer=None, stats=None):
+        """
+        Mencari jalur dari start ke goal; hasil sama dengan a_star_search
+        pada perhitungan-barrier.py.
+        """
+        start, goal = self._endpoints(start, goal)
+        if not self._open_endpoints(self.to_id(start), self.to_id(goal))[0]:
+            return None
+        if self.kernel is not None:
+            return self._find_path_kernel(start, goal, tracer, stats)
+
+        self._reset_state()
+        emit = get_emitter(tracer)
+        rows, cols = self.rows, self.cols
+        passable = self.passable
+        g_score = self.g_score
+        came_from = self.came_from
+        closed = self.closed
+        touched = self._touched
+        step_penalty = self.step_penalty
+        coefficient = self.barrier_index.coefficient
+        turn_penalty_coefficient = self.turn_penalty_coefficient
+        goal_row, goal_col = goal
+        goal_id = goal_row * cols + goal_col
+        distances = self._goal_distances(goal)
+
+        start_id = start[0] * cols + start[1]
+        g_score[start_id] = 0.0
+        touched.append(start_id)
+        open_list = [(0, start_id)]
+        # f aktif per node di open list. Turn penalty membuat f baru bisa
+        # lebih besar dari f lama, jadi entri dengan f berbeda dianggap basi
+        # (sama seperti PriorityQueue.push yang mengganti prioritas).
+        open_f = {start_id: 0}
+        heap_peak = 0
+        timing = stats is not None  # Waktu heuristik hanya diukur jika stats diminta
+        heuristic_time = 0.0
+        search_begin = time.perf_counter()
+
+        while open_list:
+            if stats is not None and len(open_list) > heap_peak:
+                heap_peak = len(open_list)
+            f_score, current_id = heapq.heappop(open_list)
+            if open_f.get(current_id) != f_score:
+                continue  # Entri basi (lazy deletion)
+            del open_f[current_id]
+
+            if current_id == goal_id:
+                if emit is not None:
+                    emit(PATH_FOUND, goal, float(g_score[goal_id]), f_score)
+                return self._finish(stats, start_id, goal_id, open_list, heap_peak, search_begin, heuristic_time)
+
+            closed[current_id] = True
+            row, col = divmod(current_id, cols)
+            current_g = float(g_score[current_id])
+            if emit is not None:
+                emit(NODE_EXPANDED, (row, col), current_g, f_score)
+
+            # P hanya bergantung pada current dan goal
+            if timing:
+                h_begin = time.perf_counter()
+            barrier_factor = 1 - math.log(coefficient((row, col), goal))
+            if timing:
+                heuristic_time += time.perf_counter() - h_begin
+            has_parent = came_from[current_id] >= 0
+            dx1, dy1 = goal_row - row, goal_col - col
+
+            for d_row, d_col in NEIGHBORS:
+                n_row = row + d_row
+                n_col = col + d_col
+                if not (0 <= n_row < rows and 0 <= n_col < cols):
+                    continue
+                neighbor_id = n_row * cols + n_col
+                if not passable[neighbor_id] or closed[neighbor_id]:
+                    continue
+
+                tentative_g_score = current_g + (SQRT2 if d_row and d_col else 1.0)
+                if step_penalty is not None:
+                    tentative_g_score += step_penalty[neighbor_id]
+                if tentative_g_score < g_score[neighbor_id]:
+                    came_from[neighbor_id] = current_id
+                    g_score[neighbor_id] = tentative_g_score
+                    touched.append(neighbor_id)
+                    if timing:
+                        h_begin = time.perf_counter()
+                    if distances is not None:
+                        h = barrier_factor * distances[neighbor_id]
+                    else:
+                        h = barrier_factor * math.sqrt((n_row - goal_row) ** 2 + (n_col - goal_col) ** 2)
+                    if timing:
+                        heuristic_time += time.perf_counter() - h_begin
+                    turn_penalty = abs(dx1 * d_col - d_row * dy1) * turn_penalty_coefficient if has_parent else 0
+                    f = tentative_g_score + h + turn_penalty
+                    open_f[neighbor_id] = f
+                    heapq.heappush(open_list, (f, neighbor_id))
+                    if emit is not None:
+                        emit(NODE_OPENED, (n_row, n_col), tentative_g_score, f)
+
+        return self._finish(stats, start_id, None, open_list, heap_peak, search_begin, heuristic_time)
+
+    def _find_path_kernel(self, start, goal, tracer, stats):
+        """find_path di atas ExpansionKernel; entri heap dengan f berbeda dari live_f dianggap basi"""
+        kernel = self.kernel
+        state = self.state
+        state.reset()
+        emit = get_emitter(tracer)
+        g = state.g
+        parent = state.parent
+        touched = state.touched
+        live_f = self.live_f
+        offsets = kernel.offsets
+        width = kernel.width
+        sqrt = math.sqrt
+        log = math.log
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        table = self.table
+        table_width = kernel.cols + 1
+        turn_penalty_coefficient = self.turn_penalty_coefficient
+        start_p = kernel.to_padded(start)
+        goal_p = kernel.to_padded(goal)
+        goal_row, goal_col = divmod(goal_p, width)
+        distances = self._goal_distances(goal)
+
+        g[start_p] = 0.0
+        parent[start_p] = -1
+        live_f[start_p] = 0
+        touched.append(start_p)
+        open_list = [(0, start_p)]
+        heap_peak = 0
+        timing = stats is not None  # Waktu heuristik hanya diukur jika stats diminta
+        heuristic_time = 0.0
+        perf_counter = time.perf_counter
+        search_begin = perf_counter()
+
+        while open_list:
+            if stats is not None and len(open_list) > heap_peak:
+                heap_peak = len(open_list)
+            f_score, current = heappop(open_list)
+            current_g = g[current]
+            if current_g == CLOSED or live_f[current] != f_score:
+                continue  # Entri basi (lazy deletion)
+
+            if current == goal_p:
+                if emit is not None:
+                    emit(PATH_FOUND, goal, current_g, f_score)
+                return self._finish(stats, start_p, goal_p, open_list, heap_peak, search_begin, heuristic_time)
+
+            g[current] = CLOSED
+            row, col = divmod(current, width)
+            if emit is not None:
+                emit(NODE_EXPANDED, (row - 1, col - 1), current_g, f_score)
+
+            # P hanya bergantung pada current dan goal (BarrierIndex.coefficient).
+            # Dalam koordinat padded, baris tabel prefix = row - 1 (min) dan row (max + 1)
+            if timing:
+                h_begin = perf_counter()
+            if row < goal_row:
+                row_min, row_max = row - 1, goal_row
+            else:
+                row_min, row_max = goal_row - 1, row
+            if col < goal_col:
+                col_min, col_max = col - 1, goal_col
+            else:
+                col_min, col_max = goal_col - 1, col
+            top = row_min * table_width
+            bottom = row_max * table_width
+            obstacle_count = table[bottom + col_max] - table[top + col_max] - table[bottom + col_min] + table[top + col_min]
+            barrier_coefficient = obstacle_count / ((row_max - row_min) * (col_max - col_min))
+            barrier_factor = 1 - log(barrier_coefficient if barrier_coefficient > 0.01 else 0.01)
+            if timing:
+                heuristic_time += perf_counter() - h_begin
+            has_parent = parent[current] >= 0
+            dx1, dy1 = goal_row - row, goal_col - col
+
+            for offset, d_row, d_col, cost in offsets:
+                neighbor = current + offset
+                tentative_g_score = current_g + cost
+                if tentative_g_score < g[neighbor]:
+                    g[neighbor] = tentative_g_score
+                    parent[neighbor] = current
+                    touched.append(neighbor)
+                    if timing:
+                        h_begin = perf_counter()
+                    if distances is not None:
+                        h = barrier_factor * distances[neighbor]
+                    else:
+                        n_row = d_row - dx1
+                        n_col = d_col - dy1
+                        h = barrier_factor * sqrt(n_row * n_row + n_col * n_col)
+                    if timing:
+                        heuristic_time += perf_counter() - h_begin
+                    turn_penalty = abs(dx1 * d_col - d_row * dy1) * turn_penalty_coefficient if has_parent else 0
+                    f = tentative_g_score + h + turn_penalty
+                    live_f[neighbor] = f
+                    heappush(open_list, (f, neighbor))
+                    if emit is not None:
+                        emit(NODE_OPENED, (row - 1 + d_row, col - 1 + d_col), tentative_g_score, f)
+
+        return self._finish(stats, start_p, None, open_list, heap_peak, search_begin, heuristic_time)
@@ -0,0 +1,73 @@
+import numpy as np
+
+
+class BarrierIndex:
+    def __init__(self, grid):
+        """
+        Summed-area table (prefix-sum 2D) dari obstacle pada grid.
+
+        Dibangun sekali per peta dalam O(N); setelah itu jumlah obstacle di
+        persegi panjang mana pun dihitung dalam O(1) dengan empat akses
+        array. Perubahan sel diterapkan lewat update_cell/update_cells:
+        satu sel mengubah semua prefix-sum di kanan-bawahnya, jadi biayanya
+        O((rows - row) * (cols - col)), paling buruk O(N) per sel. Untuk
+        banyak sel sekaligus pakai update_cells, yang membangun ulang tabel
+        sekali dari baris teratas yang berubah.
+        """
+        self.obstacles = np.asarray(grid) == 1
+        self.rows, self.cols = self.obstacles.shape
+        dtype = np.int32 if self.obstacles.size < 2**31 else np.int64
+        self.table = np.zeros((self.rows + 1, self.cols + 1), dtype=dtype)
+        np.cumsum(self.obstacles, axis=0, out=self.table[1:, 1:])
+        np.cumsum(self.table[1:, 1:], axis=1, out=self.table[1:, 1:])
+
+    def count(self, row_min, col_min, row_max, col_max):
+        """Jumlah obstacle pada persegi panjang [row_min..row_max] x [col_min..col_max]"""
+        table = self.table
+        return int(
+            table[row_max + 1, col_max + 1]
+            - table[row_min, col_max + 1]
+            - table[row_max + 1, col_min]
+            + table[row_min, col_min]
+        )
+
+    def coefficient(self, current, goal):
+        """Barrier Raster Coefficient (P), sama dengan compute_barrier_coefficient"""
+        x1, y1 = current
+        x2, y2 = goal
+        x_min, x_max = min(x1, x2), max(x1, x2)
+        y_min, y_max = min(y1, y2), max(y1, y2)
+
+        obstacle_count = self.count(x_min, y_min, x_max, y_max)
+        total_area = (x_max - x_min + 1) * (y_max - y_min + 1)
+        return max(obstacle_count / total_area, 0.01)  # P tidak boleh nol (log)
+
+    def update_cell(self, cell, value):
+        """Memperbarui indeks setelah grid[cell] diubah menjadi value"""
+        self.update_cells([(cell, value)])
+
+    def update_cells(self, updates):
+        """
+        Memperbarui indeks setelah perubahan [((row, col), value), ...];
+        biaya paling banyak satu pembangunan ulang tabel, berapa pun
+        jumlah selnya.
+        """
+        changed = []
+        for (row, col), value in updates:
+            is_obstacle = value == 1
+            if self.obstacles[row, col] != is_obstacle:
+                self.obstacles[row, col] = is_obstacle
+                changed.append((row, col, is_obstacle))
+        if not changed:
+            return
+        if len(changed) == 1:
+            # Hanya prefix-sum di kanan-bawah sel yang berubah
+            row, col, is_obstacle = changed[0]
+            self.table[row + 1:, col + 1:] += 1 if is_obstacle else -1
+            return
+        # Baris di atas perubahan pertama tetap; sisanya dibangun ulang dari baris tersebut
+        first = min(row for row, _, _ in changed)
+        band = self.table[first + 1:, 1:]
+        np.cumsum(self.obstacles[first:], axis=0, out=band)
+        np.cumsum(band, axis=1, out=band)
+        band += self.table[first, 1:]
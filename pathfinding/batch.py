@@ -0,0 +1,198 @@
+import inspect
+import math
+
+import numpy as np
+
+from .astar_engine import ArrayAStarPathfinder
+from .barrier_astar import BarrierAStarPathfinder
+from .bidirectional import BidirectionalAStarPathfinder
+from .grid_map import GridMap
+from .guideline_astar import GuidelineAStarPathfinder
+from .jps import JumpPointPathfinder
+
+VARIANTS = {
+    "astar": ArrayAStarPathfinder,
+    "barrier": BarrierAStarPathfinder,
+    "bidirectional": BidirectionalAStarPathfinder,
+    "guideline": GuidelineAStarPathfinder,
+    "jps": JumpPointPathfinder,
+}
+
+
+def engine_options(engine):
+    """Nama parameter yang diterima engine, termasuk yang diteruskan lewat **kwargs ke kelas induk"""
+    names = set()
+    for cls in engine.__mro__:
+        if "__init__" not in vars(cls):
+            continue
+        parameters = list(inspect.signature(cls.__init__).parameters.values())[2:]  # Tanpa self dan grid
+        names.update(p.name for p in parameters if p.kind is not p.VAR_KEYWORD)
+        if not any(p.kind is p.VAR_KEYWORD for p in parameters):
+            break
+    return names
+
+
+def check_options(variant, options):
+    """ValueError jika variant tidak dikenal atau options memuat parameter yang tidak didukung variant"""
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown variant '{variant}', expected one of {sorted(VARIANTS)}")
+    unsupported = sorted(set(options) - engine_options(VARIANTS[variant]))
+    if unsupported:
+        raise ValueError(f"Variant '{variant}' does not support option(s) {unsupported}")
+
+
+class PackedPaths:
+    def __init__(self, coords, offsets, costs):
+        """
+        Kumpulan jalur dalam bentuk padat: coords (M, 2) int32 berisi semua
+        koordinat berurutan, offsets (K + 1,) sehingga jalur ke-i adalah
+        coords[offsets[i]:offsets[i + 1]]. Jalur yang tidak ditemukan
+        panjangnya 0 dan cost-nya inf.
+        """
+        self.coords = coords
+        self.offsets = offsets
+        self.costs = costs
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        """Jalur ke-index sebagai view (n, 2), None jika tidak ditemukan"""
+        begin, end = self.offsets[index], self.offsets[index + 1]
+        return self.coords[begin:end] if end > begin else None
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def found(self):
+        return np.diff(self.offsets) > 0
+
+    @property
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    def to_lists(self):
+        """Jalur sebagai list of list tuple, seperti hasil find_path"""
+        return [None if path is None else [tuple(cell) for cell in path.tolist()] for path in self]
+
+
+class BatchPlanner:
+    def __init__(self, grid_map, variant="astar", clearance_max_distance=None, **options):
+        """
+        Menjawab banyak pasangan (start, goal) pada satu peta tanpa mengubah
+        grid dan tanpa memindai ulang sel 2/3 per query.
+
+        grid_map: GridMap atau array grid. Mask passable, ClearanceMap dan
+            prefix-sum BarrierIndex diambil dari GridMap (dibuat sekali) dan
+            dipakai bersama oleh seluruh query.
+        variant: "astar", "barrier", "bidirectional", "guideline" atau "jps"
+        clearance_max_distance: max_distance ClearanceMap. Tanpa batas
+            update sel tetap lokal, tetapi wilayahnya tumbuh sejauh jarak
+            ke obstacle terdekat; batas membuatnya tetap kecil di peta jarang.
+        options: parameter engine, mis. safety_margin, clearance_weight,
+            turn_penalty_coefficient, precompute (JPS+), field_cache
+            (GoalDistanceCache, dipakai semua query). Kombinasi yang
+            tidak didukung variant ditolak di sini dengan ValueError.
+
+        Aturan endpoint sama dengan engine (ArrayAStarPathfinder.
+        _open_endpoints): pasangan dengan start atau goal di atas obstacle,
+        atau goal di dalam safety_margin, tidak dicari dan hasilnya None,
+        baik lewat find_path maupun find_paths.
+        """
+        check_options(variant, options)
+        self.grid_map = grid_map if isinstance(grid_map, GridMap) else GridMap(grid_map)
+        self.variant = variant
+        self.clearance_max_distance = clearance_max_distance
+        self.options = options
+        self._engine = None
+        self._version = None
+
+    @property
+    def engine(self):
+        """Engine untuk versi peta saat ini; dibuat ulang hanya jika peta berubah"""
+        if self._engine is None or self._version != self.grid_map.version:
+            self._engine = self._build_engine()
+            self._version = self.grid_map.version
+        return self._engine
+
+    def _build_engine(self):
+        options = dict(self.options)
+        grid_map = self.grid_map
+        if options.get("safety_margin", 0) > 0 or options.get("clearance_weight", 0) > 0:
+            options["clearance"] = grid_map.clearance(self.clearance_max_distance)
+        if self.variant == "barrier":
+            options["barrier_index"] = grid_map.barrier_index()
+        return VARIANTS[self.variant](grid_map.grid, **options)
+
+    def find_path(self, start, goal, stats=None):
+        engine = self.engine
+        if not self._passable_pairs(engine, np.array([[start[0], start[1], goal[0], goal[1]]], dtype=np.int64))[0]:
+            return None
+        return engine.find_path(start, goal, stats=stats)
+
+    def _passable_pairs(self, engine, pairs):
+        """
+        List bool per pasangan (K, 4) menurut aturan endpoint engine
+        (_open_endpoints); ValueError jika di luar grid
+        """
+        rows, cols = engine.rows, engine.cols
+        if pairs.size and (
+            pairs[:, 0::2].min() < 0 or pairs[:, 0::2].max() >= rows
+            or pairs[:, 1::2].min() < 0 or pairs[:, 1::2].max() >= cols
+        ):
+            raise ValueError("Start or Goal node is outside the grid.")
+        return engine._open_endpoints(pairs[:, 0] * cols + pairs[:, 1], pairs[:, 2] * cols + pairs[:, 3])
+
+    def find_paths(self, pairs, stats=None, field_cache=None):
+        """
+        pairs: array (K, 2, 2) atau (K, 4) berisi (start_row, start_col,
+        goal_row, goal_col). Mengembalikan PackedPaths dengan urutan yang
+        sama seperti pairs.
+        stats: SearchStats opsional yang mengumpulkan statistik semua query
+        field_cache: GoalDistanceCache opsional untuk batch ini (menggantikan
+            option field_cache engine), sehingga pasangan dengan goal yang
+            sama memakai satu field jarak ke goal
+        """
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 4)
+        engine = self.engine
+        valid = self._passable_pairs(engine, pairs)  # Endpoint tidak passable: lewati tanpa mencari
+
+        chunks = []
+        lengths = np.zeros(len(pairs), dtype=np.int64)
+        costs = np.full(len(pairs), math.inf)
+        engine_cache = engine.field_cache
+        if field_cache is not None:
+            engine.field_cache = field_cache
+        try:
+            for index, (start_row, start_col, goal_row, goal_col) in enumerate(pairs.tolist()):
+                if not valid[index]:
+                    continue
+                path = engine.find_path((start_row, start_col), (goal_row, goal_col), stats=stats)
+                if path is None:
+                    continue
+                path = np.array(path, dtype=np.int32).reshape(-1, 2)
+                chunks.append(path)
+                lengths[index] = len(path)
+                costs[index] = path_cost(path)
+        finally:
+            engine.field_cache = engine_cache
+
+        offsets = np.zeros(len(pairs) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        coords = np.concatenate(chunks) if chunks else np.empty((0, 2), dtype=np.int32)
+        return PackedPaths(coords, offsets, costs)
+
+
+def path_cost(path):
+    """Panjang geometris jalur (n, 2): 1 per langkah lurus, √2 per diagonal"""
+    if len(path) < 2:
+        return 0.0
+    steps = np.abs(np.diff(path, axis=0)).sum(axis=1)
+    return float(np.count_nonzero(steps == 1) + math.sqrt(2) * np.count_nonzero(steps == 2))
+
+
+def find_paths(grid, pairs, variant="astar", **options):
+    """Shortcut: BatchPlanner(grid, variant, **options).find_paths(pairs)"""
+    return BatchPlanner(grid, variant, **options).find_paths(pairs)
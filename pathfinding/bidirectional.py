@@ -0,0 +1,284 @@
+import heapq
+import math
+import time
+
+from .astar_engine import NEIGHBORS, SQRT2, ArrayAStarPathfinder
+from .tracing import NODE_EXPANDED, NODE_OPENED, PATH_FOUND, get_emitter
+
+
+class BidirectionalAStarPathfinder(ArrayAStarPathfinder):
+    def __init__(self, grid, **kwargs):
+        """
+        Bidirectional A* dengan state array yang sama seperti
+        ArrayAStarPathfinder: satu SearchState untuk arah maju (self.state)
+        dan satu lagi untuk arah mundur (self.backward).
+
+        Kedua arah memakai potensial rata-rata p(v) = (h(v, goal) - h(v, start)) / 2
+        (maju) dan -p(v) (mundur), sehingga keduanya mencari pada graf
+        dengan biaya tereduksi yang sama. Biaya jalur terbaik lewat titik
+        temu disimpan sebagai mu dan pencarian berhenti saat
+        kunci_min_maju + kunci_min_mundur >= mu, sehingga jalur yang
+        dikembalikan optimal. Node dengan g + h >= mu tidak dimasukkan ke
+        open list. Setiap langkah meng-expand sisi dengan open list lebih
+        kecil.
+
+        Jika memakai ExpansionKernel, kedua arah memakai KernelState dan
+        closed disimpan di bytearray state (bukan g = CLOSED), karena mu
+        membaca g arah lawan untuk node yang sudah di-expand.
+
+        Dengan field_cache, jarak ke goal dibaca dari field yang di-cache per
+        goal; jarak ke start tetap dihitung langsung, karena start biasanya
+        berbeda per query dan field per start hanya akan mengusir field goal
+        dari cache LRU.
+        """
+        super().__init__(grid, **kwargs)
+        self.backward = self._new_state()
+        self.pruned = 0  # Node yang g-nya diperbarui tetapi tidak di-push (g + h >= mu)
+        self.heuristic_time = 0.0  # Waktu heuristik query terakhir (hanya diukur jika stats diminta)
+
+    def _reset_state(self):
+        super()._reset_state()
+        self.backward.reset()
+        self.pruned = 0
+        self.heuristic_time = 0.0
+
+    def find_path(self, start=None, goal=None, tracer=None, stats=None):
+        """
+        Mencari jalur dari start ke goal dari kedua arah sekaligus.
+        Parameter dan hasil sama dengan ArrayAStarPathfinder.find_path.
+        """
+        start, goal = self._endpoints(start, goal)
+        if not self._open_endpoints(self.to_id(start), self.to_id(goal))[0]:
+            return None
+
+        self._reset_state()
+        emit = get_emitter(tracer)
+        kernel = self.kernel
+        if kernel is not None:
+            # Id dan koordinat padded; selisih koordinat sama dengan koordinat grid
+            start_id = kernel.to_padded(start)
+            goal_id = kernel.to_padded(goal)
+            start_node = divmod(start_id, kernel.width)
+            goal_node = divmod(goal_id, kernel.width)
+            expand = self._expand_kernel
+        else:
+            start_id = self.to_id(start)
+            goal_id = self.to_id(goal)
+            start_node, goal_node = start, goal
+            expand = self._expand
+
+        # Setiap arah: (state, heap kunci, target, asal, state arah lawan,
+        # field jarak ke target, field jarak ke asal); field None = dihitung langsung
+        goal_field = self._goal_distances(goal)
+        start_field = None
+        forward = (self.state, [], goal_node, start_node, self.backward, goal_field, start_field)
+        backward = (self.backward, [], start_node, goal_node, self.state, start_field, goal_field)
+        for side, origin_id in ((forward, start_id), (backward, goal_id)):
+            state, open_list, target, origin = side[:4]
+            if kernel is not None:
+                state.g[origin_id] = 0.0
+                state.parent[origin_id] = -1
+            else:
+                state.g_score[origin_id] = 0.0
+            state.touched.append(origin_id)
+            open_list.append((_potential(origin, target, origin), origin_id))
+
+        best_cost = 0.0 if start_id == goal_id else math.inf  # mu
+        meeting_id = start_id if start_id == goal_id else -1
+        heap_peak = 0
+        timing = stats is not None
+        search_begin = time.perf_counter()
+
+        while True:
+            if stats is not None and len(forward[1]) + len(backward[1]) > heap_peak:
+                heap_peak = len(forward[1]) + len(backward[1])
+            # Buang entri basi di puncak kedua heap
+            for state, open_list in (forward[:2], backward[:2]):
+                while open_list and state.closed[open_list[0][1]]:
+                    heapq.heappop(open_list)
+            if not forward[1] or not backward[1]:
+                break
+            # Kriteria berhenti: tidak ada jalur yang bisa lebih murah dari mu
+            if forward[1][0][0] + backward[1][0][0] >= best_cost:
+                break
+
+            # Expand sisi dengan frontier lebih kecil
+            side = forward if len(forward[1]) <= len(backward[1]) else backward
+            best_cost, meeting_id = expand(side, best_cost, meeting_id, emit, timing)
+
+        search_time = time.perf_counter() - search_begin
+        if meeting_id >= 0 and emit is not None:
+            emit(PATH_FOUND, goal, best_cost, best_cost)
+        reconstruction_begin = time.perf_counter()
+        path = self._reconstruct_bidirectional(start_id, goal_id, meeting_id) if meeting_id >= 0 else None
+        reconstruction_time = time.perf_counter() - reconstruction_begin
+        if stats is not None:
+            self._record_stats(
+                stats, (self.state, self.backward), len(forward[1]) + len(backward[1]), heap_peak,
+                path is not None, 0, search_time, self.heuristic_time, reconstruction_time,
+                not_pushed=self.pruned,
+            )
+        return path
+
+    def _expand(self, side, best_cost, meeting_id, emit, timing=False):
+        """
+        Meng-expand satu node dari sisi side; mengembalikan (mu, titik temu).
+        timing: jika True, waktu menghitung kedua jarak potensial ditambahkan
+            ke self.heuristic_time.
+        """
+        state, open_list, target, origin, other, target_field, origin_field = side
+        rows, cols = self.rows, self.cols
+        passable = self.passable
+        g_score = state.g_score
+        came_from = state.came_from
+        closed = state.closed
+        touched = state.touched
+        other_g_score = other.g_score
+        step_penalty = self.step_penalty
+        target_row, target_col = target
+        origin_row, origin_col = origin
+
+        key, current_id = heapq.heappop(open_list)
+        closed[current_id] = True
+        row, col = divmod(current_id, cols)
+        current_g = float(g_score[current_id])
+        if emit is not None:
+            emit(NODE_EXPANDED, (row, col), current_g, key)
+
+        for d_row, d_col in NEIGHBORS:
+            n_row = row + d_row
+            n_col = col + d_col
+            if not (0 <= n_row < rows and 0 <= n_col < cols):
+                continue
+            neighbor_id = n_row * cols + n_col
+            if not passable[neighbor_id] or closed[neighbor_id]:
+                continue
+
+            tentative_g_score = current_g + (SQRT2 if d_row and d_col else 1.0)
+            if step_penalty is not None:
+                # Biaya clearance dikenakan saat memasuki sel pada arah maju
+                tentative_g_score += step_penalty[neighbor_id if state is self.state else current_id]
+            if tentative_g_score < g_score[neighbor_id]:
+                came_from[neighbor_id] = current_id
+                g_score[neighbor_id] = tentative_g_score
+                touched.append(neighbor_id)
+
+                # Perbarui mu jika neighbor sudah dicapai dari arah lawan
+                total = tentative_g_score + other_g_score[neighbor_id]
+                if total < best_cost:
+                    best_cost, meeting_id = total, neighbor_id
+
+                if timing:
+                    h_begin = time.perf_counter()
+                if target_field is not None:
+                    h_target = target_field[neighbor_id]
+                else:
+                    h_target = math.sqrt((n_row - target_row) ** 2 + (n_col - target_col) ** 2)
+                if timing:
+                    self.heuristic_time += time.perf_counter() - h_begin
+                if tentative_g_score + h_target >= best_cost:
+                    self.pruned += 1
+                    continue  # Tidak mungkin memperbaiki mu
+                if timing:
+                    h_begin = time.perf_counter()
+                if origin_field is not None:
+                    h_origin = origin_field[neighbor_id]
+                else:
+                    h_origin = math.sqrt((n_row - origin_row) ** 2 + (n_col - origin_col) ** 2)
+                if timing:
+                    self.heuristic_time += time.perf_counter() - h_begin
+                key = tentative_g_score + (h_target - h_origin) / 2
+                heapq.heappush(open_list, (key, neighbor_id))
+                if emit is not None:
+                    emit(NODE_OPENED, (n_row, n_col), tentative_g_score, key)
+
+        return best_cost, meeting_id
+
+    def _expand_kernel(self, side, best_cost, meeting_id, emit, timing=False):
+        """_expand di atas ExpansionKernel: id padded, tanpa pemeriksaan batas dan passable"""
+        state, open_list, (target_row, target_col), (origin_row, origin_col), other, target_field, origin_field = side
+        g = state.g
+        parent = state.parent
+        closed = state.closed
+        touched = state.touched
+        other_g = other.g
+        sqrt = math.sqrt
+        heappush = heapq.heappush
+        perf_counter = time.perf_counter
+
+        key, current = heapq.heappop(open_list)
+        closed[current] = 1
+        row, col = divmod(current, self.kernel.width)
+        current_g = g[current]
+        if emit is not None:
+            emit(NODE_EXPANDED, (row - 1, col - 1), current_g, key)
+
+        # Selisih koordinat tetangga terhadap target dan asal = selisih current + offset
+        t_row, t_col = row - target_row, col - target_col
+        o_row, o_col = row - origin_row, col - origin_col
+        pruned = 0
+        heuristic_time = 0.0
+        for offset, d_row, d_col, cost in self.kernel.offsets:
+            neighbor = current + offset
+            if closed[neighbor]:
+                continue
+            tentative_g_score = current_g + cost
+            if tentative_g_score < g[neighbor]:
+                g[neighbor] = tentative_g_score
+                parent[neighbor] = current
+                touched.append(neighbor)
+
+                # Perbarui mu jika neighbor sudah dicapai dari arah lawan
+                total = tentative_g_score + other_g[neighbor]
+                if total < best_cost:
+                    best_cost, meeting_id = total, neighbor
+
+                if timing:
+                    h_begin = perf_counter()
+                if target_field is not None:
+                    h_target = target_field[neighbor]
+                else:
+                    n_row = t_row + d_row
+                    n_col = t_col + d_col
+                    h_target = sqrt(n_row * n_row + n_col * n_col)
+                if timing:
+                    heuristic_time += perf_counter() - h_begin
+                if tentative_g_score + h_target >= best_cost:
+                    pruned += 1
+                    continue  # Tidak mungkin memperbaiki mu
+                if timing:
+                    h_begin = perf_counter()
+                if origin_field is not None:
+                    h_origin = origin_field[neighbor]
+                else:
+                    n_row = o_row + d_row
+                    n_col = o_col + d_col
+                    h_origin = sqrt(n_row * n_row + n_col * n_col)
+                if timing:
+                    heuristic_time += perf_counter() - h_begin
+                key = tentative_g_score + (h_target - h_origin) / 2
+                heappush(open_list, (key, neighbor))
+                if emit is not None:
+                    emit(NODE_OPENED, (row - 1 + d_row, col - 1 + d_col), tentative_g_score, key)
+
+        self.pruned += pruned
+        self.heuristic_time += heuristic_time
+        return best_cost, meeting_id
+
+    def _reconstruct_bidirectional(self, start_id, goal_id, meeting_id):
+        """Start -> titik temu lewat parent maju, titik temu -> goal lewat parent mundur"""
+        path = self._reconstruct_path(start_id, meeting_id)
+        if self.kernel is not None:
+            came_from, to_node = self.backward.parent, self.kernel.to_node
+        else:
+            came_from, to_node = self.backward.came_from, self.to_node
+        current = meeting_id
+        while current != goal_id:
+            current = int(came_from[current])
+            path.append(to_node(current))
+        return path
+
+
+def _potential(node, target, origin):
+    """Potensial rata-rata (h(node, target) - h(node, origin)) / 2"""
+    return (math.dist(node, target) - math.dist(node, origin)) / 2
@@ -0,0 +1,175 @@
+import math
+
+import numpy as np
+
+SQRT2 = math.sqrt(2)
+
+
+def _chamfer_pass(distance, first_column=0):
+    """
+    Satu lintasan chamfer (atas ke bawah, kiri ke kanan), diproses per baris.
+    first_column: indeks kolom pertama distance pada peta penuh, agar
+    pembulatan minimum kumulatif sama persis dengan lintasan peta penuh.
+    """
+    rows, cols = distance.shape
+    columns = np.arange(first_column, first_column + cols, dtype=np.float64)
+    for row in range(rows):
+        line = distance[row]
+        if row > 0:
+            above = distance[row - 1]
+            np.minimum(line, above + 1.0, out=line)
+            np.minimum(line[1:], above[:-1] + SQRT2, out=line[1:])
+            np.minimum(line[:-1], above[1:] + SQRT2, out=line[:-1])
+        # line[c] = min_k<=c (line[k] + (c - k)) lewat minimum kumulatif
+        np.minimum(line, np.minimum.accumulate(line - columns) + columns, out=line)
+
+
+def chamfer_distance(obstacles, max_distance=None):
+    """
+    Jarak setiap sel ke obstacle terdekat dengan chamfer 8-arah (1, √2),
+    sama dengan model biaya gerak A*. Dua lintasan (maju dan mundur)
+    dengan operasi NumPy per baris. Sel obstacle bernilai 0; tanpa
+    obstacle sama sekali nilainya inf. max_distance membatasi nilai.
+    """
+    return _chamfer_window(obstacles, max_distance)
+
+
+def _chamfer_window(obstacles, max_distance=None, left=0, right=0):
+    """
+    chamfer_distance untuk jendela peta dengan left kolom di kirinya dan
+    right kolom di kanannya, sehingga nilainya identik (bit demi bit) dengan
+    nilai yang sama pada peta penuh.
+    """
+    distance = np.where(obstacles, 0.0, np.inf)
+    _chamfer_pass(distance, left)
+    _chamfer_pass(distance[::-1, ::-1], right)  # Lintasan mundur pada view terbalik
+    if max_distance is not None:
+        np.minimum(distance, max_distance, out=distance)
+    return distance
+
+
+def clearance_costs(clearance, safety_margin=0.0, clearance_weight=0.0):
+    """
+    (blocked, step_penalty) untuk opsi clearance sebuah pencarian.
+    clearance: ClearanceMap atau array jarak ke obstacle (rows, cols)
+    blocked: True untuk sel dengan jarak < safety_margin (dianggap obstacle)
+    step_penalty: clearance_weight / max(jarak, 1), ditambahkan ke g saat
+        memasuki sel
+    Keduanya None jika opsinya tidak aktif. Hanya sel tetangga yang
+    diperiksa, jadi start tetap di-expand walaupun berada di dalam margin,
+    sedangkan goal di dalam margin tidak pernah tercapai.
+    """
+    if clearance is None:
+        if safety_margin > 0 or clearance_weight > 0:
+            raise ValueError("safety_margin and clearance_weight require a clearance map")
+        return None, None
+    field = np.asarray(getattr(clearance, "field", clearance))
+    blocked = field < safety_margin if safety_margin > 0 else None
+    step_penalty = clearance_weight / np.maximum(field, 1.0) if clearance_weight > 0 else None
+    return blocked, step_penalty
+
+
+class ClearanceMap:
+    def __init__(self, grid, max_distance=None):
+        """
+        Peta jarak ke obstacle (expansion distance) yang dihitung sekali
+        per peta, sehingga A* cukup membaca satu elemen array per sel.
+
+        max_distance membatasi jarak yang dihitung. Dengan batas ini
+        perubahan sel hanya memengaruhi sel dalam radius max_distance,
+        sehingga update_cells cukup menghitung ulang wilayah kotor
+        tersebut. Tanpa batas wilayah kotor diperbesar (radius 2, 4, 8, ...)
+        sampai nilainya tuntas; di peta yang obstacle-nya jarang wilayah itu
+        bisa mencakup seluruh peta.
+        """
+        self.obstacles = np.asarray(grid) == 1
+        self.max_distance = max_distance
+        self.field = chamfer_distance(self.obstacles, max_distance)
+
+    def clearance(self, cell):
+        return float(self.field[cell])
+
+    def update_cells(self, updates):
+        """
+        Menerapkan perubahan sel [((row, col), value), ...] dan menghitung
+        ulang jarak hanya di sekitar sel yang berubah.
+        """
+        changed = []
+        for (row, col), value in updates:
+            is_obstacle = value == 1
+            if self.obstacles[row, col] != is_obstacle:
+                self.obstacles[row, col] = is_obstacle
+                changed.append((row, col))
+        if not changed:
+            return
+        changed = np.array(changed)
+        if self.max_distance is not None:
+            self._recompute(changed, int(math.ceil(self.max_distance)))
+            return
+        # Tanpa batas: perbesar wilayah kotor sampai nilai di tepinya tidak berubah
+        radius = 2
+        while not self._recompute(changed, radius):
+            radius *= 2
+
+    def _recompute(self, changed, radius):
+        """
+        Menghitung ulang wilayah kotor (sel berubah +- radius) dari jendela
+        konteks selebar radius lagi. Tanpa max_distance hasilnya hanya
+        dipakai jika sudah tuntas (lihat _settled); mengembalikan False
+        jika belum sehingga radius perlu diperbesar.
+        """
+        rows, cols = self.obstacles.shape
+        # Wilayah kotor: sel yang jaraknya bisa berubah
+        dirty_min = np.maximum(changed.min(axis=0) - radius, 0)
+        dirty_max = np.minimum(changed.max(axis=0) + radius + 1, (rows, cols))
+        # Konteks: semua obstacle yang bisa memengaruhi wilayah kotor
+        context_min = np.maximum(dirty_min - radius, 0)
+        context_max = np.minimum(dirty_max + radius, (rows, cols))
+
+        window = _chamfer_window(
+            self.obstacles[context_min[0]:context_max[0], context_min[1]:context_max[1]],
+            self.max_distance, context_min[1], cols - context_max[1],
+        )
+        inner_min = dirty_min - context_min
+        inner_max = dirty_max - context_min
+        inner = window[inner_min[0]:inner_max[0], inner_min[1]:inner_max[1]]
+        if self.max_distance is None and not self._settled(inner, dirty_min, dirty_max, context_min, context_max):
+            return False
+        self.field[dirty_min[0]:dirty_max[0], dirty_min[1]:dirty_max[1]] = inner
+        return True
+
+    def _settled(self, inner, dirty_min, dirty_max, context_min, context_max):
+        """
+        True jika nilai jendela inner bisa langsung dipakai tanpa max_distance:
+        - tepat: setiap nilai lebih kecil dari jarak sel ke luar konteks
+          (kecuali tepi peta), jadi obstacle di luar jendela tidak berperan
+        - tuntas: tepi wilayah kotor yang bukan tepi peta tidak berubah;
+          jalur terpendek dari luar ke sel yang berubah selalu melewati
+          tepi itu, sehingga sel di luar wilayah kotor juga tidak berubah
+        """
+        rows, cols = self.obstacles.shape
+        row = np.arange(dirty_min[0], dirty_max[0])[:, None]
+        col = np.arange(dirty_min[1], dirty_max[1])[None, :]
+        gap = np.full(inner.shape, np.inf)
+        if context_min[0] > 0:
+            gap = np.minimum(gap, row - context_min[0] + 1)
+        if context_max[0] < rows:
+            gap = np.minimum(gap, context_max[0] - row)
+        if context_min[1] > 0:
+            gap = np.minimum(gap, col - context_min[1] + 1)
+        if context_max[1] < cols:
+            gap = np.minimum(gap, context_max[1] - col)
+        if not ((inner < gap) | np.isinf(gap)).all():
+            return False
+
+        old = self.field[dirty_min[0]:dirty_max[0], dirty_min[1]:dirty_max[1]]
+        edges = []
+        if dirty_min[0] > 0:
+            edges.append(np.s_[0, :])
+        if dirty_max[0] < rows:
+            edges.append(np.s_[-1, :])
+        if dirty_min[1] > 0:
+            edges.append(np.s_[:, 0])
+        if dirty_max[1] < cols:
+            edges.append(np.s_[:, -1])
+        return all(np.array_equal(inner[edge], old[edge]) for edge in edges)
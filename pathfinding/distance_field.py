@@ -0,0 +1,180 @@
+import heapq
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+from .grid_map import GridMap
+from .kernel import ExpansionKernel
+
+
+class DistanceField:
+    def __init__(self, kernel, goals, cost):
+        """
+        Biaya terpendek dari setiap sel ke goal terdekat (8-arah, biaya
+        1 / √2, sama seperti engine A*). cost adalah list per id padded
+        ExpansionKernel: inf untuk sel yang tidak bisa mencapai goal, -1
+        untuk obstacle dan bingkai.
+        """
+        self.kernel = kernel
+        self.goals = goals
+        self._cost = cost
+        self._array = None
+
+    @property
+    def array(self):
+        """Field sebagai array float64 (rows, cols); inf untuk obstacle dan sel tak terjangkau"""
+        if self._array is None:
+            kernel = self.kernel
+            padded = np.array(self._cost).reshape(kernel.rows + 2, kernel.width)[1:-1, 1:-1]
+            padded[padded < 0] = math.inf
+            padded.flags.writeable = False
+            self._array = padded
+        return self._array
+
+    def _padded(self, node):
+        """Id padded node; koordinat di luar grid ditolak (id-nya menunjuk bingkai atau sel lain)"""
+        kernel = self.kernel
+        if not (0 <= node[0] < kernel.rows and 0 <= node[1] < kernel.cols):
+            raise ValueError("Start or Goal node is outside the grid.")
+        return kernel.to_padded(node)
+
+    def cost(self, node):
+        """Biaya dari node ke goal terdekat (inf jika tidak terjangkau)"""
+        value = self._cost[self._padded(node)]
+        return value if value >= 0 else math.inf
+
+    def path(self, start):
+        """
+        Jalur dari start ke goal terdekat dengan mengikuti gradien field:
+        setiap langkah memilih tetangga dengan biaya langkah + field
+        terkecil (tetangga yang memberi nilai field sel saat ini).
+        O(panjang jalur); None jika start obstacle atau tidak terjangkau.
+        """
+        kernel = self.kernel
+        cost = self._cost
+        offsets = kernel.offsets
+        current = self._padded(start)
+        remaining = cost[current]
+        if not 0 <= remaining < math.inf:
+            return None
+        path = [(int(start[0]), int(start[1]))]
+        while remaining > 0:
+            best_total = math.inf
+            best_step = None
+            for offset, d_row, d_col, step in offsets:
+                neighbor_cost = cost[current + offset]
+                if neighbor_cost >= 0 and neighbor_cost + step < best_total:
+                    best_total = neighbor_cost + step
+                    best_step = offset, d_row, d_col
+            offset, d_row, d_col = best_step
+            current += offset
+            remaining = cost[current]
+            row, col = path[-1]
+            path.append((row + d_row, col + d_col))
+        return path
+
+
+def build_distance_field(kernel, goals):
+    """
+    Dijkstra satu-ke-semua dari himpunan goal di atas ExpansionKernel.
+    Karena biaya langkah simetris, biaya dari goal ke sel sama dengan
+    biaya dari sel ke goal. Goal yang berupa obstacle diabaikan.
+    """
+    cost = list(kernel.template)  # inf untuk sel bebas, -1 untuk obstacle/bingkai
+    offsets = tuple((offset, step) for offset, _, _, step in kernel.offsets)
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    open_list = []
+    for goal in goals:
+        p = kernel.to_padded(goal)
+        if cost[p] > 0:
+            cost[p] = 0.0
+            open_list.append((0.0, p))
+    heapq.heapify(open_list)
+
+    while open_list:
+        current_cost, current = heappop(open_list)
+        if current_cost > cost[current]:
+            continue  # Entri basi (lazy deletion)
+        for offset, step in offsets:
+            neighbor = current + offset
+            tentative = current_cost + step
+            if tentative < cost[neighbor]:  # Obstacle (-1) tidak pernah lebih besar
+                cost[neighbor] = tentative
+                heappush(open_list, (tentative, neighbor))
+    return DistanceField(kernel, goals, cost)
+
+
+class DistanceFieldPlanner:
+    def __init__(self, grid_map, max_fields=16):
+        """
+        Mode satu-ke-semua: field biaya ke goal dihitung sekali per goal
+        (atau himpunan goal), lalu setiap agen mendapat jalurnya dengan
+        mengikuti gradien dalam O(panjang jalur). Cocok untuk banyak agen
+        yang menuju dock yang sama.
+
+        Field di-cache (LRU, max_fields entri) sampai peta berubah
+        (GridMap.version), seperti engine pada BatchPlanner.
+        """
+        self.grid_map = grid_map if isinstance(grid_map, GridMap) else GridMap(grid_map)
+        self.max_fields = max_fields
+        self._fields = OrderedDict()  # goals (tuple terurut) -> DistanceField
+        self._kernel = None
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def kernel(self):
+        """ExpansionKernel untuk versi peta saat ini; field lama dibuang jika peta berubah"""
+        if self._kernel is None or self._version != self.grid_map.version:
+            self._kernel = ExpansionKernel(self.grid_map.grid)
+            self._version = self.grid_map.version
+            self._fields.clear()
+        return self._kernel
+
+    def marked_goals(self):
+        """Semua sel bertanda 3 pada grid"""
+        return [tuple(int(v) for v in cell) for cell in np.argwhere(self.grid_map.grid == 3)]
+
+    def field(self, goals=None):
+        """
+        DistanceField untuk goal (row, col), list goal, atau None (semua
+        sel bertanda 3).
+        """
+        goals = self._goal_key(goals)
+        kernel = self.kernel
+        field = self._fields.get(goals)
+        if field is not None:
+            self._fields.move_to_end(goals)
+            self.hits += 1
+            return field
+        self.misses += 1
+        field = build_distance_field(kernel, goals)
+        self._fields[goals] = field
+        if len(self._fields) > self.max_fields:
+            self._fields.popitem(last=False)
+        return field
+
+    def find_path(self, start, goals=None):
+        """Jalur dari start ke goal terdekat (lihat field), None jika tidak ada"""
+        return self.field(goals).path(start)
+
+    def find_paths(self, starts, goals=None):
+        """Jalur untuk setiap start ke goal yang sama; field hanya dihitung sekali"""
+        field = self.field(goals)
+        return [field.path(start) for start in starts]
+
+    def _goal_key(self, goals):
+        if goals is None:
+            goals = self.marked_goals()
+        elif len(goals) == 2 and np.isscalar(goals[0]):
+            goals = [goals]
+        rows, cols = self.grid_map.shape
+        key = tuple(sorted({(int(row), int(col)) for row, col in goals}))
+        if not key:
+            raise ValueError("Start or Goal node not found in the grid.")
+        if any(not (0 <= row < rows and 0 <= col < cols) for row, col in key):
+            raise ValueError("Start or Goal node is outside the grid.")
+        return key
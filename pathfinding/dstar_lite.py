@@ -0,0 +1,183 @@
+import math
+
+from .astar_engine import NEIGHBORS, SQRT2
+from .grid_map import GridMap
+from .priority_queue import PriorityQueue
+from .tracing import NODE_EXPANDED, PATH_FOUND, get_emitter
+
+# Toleransi perbandingan kunci: jumlah 1 dan √2 dengan urutan berbeda bisa
+# berbeda di digit terakhir, sedangkan node dengan kunci seri tetap harus
+# diproses agar jalur yang diikuti dari start konsisten
+KEY_EPSILON = 1e-9
+
+
+class DStarLitePlanner:
+    def __init__(self, grid_map, start, goal):
+        """
+        Perencana inkremental D* Lite (Koenig & Likhachev) dengan model gerak
+        yang sama seperti A*: 8 arah, biaya 1 / √2, sel obstacle = 1.
+
+        Pencarian berjalan mundur dari goal ke start dan state g/rhs
+        disimpan antar pemanggilan. Saat sel berubah hanya sel itu dan
+        tetangganya yang diperbarui, lalu compute_shortest_path memperbaiki
+        bagian yang terpengaruh saja, sehingga biaya replanning sebanding
+        dengan besar perubahan, bukan ukuran peta.
+
+        grid_map: GridMap atau array grid. Perubahan lewat
+            GridMap.set_cells (dari mana pun) ikut diperhitungkan.
+        """
+        self.grid_map = grid_map if isinstance(grid_map, GridMap) else GridMap(grid_map)
+        self.rows, self.cols = self.grid_map.shape
+        size = self.rows * self.cols
+        self.passable = bytearray((self.grid_map.grid != 1).ravel().tobytes())
+        self.g = [math.inf] * size
+        self.rhs = [math.inf] * size
+        self.open_list = PriorityQueue()
+        self.start = self._inside(start)
+        self.goal = self._inside(goal)
+        self._last_start = self.start
+        self.km = 0.0  # Koreksi kunci saat start berpindah
+        self.expanded = 0  # Node yang di-expand pada pemanggilan terakhir
+        self._pending = []  # Sel berubah yang belum diproses
+
+        goal_id = self._to_id(self.goal)
+        self.rhs[goal_id] = 0.0
+        self.open_list.push(goal_id, (self._heuristic(goal_id), 0.0))
+        self.grid_map.subscribe(self._on_cells_changed)
+
+    def close(self):
+        """Berhenti berlangganan perubahan GridMap"""
+        self.grid_map.unsubscribe(self._on_cells_changed)
+
+    def _inside(self, node):
+        node = (int(node[0]), int(node[1]))
+        if not (0 <= node[0] < self.rows and 0 <= node[1] < self.cols):
+            raise ValueError("Start or Goal node is outside the grid.")
+        return node
+
+    def _to_id(self, node):
+        return node[0] * self.cols + node[1]
+
+    def _heuristic(self, node_id):
+        """Jarak Euclidean dari start ke node (konsisten untuk biaya 1 / √2)"""
+        row, col = divmod(node_id, self.cols)
+        return math.sqrt((row - self.start[0]) ** 2 + (col - self.start[1]) ** 2)
+
+    def _key(self, node_id):
+        best = min(self.g[node_id], self.rhs[node_id])
+        return best + self._heuristic(node_id) + self.km, best
+
+    def _neighbors(self, node_id):
+        """(id tetangga, biaya) untuk tetangga dalam grid, tanpa cek obstacle"""
+        row, col = divmod(node_id, self.cols)
+        for d_row, d_col in NEIGHBORS:
+            n_row = row + d_row
+            n_col = col + d_col
+            if 0 <= n_row < self.rows and 0 <= n_col < self.cols:
+                yield n_row * self.cols + n_col, (SQRT2 if d_row and d_col else 1.0)
+
+    def _update_vertex(self, node_id):
+        g, rhs = self.g, self.rhs
+        if node_id == self._to_id(self.goal):
+            rhs[node_id] = 0.0 if self.passable[node_id] else math.inf
+        else:
+            best = math.inf
+            if self.passable[node_id]:
+                for neighbor_id, cost in self._neighbors(node_id):
+                    if self.passable[neighbor_id] and cost + g[neighbor_id] < best:
+                        best = cost + g[neighbor_id]
+            rhs[node_id] = best
+        if node_id in self.open_list:
+            self.open_list.remove(node_id)
+        if g[node_id] != rhs[node_id]:
+            self.open_list.push(node_id, self._key(node_id))
+
+    def _compute_shortest_path(self, emit):
+        g, rhs = self.g, self.rhs
+        open_list = self.open_list
+        start_id = self._to_id(self.start)
+        expanded = 0
+        while open_list:
+            start_key = self._key(start_id)
+            if open_list.peek_priority() > (start_key[0] + KEY_EPSILON, start_key[1] + KEY_EPSILON) \
+                    and rhs[start_id] == g[start_id]:
+                break
+            old_key, node_id = open_list.pop_with_priority()
+            new_key = self._key(node_id)
+            if old_key < new_key:
+                open_list.push(node_id, new_key)  # Kunci usang karena km berubah
+                continue
+            expanded += 1
+            if emit is not None:
+                emit(NODE_EXPANDED, divmod(node_id, self.cols), min(g[node_id], rhs[node_id]), new_key[0])
+            if g[node_id] > rhs[node_id]:
+                g[node_id] = rhs[node_id]  # Overconsistent: tetapkan nilainya
+                for neighbor_id, _ in self._neighbors(node_id):
+                    self._update_vertex(neighbor_id)
+            else:
+                g[node_id] = math.inf  # Underconsistent: naikkan lalu perbaiki
+                self._update_vertex(node_id)
+                for neighbor_id, _ in self._neighbors(node_id):
+                    self._update_vertex(neighbor_id)
+        self.expanded = expanded
+
+    def _on_cells_changed(self, cells):
+        self._pending.extend((int(row), int(col)) for row, col in cells)
+
+    def _apply_pending(self):
+        """Memperbarui passable dan rhs untuk sel berubah beserta tetangganya"""
+        if not self._pending:
+            return
+        grid = self.grid_map.grid
+        dirty = set()
+        for cell in self._pending:
+            node_id = self._to_id(cell)
+            self.passable[node_id] = int(grid[cell] != 1)
+            dirty.add(node_id)
+            dirty.update(neighbor_id for neighbor_id, _ in self._neighbors(node_id))
+        self._pending.clear()
+        for node_id in dirty:
+            self._update_vertex(node_id)
+
+    def move_start(self, start):
+        """Memindahkan start (agen bergerak) tanpa membuang state pencarian"""
+        start = self._inside(start)
+        self.km += math.dist(self._last_start, start)
+        self._last_start = start
+        self.start = start
+
+    def update_cells(self, updates, tracer=None):
+        """
+        Menerapkan perubahan sel [((row, col), value), ...] ke GridMap lalu
+        mengembalikan jalur yang sudah diperbaiki.
+        """
+        self.grid_map.set_cells(updates)
+        return self.find_path(tracer=tracer)
+
+    def find_path(self, tracer=None):
+        """Jalur terpendek saat ini dari start ke goal, atau None"""
+        emit = get_emitter(tracer)
+        self._apply_pending()
+        self._compute_shortest_path(emit)
+
+        g = self.g
+        current = self._to_id(self.start)
+        goal_id = self._to_id(self.goal)
+        if g[current] == math.inf or not self.passable[current]:
+            return None
+        path = [self.start]
+        while current != goal_id and len(path) <= len(g):
+            # Ikuti tetangga dengan biaya + g terkecil menuju goal
+            best, best_id = math.inf, -1
+            for neighbor_id, cost in self._neighbors(current):
+                if self.passable[neighbor_id] and cost + g[neighbor_id] < best:
+                    best, best_id = cost + g[neighbor_id], neighbor_id
+            if best_id < 0:
+                return None
+            current = best_id
+            path.append(divmod(current, self.cols))
+        if current != goal_id:
+            return None
+        if emit is not None:
+            emit(PATH_FOUND, self.goal, g[self._to_id(self.start)], g[self._to_id(self.start)])
+        return path
@@ -0,0 +1,100 @@
+import hashlib
+import itertools
+
+import numpy as np
+
+from .barrier_index import BarrierIndex
+from .clearance import ClearanceMap
+
+_instance_ids = itertools.count()
+
+
+class GridMap:
+    def __init__(self, grid, copy=True):
+        """
+        Peta grid beserta data turunan yang di-cache (clearance, indeks
+        barrier). Data turunan dibuat saat pertama kali diminta dan
+        diperbarui secara inkremental lewat set_cells, sehingga semua query
+        pada peta yang sama memakai prapemrosesan yang sama.
+
+        copy=False memakai array grid apa adanya (mis. view shared memory
+        atau memmap) tanpa menyalinnya.
+        """
+        self.grid = np.array(grid) if copy else np.asarray(grid)
+        self.rows, self.cols = self.grid.shape
+        self.version = 0  # Bertambah setiap kali isi peta berubah
+        self._clearance = {}  # max_distance -> ClearanceMap
+        self._barrier_index = None
+        self._map_id = None
+        self._instance_id = next(_instance_ids)
+        self._listeners = []  # callback(cells) untuk sel yang status obstacle-nya berubah
+
+    @property
+    def shape(self):
+        return self.grid.shape
+
+    @property
+    def map_id(self):
+        """
+        Identitas peta: hash isi grid saat pertama kali diminta ditambah
+        nomor instance. Tidak berubah oleh set_cells; perubahan disampaikan
+        lewat subscribe dan version. Dua GridMap dengan isi sama tetap
+        punya map_id berbeda, karena set_cells pada salah satunya tidak
+        mengubah yang lain.
+        """
+        if self._map_id is None:
+            self._map_id = f"{grid_digest(self.grid)}-{self._instance_id}"
+        return self._map_id
+
+    def subscribe(self, callback):
+        """callback(cells) dipanggil setelah set_cells dengan array (n, 2) sel yang berubah obstacle/bebas"""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        self._listeners.remove(callback)
+
+    def clearance(self, max_distance=None):
+        """ClearanceMap peta ini (dibuat sekali per max_distance)"""
+        if max_distance not in self._clearance:
+            self._clearance[max_distance] = ClearanceMap(self.grid, max_distance)
+        return self._clearance[max_distance]
+
+    def barrier_index(self):
+        """BarrierIndex peta ini (dibuat sekali)"""
+        if self._barrier_index is None:
+            self._barrier_index = BarrierIndex(self.grid)
+        return self._barrier_index
+
+    def set_cell(self, cell, value):
+        self.set_cells([(cell, value)])
+
+    def set_cells(self, updates):
+        """
+        Mengubah beberapa sel sekaligus: [((row, col), value), ...].
+        Data turunan yang sudah dibuat ikut diperbarui hanya di wilayah
+        yang berubah.
+        """
+        updates = [((int(row), int(col)), value) for (row, col), value in updates]
+        if not updates:
+            return
+        changed = [cell for cell, value in updates if (self.grid[cell] == 1) != (value == 1)]
+        for cell, value in updates:
+            self.grid[cell] = value
+        if self._barrier_index is not None:
+            self._barrier_index.update_cells(updates)
+        for clearance_map in self._clearance.values():
+            clearance_map.update_cells(updates)
+        self.version += 1
+        if changed and self._listeners:
+            changed = np.array(changed, dtype=np.int64)
+            for callback in list(self._listeners):
+                callback(changed)
+
+
+def grid_digest(grid):
+    """Hash isi grid (bentuk, dtype dan data) sebagai string hex"""
+    grid = np.ascontiguousarray(grid)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((grid.shape, grid.dtype.str)).encode())
+    digest.update(grid.data)
+    return digest.hexdigest()
@@ -0,0 +1,142 @@
+import math
+
+import numpy as np
+
+# Garis grid dan label koordinat hanya digambar jika sel cukup besar (piksel)
+MIN_LINE_CELL = 6
+MIN_LABEL_CELL = 40
+MAX_CELL = 200
+MAX_CACHED_LABELS = 4096
+
+
+def color_lut(colors, default=(255, 255, 255)):
+    """
+    Lookup table warna (256, 3) uint8 dari {nilai sel: warna}; warna boleh
+    berupa kode HEX atau tuple RGB. Nilai tanpa warna memakai default.
+    """
+    lut = np.empty((256, 3), dtype=np.uint8)
+    lut[:] = default
+    for value, color in colors.items():
+        if isinstance(color, str):
+            color = color.lstrip("#")
+            color = tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+        lut[value] = color
+    return lut
+
+
+class GridView:
+    def __init__(self, grid_shape, view_size, colors, line_color=(200, 200, 200), font=None):
+        """
+        Menggambar grid sekaligus lewat NumPy: nilai sel dipetakan ke RGB
+        dengan lookup table, dimasukkan ke surface dengan pygame.surfarray,
+        lalu di-scale ke ukuran viewport. Hanya bagian grid yang terlihat
+        yang diproses, jadi biaya per frame bergantung pada ukuran jendela,
+        bukan ukuran peta.
+
+        Viewport ditentukan oleh cell_size (piksel per sel, zoom) dan
+        origin (koordinat sel pada pojok kiri atas, pan). Awalnya seluruh
+        peta dimuat ke viewport.
+        """
+        self.rows, self.cols = grid_shape
+        self.view_width, self.view_height = view_size
+        self.lut = color_lut(colors)
+        self.line_color = line_color
+        self.font = font
+        self._labels = {}
+        self.fit()
+
+    def fit(self):
+        """Zoom dan pan sehingga seluruh peta terlihat"""
+        self.min_cell = min(self.view_width / self.cols, self.view_height / self.rows)
+        self.cell_size = self.min_cell
+        self.origin_row = 0.0
+        self.origin_col = 0.0
+
+    def zoom(self, factor, pivot=None):
+        """Mengubah zoom dengan faktor; sel di bawah pivot (x, y piksel) tetap di tempatnya"""
+        pivot_x, pivot_y = pivot if pivot is not None else (self.view_width / 2, self.view_height / 2)
+        row = self.origin_row + pivot_y / self.cell_size
+        col = self.origin_col + pivot_x / self.cell_size
+        self.cell_size = min(max(self.cell_size * factor, self.min_cell), MAX_CELL)
+        self.origin_row = row - pivot_y / self.cell_size
+        self.origin_col = col - pivot_x / self.cell_size
+        self._clamp()
+
+    def pan(self, dx, dy):
+        """Menggeser viewport sejauh (dx, dy) piksel"""
+        self.origin_col += dx / self.cell_size
+        self.origin_row += dy / self.cell_size
+        self._clamp()
+
+    def _clamp(self):
+        self.origin_row = min(max(self.origin_row, 0.0), max(self.rows - self.view_height / self.cell_size, 0.0))
+        self.origin_col = min(max(self.origin_col, 0.0), max(self.cols - self.view_width / self.cell_size, 0.0))
+
+    def screen_to_cell(self, x, y):
+        """(row, col) sel di bawah piksel (x, y), None jika di luar peta"""
+        row = math.floor(self.origin_row + y / self.cell_size)
+        col = math.floor(self.origin_col + x / self.cell_size)
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    def cell_center(self, cell):
+        """Posisi piksel pusat sel (row, col) pada viewport"""
+        row, col = cell
+        return (
+            round((col + 0.5 - self.origin_col) * self.cell_size),
+            round((row + 0.5 - self.origin_row) * self.cell_size),
+        )
+
+    def visible_range(self):
+        """(row_begin, row_end, col_begin, col_end) sel yang terlihat"""
+        row_begin = max(int(self.origin_row), 0)
+        col_begin = max(int(self.origin_col), 0)
+        row_end = min(math.ceil(self.origin_row + self.view_height / self.cell_size), self.rows)
+        col_end = min(math.ceil(self.origin_col + self.view_width / self.cell_size), self.cols)
+        return row_begin, row_end, col_begin, col_end
+
+    def draw(self, surface, grid, show_coordinates=False):
+        """Menggambar bagian grid yang terlihat ke surface"""
+        import pygame
+
+        row_begin, row_end, col_begin, col_end = self.visible_range()
+        if row_end <= row_begin or col_end <= col_begin:
+            return
+        cell = self.cell_size
+        # Jika satu piksel memuat beberapa sel, ambil satu sel per piksel sebelum lookup warna
+        stride = max(int(1 / cell), 1)
+        visible = grid[row_begin:row_end:stride, col_begin:col_end:stride]
+        # Nilai sel -> RGB sekaligus; surfarray memakai sumbu (x, y) = (col, row)
+        rgb = self.lut[np.asarray(visible, dtype=np.uint8)]
+        cells = pygame.surfarray.make_surface(rgb.transpose(1, 0, 2))
+        left = round((col_begin - self.origin_col) * cell)
+        top = round((row_begin - self.origin_row) * cell)
+        width = round((col_end - self.origin_col) * cell) - left
+        height = round((row_end - self.origin_row) * cell) - top
+        surface.blit(pygame.transform.scale(cells, (width, height)), (left, top))
+
+        if cell >= MIN_LINE_CELL:
+            for col in range(col_begin, col_end + 1):
+                x = round((col - self.origin_col) * cell)
+                pygame.draw.line(surface, self.line_color, (x, top), (x, top + height - 1))
+            for row in range(row_begin, row_end + 1):
+                y = round((row - self.origin_row) * cell)
+                pygame.draw.line(surface, self.line_color, (left, y), (left + width - 1, y))
+
+        if show_coordinates and self.font is not None and cell >= MIN_LABEL_CELL:
+            for row in range(row_begin, row_end):
+                for col in range(col_begin, col_end):
+                    x = round((col + 1 - self.origin_col) * cell) - 40
+                    y = round((row - self.origin_row) * cell) + 5
+                    surface.blit(self._label(row, col), (x, y))
+
+    def _label(self, row, col):
+        """Surface teks "col,row" (di-cache, dibuang seluruhnya jika terlalu banyak)"""
+        label = self._labels.get((row, col))
+        if label is None:
+            if len(self._labels) >= MAX_CACHED_LABELS:
+                self._labels.clear()
+            label = self.font.render(f"{col},{row}", True, (0, 0, 0))
+            self._labels[(row, col)] = label
+        return label
@@ -0,0 +1,195 @@
+import heapq
+import math
+import time
+
+from .astar_engine import CLOSED, NEIGHBORS, SQRT2, ArrayAStarPathfinder
+from .tracing import NODE_EXPANDED, NODE_OPENED, PATH_FOUND, get_emitter
+
+
+class GuidelineAStarPathfinder(ArrayAStarPathfinder):
+    def __init__(self, grid, **kwargs):
+        """
+        Varian guideline dari perhitungan-guidline.py di atas state
+        ArrayAStarPathfinder: f = g + jarak ke goal + jarak tegak lurus ke
+        garis start-goal. Pembilang jarak garis berupa bilangan bulat dan
+        dihitung inkremental per offset, jadi nilainya sama persis dengan
+        guideline_cost pada skrip. Jika start == goal garis tidak
+        terdefinisi dan jarak garis dianggap 0 (sama seperti
+        guideline_field).
+        """
+        super().__init__(grid, **kwargs)
+
+    def find_path(self, start=None, goal=None, tracer=None, stats=None):
+        """
+        Mencari jalur dari start ke goal; hasil sama dengan
+        a_star_with_guideline pada perhitungan-guidline.py.
+        """
+        start, goal = self._endpoints(start, goal)
+        if not self._open_endpoints(self.to_id(start), self.to_id(goal))[0]:
+            return None
+        if self.kernel is not None:
+            return self._find_path_kernel(start, goal, tracer, stats)
+
+        self._reset_state()
+        emit = get_emitter(tracer)
+        rows, cols = self.rows, self.cols
+        passable = self.passable
+        g_score = self.g_score
+        came_from = self.came_from
+        closed = self.closed
+        touched = self._touched
+        step_penalty = self.step_penalty
+        goal_row, goal_col = goal
+        goal_id = goal_row * cols + goal_col
+        line_row, line_col, line_c, line_norm = _guideline(start, goal)
+        distances = self._goal_distances(goal)
+
+        start_id = start[0] * cols + start[1]
+        g_score[start_id] = 0.0
+        touched.append(start_id)
+        open_list = [(0, start_id)]
+        heap_peak = 0
+        timing = stats is not None  # Waktu heuristik hanya diukur jika stats diminta
+        heuristic_time = 0.0
+        search_begin = time.perf_counter()
+
+        while open_list:
+            if stats is not None and len(open_list) > heap_peak:
+                heap_peak = len(open_list)
+            f_score, current_id = heapq.heappop(open_list)
+            if closed[current_id]:
+                continue  # Entri basi (lazy deletion)
+
+            if current_id == goal_id:
+                if emit is not None:
+                    emit(PATH_FOUND, goal, float(g_score[goal_id]), f_score)
+                return self._finish(stats, start_id, goal_id, open_list, heap_peak, search_begin, heuristic_time)
+
+            closed[current_id] = True
+            row, col = divmod(current_id, cols)
+            current_g = float(g_score[current_id])
+            if emit is not None:
+                emit(NODE_EXPANDED, (row, col), current_g, f_score)
+
+            for d_row, d_col in NEIGHBORS:
+                n_row = row + d_row
+                n_col = col + d_col
+                if not (0 <= n_row < rows and 0 <= n_col < cols):
+                    continue
+                neighbor_id = n_row * cols + n_col
+                if not passable[neighbor_id] or closed[neighbor_id]:
+                    continue
+
+                tentative_g_score = current_g + (SQRT2 if d_row and d_col else 1.0)
+                if step_penalty is not None:
+                    tentative_g_score += step_penalty[neighbor_id]
+                if tentative_g_score < g_score[neighbor_id]:
+                    came_from[neighbor_id] = current_id
+                    g_score[neighbor_id] = tentative_g_score
+                    touched.append(neighbor_id)
+                    if timing:
+                        h_begin = time.perf_counter()
+                    if distances is not None:
+                        h = distances[neighbor_id]
+                    else:
+                        h = math.sqrt((n_row - goal_row) ** 2 + (n_col - goal_col) ** 2)
+                    c = abs(line_row * n_row - line_col * n_col + line_c) / line_norm
+                    if timing:
+                        heuristic_time += time.perf_counter() - h_begin
+                    f = tentative_g_score + h + c
+                    heapq.heappush(open_list, (f, neighbor_id))
+                    if emit is not None:
+                        emit(NODE_OPENED, (n_row, n_col), tentative_g_score, f)
+
+        return self._finish(stats, start_id, None, open_list, heap_peak, search_begin, heuristic_time)
+
+    def _find_path_kernel(self, start, goal, tracer, stats):
+        """find_path di atas ExpansionKernel"""
+        kernel = self.kernel
+        state = self.state
+        state.reset()
+        emit = get_emitter(tracer)
+        g = state.g
+        parent = state.parent
+        touched = state.touched
+        width = kernel.width
+        sqrt = math.sqrt
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        start_p = kernel.to_padded(start)
+        goal_p = kernel.to_padded(goal)
+        goal_row, goal_col = divmod(goal_p, width)
+        line_row, line_col, line_c, line_norm = _guideline(start, goal)
+        distances = self._goal_distances(goal)
+        offsets = tuple(
+            (offset, d_row, d_col, cost, line_row * d_row - line_col * d_col)
+            for offset, d_row, d_col, cost in kernel.offsets
+        )
+
+        g[start_p] = 0.0
+        parent[start_p] = -1
+        touched.append(start_p)
+        open_list = [(0, start_p)]
+        heap_peak = 0
+        timing = stats is not None
+        heuristic_time = 0.0
+        perf_counter = time.perf_counter
+        search_begin = perf_counter()
+
+        while open_list:
+            if stats is not None and len(open_list) > heap_peak:
+                heap_peak = len(open_list)
+            f_score, current = heappop(open_list)
+            current_g = g[current]
+            if current_g == CLOSED:
+                continue  # Entri basi (lazy deletion)
+
+            if current == goal_p:
+                if emit is not None:
+                    emit(PATH_FOUND, goal, current_g, f_score)
+                return self._finish(stats, start_p, goal_p, open_list, heap_peak, search_begin, heuristic_time)
+
+            g[current] = CLOSED
+            row, col = divmod(current, width)
+            if emit is not None:
+                emit(NODE_EXPANDED, (row - 1, col - 1), current_g, f_score)
+            h_row = row - goal_row
+            h_col = col - goal_col
+            line_base = line_row * (row - 1) - line_col * (col - 1) + line_c
+
+            for offset, d_row, d_col, cost, line_step in offsets:
+                neighbor = current + offset
+                tentative_g_score = current_g + cost
+                if tentative_g_score < g[neighbor]:
+                    g[neighbor] = tentative_g_score
+                    parent[neighbor] = current
+                    touched.append(neighbor)
+                    if timing:
+                        h_begin = perf_counter()
+                    if distances is not None:
+                        h = distances[neighbor]
+                    else:
+                        n_row = h_row + d_row
+                        n_col = h_col + d_col
+                        h = sqrt(n_row * n_row + n_col * n_col)
+                    c = abs(line_base + line_step) / line_norm
+                    if timing:
+                        heuristic_time += perf_counter() - h_begin
+                    f = tentative_g_score + h + c
+                    heappush(open_list, (f, neighbor))
+                    if emit is not None:
+                        emit(NODE_OPENED, (row - 1 + d_row, col - 1 + d_col), tentative_g_score, f)
+
+        return self._finish(stats, start_p, None, open_list, heap_peak, search_begin, heuristic_time)
+
+
+def _guideline(start, goal):
+    """
+    Koefisien garis start-goal: guideline_cost(node) =
+    |line_row * x - line_col * y + line_c| / line_norm
+    """
+    (x_start, y_start), (x_goal, y_goal) = start, goal
+    line_row, line_col = y_goal - y_start, x_goal - x_start
+    line_c = x_goal * y_start - y_goal * x_start
+    line_norm = math.sqrt((x_goal - x_start) ** 2 + (y_goal - y_start) ** 2) or 1.0  # start == goal: pembilang 0
+    return line_row, line_col, line_c, line_norm
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+def goal_distance_field(shape, goal):
+    """
+    Jarak Euclidean setiap sel ke goal sebagai array float64 (rows, cols).
+    Nilainya identik dengan euclidean_distance(node, goal) pada skrip
+    perhitungan*.py (kuadrat bilangan bulat eksak, sqrt dibulatkan sama).
+    """
+    rows, cols = shape
+    d_row = np.arange(rows, dtype=np.float64) - goal[0]
+    d_col = np.arange(cols, dtype=np.float64) - goal[1]
+    return np.sqrt(d_row[:, None] ** 2 + d_col[None, :] ** 2)
+
+
+def guideline_field(shape, start, goal):
+    """
+    Jarak tegak lurus setiap sel ke garis start-goal (guideline_cost pada
+    perhitungan-guidline.py) sebagai array float64 (rows, cols). Nol di
+    seluruh grid jika start == goal (garis tidak terdefinisi).
+    """
+    rows, cols = shape
+    (x_start, y_start), (x_goal, y_goal) = start, goal
+    line_row, line_col = y_goal - y_start, x_goal - x_start
+    if line_row == 0 and line_col == 0:
+        return np.zeros(shape)
+    line_c = x_goal * y_start - y_goal * x_start
+    denominator = np.sqrt(float(line_col ** 2 + line_row ** 2))
+    x = np.arange(rows, dtype=np.int64)[:, None]
+    y = np.arange(cols, dtype=np.int64)[None, :]
+    return np.abs(line_row * x - line_col * y + line_c) / denominator
+
+
+class GoalDistanceCache:
+    def __init__(self, max_entries=16):
+        """
+        Cache LRU field jarak ke goal, dengan kunci (shape, goal). Field
+        hanya bergantung pada ukuran peta dan goal, bukan isi peta, jadi
+        tidak perlu di-invalidasi saat obstacle berubah. Berguna untuk batch
+        query yang goal-nya sama (mis. banyak agen ke satu dock).
+        """
+        self.max_entries = max_entries
+        self._fields = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._fields)
+
+    def get(self, shape, goal, flat_list=False):
+        """
+        Field jarak ke goal (read-only); dihitung saat pertama kali diminta.
+        flat_list: field datar sebagai list float Python (entri cache
+        terpisah), untuk loop ExpansionKernel yang membaca list lebih cepat
+        daripada skalar NumPy.
+        """
+        key = (tuple(int(v) for v in shape), (int(goal[0]), int(goal[1])), bool(flat_list))
+        field = self._fields.get(key)
+        if field is not None:
+            self._fields.move_to_end(key)
+            self.hits += 1
+            return field
+        self.misses += 1
+        field = goal_distance_field(*key[:2])
+        if flat_list:
+            field = field.ravel().tolist()
+        else:
+            field.flags.writeable = False
+        self._fields[key] = field
+        if len(self._fields) > self.max_entries:
+            self._fields.popitem(last=False)
+        return field
+
+    def clear(self):
+        self._fields.clear()
+
+
+def guideline_heuristic_field(shape, start, goal, cache=None):
+    """
+    h + c untuk a_star_with_guideline: jarak ke goal + guideline cost per
+    sel, dihitung sekali per query sehingga loop cukup satu pembacaan array
+    per neighbor. cache: GoalDistanceCache opsional untuk field jarak ke goal.
+    """
+    distance = cache.get(shape, goal) if cache is not None else goal_distance_field(shape, goal)
+    return distance + guideline_field(shape, start, goal)
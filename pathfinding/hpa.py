@@ -0,0 +1,392 @@
+import heapq
+import math
+
+import numpy as np
+
+from .astar_engine import NEIGHBORS, SQRT2
+from .grid_map import GridMap
+from .tracing import NODE_EXPANDED, PATH_FOUND, get_emitter
+
+# Offset tetangga beserta biayanya untuk relaksasi jarak di dalam cluster
+_STEPS = [(d_row, d_col, SQRT2 if d_row and d_col else 1.0) for d_row, d_col in NEIGHBORS]
+
+# Entrance sepanjang ini atau lebih diwakili dua transisi (di kedua ujung)
+LONG_ENTRANCE = 6
+
+
+class HierarchicalPathfinder:
+    def __init__(self, grid_map, cluster_size=16):
+        """
+        HPA* (Botea dkk.): grid dibagi menjadi cluster cluster_size x
+        cluster_size. Di setiap batas antar cluster, deretan pasangan sel
+        bebas (entrance) diwakili satu atau dua sel transisi. Jarak antar
+        transisi di dalam satu cluster dihitung sekali dan disimpan,
+        sehingga query cukup mencari di graf abstrak lalu memperhalus
+        (refine) hanya segmen yang dipakai jalur.
+
+        Model gerak sama dengan A*: 8 arah, biaya 1 / √2, obstacle = 1.
+        Penyeberangan diagonal antar cluster yang tidak tertutup entrance
+        lurus juga dijadikan transisi, jadi graf abstrak tetap terhubung
+        bila grid terhubung. Jalur hasil HPA* mendekati optimal, tidak
+        selalu optimal.
+
+        Perubahan sel lewat GridMap.set_cells hanya membangun ulang cluster
+        sel tersebut dan tetangganya pada query berikutnya.
+        """
+        self.grid_map = grid_map if isinstance(grid_map, GridMap) else GridMap(grid_map)
+        self.rows, self.cols = self.grid_map.shape
+        self.cluster_size = cluster_size
+        self.cluster_rows = -(-self.rows // cluster_size)
+        self.cluster_cols = -(-self.cols // cluster_size)
+        self.free = np.zeros((self.cluster_rows * cluster_size, self.cluster_cols * cluster_size), dtype=bool)
+        self.free[:self.rows, :self.cols] = self.grid_map.grid != 1
+
+        self.borders = {}  # (cluster_a, cluster_b), a < b -> [(sel_a, sel_b, biaya), ...]
+        self.cluster_nodes = {}  # cluster -> [id sel transisi]
+        self.cluster_dist = {}  # cluster -> matriks jarak (list of list) antar transisi
+        self.inter = {}  # id sel transisi -> [(id sel di cluster lain, biaya)]
+        self.expanded = 0  # Node abstrak yang di-expand pada query terakhir
+        self._pending = []
+
+        clusters = range(self.cluster_rows * self.cluster_cols)
+        for cluster in clusters:
+            for key in self._cluster_border_keys(cluster):
+                if key not in self.borders:
+                    self.borders[key] = self._border_transitions(*key)
+        self._rebuild_clusters(clusters)
+        self.grid_map.subscribe(self._on_cells_changed)
+
+    def close(self):
+        """Berhenti berlangganan perubahan GridMap"""
+        self.grid_map.unsubscribe(self._on_cells_changed)
+
+    @property
+    def node_count(self):
+        return sum(len(nodes) for nodes in self.cluster_nodes.values())
+
+    def _cluster_of(self, cell_id):
+        row, col = divmod(cell_id, self.cols)
+        return (row // self.cluster_size) * self.cluster_cols + col // self.cluster_size
+
+    def _cluster_bounds(self, cluster):
+        """(row_min, col_min, row_max, col_max) eksklusif, dipotong ke ukuran grid"""
+        size = self.cluster_size
+        row, col = divmod(cluster, self.cluster_cols)
+        return row * size, col * size, min((row + 1) * size, self.rows), min((col + 1) * size, self.cols)
+
+    def _cluster_border_keys(self, cluster):
+        """Kunci batas dengan 8 cluster tetangga"""
+        row, col = divmod(cluster, self.cluster_cols)
+        keys = []
+        for d_row, d_col in NEIGHBORS:
+            n_row, n_col = row + d_row, col + d_col
+            if 0 <= n_row < self.cluster_rows and 0 <= n_col < self.cluster_cols:
+                other = n_row * self.cluster_cols + n_col
+                keys.append((min(cluster, other), max(cluster, other)))
+        return keys
+
+    def _border_transitions(self, cluster_a, cluster_b):
+        """Pasangan sel transisi (sel_a, sel_b, biaya) pada batas dua cluster"""
+        free = self.free
+        cols = self.cols
+        size = self.cluster_size
+        a_row, a_col = divmod(cluster_a, self.cluster_cols)
+        b_row, b_col = divmod(cluster_b, self.cluster_cols)
+        row_min, col_min, row_max, col_max = self._cluster_bounds(cluster_a)
+
+        if a_row != b_row and a_col != b_col:
+            # Sudut: satu-satunya penyeberangan adalah langkah diagonal
+            row = row_max - 1
+            if b_col > a_col:
+                cell_a, cell_b = (row, col_max - 1), (row + 1, col_max)
+            else:
+                cell_a, cell_b = (row, col_min), (row + 1, col_min - 1)
+            if free[cell_a] and free[cell_b]:
+                return [(cell_a[0] * cols + cell_a[1], cell_b[0] * cols + cell_b[1], SQRT2)]
+            return []
+
+        if a_row != b_row:
+            # Batas horizontal: baris terakhir a dengan baris pertama b
+            line_a = free[row_max - 1, col_min:col_max].tolist()
+            line_b = free[row_max, col_min:col_max].tolist()
+            to_id_a = lambda index: (row_max - 1) * cols + col_min + index
+            to_id_b = lambda index: row_max * cols + col_min + index
+        else:
+            # Batas vertikal: kolom terakhir a dengan kolom pertama b
+            row_end = min(row_min + size, self.rows)
+            line_a = free[row_min:row_end, col_max - 1].tolist()
+            line_b = free[row_min:row_end, col_max].tolist()
+            to_id_a = lambda index: (row_min + index) * cols + col_max - 1
+            to_id_b = lambda index: (row_min + index) * cols + col_max
+
+        straight = [a and b for a, b in zip(line_a, line_b)]
+        transitions = []
+        index = 0
+        while index < len(straight):
+            if not straight[index]:
+                index += 1
+                continue
+            end = index
+            while end + 1 < len(straight) and straight[end + 1]:
+                end += 1
+            if end - index + 1 >= LONG_ENTRANCE:
+                picks = (index, end)
+            else:
+                picks = ((index + end) // 2,)
+            transitions.extend((to_id_a(pick), to_id_b(pick), 1.0) for pick in picks)
+            index = end + 1
+
+        # Penyeberangan diagonal yang tidak bersebelahan dengan entrance lurus
+        for index in range(len(straight) - 1):
+            if straight[index] or straight[index + 1]:
+                continue
+            if line_a[index] and line_b[index + 1]:
+                transitions.append((to_id_a(index), to_id_b(index + 1), SQRT2))
+            if line_a[index + 1] and line_b[index]:
+                transitions.append((to_id_a(index + 1), to_id_b(index), SQRT2))
+        return transitions
+
+    def _rebuild_clusters(self, clusters):
+        """Menyusun ulang transisi, edge antar cluster dan jarak intra-cluster"""
+        clusters = sorted(set(clusters))
+        for cluster in clusters:
+            for node in self.cluster_nodes.get(cluster, ()):
+                self.inter.pop(node, None)
+
+        for cluster in clusters:
+            nodes = set()
+            for key in self._cluster_border_keys(cluster):
+                for cell_a, cell_b, cost in self.borders[key]:
+                    if key[0] == cluster:
+                        node, other = cell_a, cell_b
+                    else:
+                        node, other = cell_b, cell_a
+                    nodes.add(node)
+                    self.inter.setdefault(node, []).append((other, cost))
+            self.cluster_nodes[cluster] = sorted(nodes)
+
+        distances = _intra_distances(self.free, self.cluster_size, self.cluster_cols, self.cols,
+                                     clusters, [self.cluster_nodes[cluster] for cluster in clusters])
+        for cluster, matrix in zip(clusters, distances):
+            self.cluster_dist[cluster] = matrix
+
+    def _on_cells_changed(self, cells):
+        self._pending.extend((int(row), int(col)) for row, col in cells)
+
+    def _apply_pending(self):
+        """Membangun ulang cluster yang selnya berubah beserta cluster tetangganya"""
+        if not self._pending:
+            return
+        grid = self.grid_map.grid
+        changed = set()
+        for row, col in self._pending:
+            self.free[row, col] = grid[row, col] != 1
+            changed.add(self._cluster_of(row * self.cols + col))
+        self._pending.clear()
+
+        affected = set(changed)
+        for cluster in changed:
+            for key in self._cluster_border_keys(cluster):
+                self.borders[key] = self._border_transitions(*key)
+                affected.update(key)
+        self._rebuild_clusters(affected)
+
+    def _search_cluster(self, cluster, source, target=None):
+        """
+        Dijkstra (atau A* ke target) yang dibatasi di dalam cluster.
+        Mengembalikan (g_score, came_from) dalam bentuk dict id sel.
+        """
+        row_min, col_min, row_max, col_max = self._cluster_bounds(cluster)
+        free = self.free
+        cols = self.cols
+        if target is not None:
+            target_row, target_col = divmod(target, cols)
+        g_score = {source: 0.0}
+        came_from = {}
+        closed = set()
+        open_list = [(0.0, source)]
+        while open_list:
+            _, current = heapq.heappop(open_list)
+            if current in closed:
+                continue
+            if current == target:
+                break
+            closed.add(current)
+            row, col = divmod(current, cols)
+            current_g = g_score[current]
+            for d_row, d_col, cost in _STEPS:
+                n_row = row + d_row
+                n_col = col + d_col
+                if not (row_min <= n_row < row_max and col_min <= n_col < col_max) or not free[n_row, n_col]:
+                    continue
+                neighbor = n_row * cols + n_col
+                tentative_g_score = current_g + cost
+                if tentative_g_score < g_score.get(neighbor, math.inf):
+                    g_score[neighbor] = tentative_g_score
+                    came_from[neighbor] = current
+                    h_score = 0.0 if target is None else math.sqrt((n_row - target_row) ** 2 + (n_col - target_col) ** 2)
+                    heapq.heappush(open_list, (tentative_g_score + h_score, neighbor))
+        return g_score, came_from
+
+    def _refine(self, cluster, source, target):
+        """Jalur sel demi sel dari source ke target di dalam cluster (tanpa source)"""
+        _, came_from = self._search_cluster(cluster, source, target)
+        segment = []
+        current = target
+        while current != source:
+            segment.append(current)
+            current = came_from[current]
+        return segment[::-1]
+
+    def find_path(self, start, goal, tracer=None):
+        """
+        Mencari jalur dari start ke goal lewat graf abstrak.
+        Mengembalikan list koordinat dari start ke goal, atau None.
+        """
+        self._apply_pending()
+        emit = get_emitter(tracer)
+        cols = self.cols
+        if not all(0 <= int(row) < self.rows and 0 <= int(col) < cols for row, col in (start, goal)):
+            raise ValueError("Start or Goal node is outside the grid.")
+        start_id = int(start[0]) * cols + int(start[1])
+        goal_id = int(goal[0]) * cols + int(goal[1])
+        if not self.free[divmod(start_id, cols)] or not self.free[divmod(goal_id, cols)]:
+            return None
+        if start_id == goal_id:
+            return [divmod(start_id, cols)]
+
+        start_cluster = self._cluster_of(start_id)
+        goal_cluster = self._cluster_of(goal_id)
+        start_g, _ = self._search_cluster(start_cluster, start_id)
+        goal_g, _ = self._search_cluster(goal_cluster, goal_id)
+        goal_row, goal_col = divmod(goal_id, cols)
+
+        # A* pada graf abstrak; start dan goal disisipkan sementara
+        g_score = {start_id: 0.0}
+        came_from = {}
+        closed = set()
+        open_list = [(0.0, start_id)]
+        best_cost = start_g.get(goal_id, math.inf) if start_cluster == goal_cluster else math.inf
+        expanded = 0
+        while open_list:
+            f_score, current = heapq.heappop(open_list)
+            if f_score >= best_cost:
+                break
+            if current in closed:
+                continue
+            if current == goal_id:
+                break
+            closed.add(current)
+            expanded += 1
+            current_g = g_score[current]
+            if emit is not None:
+                emit(NODE_EXPANDED, divmod(current, cols), current_g, f_score)
+
+            if current == start_id:
+                edges = [(node, start_g[node]) for node in self.cluster_nodes[start_cluster] if node in start_g]
+                edges += self.inter.get(current, [])
+            else:
+                cluster = self._cluster_of(current)
+                nodes = self.cluster_nodes[cluster]
+                row = self.cluster_dist[cluster][nodes.index(current)]
+                edges = list(zip(nodes, row)) + self.inter.get(current, [])
+                if current in goal_g and cluster == goal_cluster:
+                    edges.append((goal_id, goal_g[current]))
+
+            for neighbor, cost in edges:
+                if neighbor in closed or cost == math.inf:
+                    continue
+                tentative_g_score = current_g + cost
+                if tentative_g_score < g_score.get(neighbor, math.inf):
+                    g_score[neighbor] = tentative_g_score
+                    came_from[neighbor] = current
+                    n_row, n_col = divmod(neighbor, cols)
+                    h_score = math.sqrt((n_row - goal_row) ** 2 + (n_col - goal_col) ** 2)
+                    heapq.heappush(open_list, (tentative_g_score + h_score, neighbor))
+        self.expanded = expanded
+
+        abstract_cost = g_score.get(goal_id, math.inf)
+        if abstract_cost == math.inf and best_cost == math.inf:
+            return None
+        if emit is not None:
+            emit(PATH_FOUND, divmod(goal_id, cols), min(abstract_cost, best_cost), min(abstract_cost, best_cost))
+        if best_cost <= abstract_cost:
+            # Jalur langsung di dalam satu cluster lebih murah
+            return [divmod(start_id, cols)] + [divmod(cell, cols) for cell in self._refine(start_cluster, start_id, goal_id)]
+
+        abstract_path = [goal_id]
+        while abstract_path[-1] != start_id:
+            abstract_path.append(came_from[abstract_path[-1]])
+        abstract_path.reverse()
+
+        # Refinement: segmen intra-cluster dicari ulang, edge antar cluster satu langkah
+        path = [start_id]
+        for source, target in zip(abstract_path, abstract_path[1:]):
+            source_cluster = self._cluster_of(source)
+            if source_cluster == self._cluster_of(target):
+                path.extend(self._refine(source_cluster, source, target))
+            else:
+                path.append(target)
+        return [divmod(cell, cols) for cell in path]
+
+
+def _relax(distance, free):
+    """
+    Relaksasi Jacobi 8-arah pada tumpukan cluster sampai tidak ada yang
+    berubah. Cluster yang sudah stabil dikeluarkan dari iterasi berikutnya.
+    """
+    active = np.arange(len(distance))
+    while active.size:
+        current = distance[active]
+        updated = current.copy()
+        for d_row, d_col, cost in _STEPS:
+            # updated[r, c] = min(updated[r, c], current[r - d_row, c - d_col] + cost)
+            target_rows = slice(max(d_row, 0), updated.shape[1] + min(d_row, 0))
+            target_cols = slice(max(d_col, 0), updated.shape[2] + min(d_col, 0))
+            source_rows = slice(max(-d_row, 0), updated.shape[1] + min(-d_row, 0))
+            source_cols = slice(max(-d_col, 0), updated.shape[2] + min(-d_col, 0))
+            np.minimum(updated[:, target_rows, target_cols], current[:, source_rows, source_cols] + cost,
+                       out=updated[:, target_rows, target_cols])
+        updated[~free[active]] = np.inf
+        distance[active] = updated
+        active = active[(updated < current).any(axis=(1, 2))]
+
+
+def _intra_distances(free, cluster_size, cluster_cols, cols, clusters, cluster_nodes):
+    """
+    Matriks jarak antar transisi untuk setiap cluster. Semua cluster
+    diproses bersamaan per slot sumber dengan operasi NumPy.
+    """
+    count = len(clusters)
+    slots = max((len(nodes) for nodes in cluster_nodes), default=0)
+    if count == 0 or slots == 0:
+        return [[] for _ in clusters]
+
+    clusters = np.asarray(clusters)
+    block_rows, block_cols = np.divmod(clusters, cluster_cols)
+    offsets = np.arange(cluster_size)
+    rows_index = block_rows[:, None, None] * cluster_size + offsets[None, :, None]
+    cols_index = block_cols[:, None, None] * cluster_size + offsets[None, None, :]
+    blocks = free[rows_index, cols_index]  # (count, size, size)
+
+    # Koordinat lokal transisi, diisi -1 untuk slot kosong
+    local_rows = np.zeros((count, slots), dtype=np.int64)
+    local_cols = np.zeros((count, slots), dtype=np.int64)
+    valid = np.zeros((count, slots), dtype=bool)
+    for index, nodes in enumerate(cluster_nodes):
+        if nodes:
+            node_rows, node_cols = np.divmod(np.asarray(nodes), cols)
+            local_rows[index, :len(nodes)] = node_rows - block_rows[index] * cluster_size
+            local_cols[index, :len(nodes)] = node_cols - block_cols[index] * cluster_size
+            valid[index, :len(nodes)] = True
+
+    result = np.full((count, slots, slots), np.inf, dtype=np.float32)
+    for slot in range(slots):
+        members = np.flatnonzero(valid[:, slot])
+        distance = np.full((len(members), cluster_size, cluster_size), np.inf, dtype=np.float32)
+        distance[np.arange(len(members)), local_rows[members, slot], local_cols[members, slot]] = 0.0
+        _relax(distance, blocks[members])
+        result[members, slot] = distance[np.arange(len(members))[:, None], local_rows[members], local_cols[members]]
+
+    return [result[index, :len(nodes), :len(nodes)].astype(np.float64).tolist()
+            for index, nodes in enumerate(cluster_nodes)]
@@ -0,0 +1,320 @@
+import heapq
+import math
+import time
+
+import numpy as np
+
+from .astar_engine import SQRT2, ArrayAStarPathfinder
+from .packed_grid import PackedGrid, highest_bit, line_masks, lowest_bit
+from .tracing import NODE_EXPANDED, NODE_OPENED, PATH_FOUND, get_emitter
+
+
+class JumpPointPathfinder(ArrayAStarPathfinder):
+    use_kernel = False  # Lompatan berjalan pada mask padded sendiri (self.free)
+
+    def __init__(self, grid, precompute=False, packed=False, clearance=None, safety_margin=0.0, field_cache=None):
+        """
+        Jump Point Search pada model grid yang sama dengan AStarPathfinder
+        (8 arah, biaya 1 / √2, diagonal boleh melewati sudut obstacle).
+
+        Pencarian berjalan pada indeks grid yang diberi bingkai obstacle
+        selebar satu sel (padded), sehingga lompatan tidak perlu memeriksa
+        batas grid. Heap hanya berisi jump point; jalur yang dikembalikan
+        tetap berisi setiap sel dari start ke goal.
+
+        precompute: jika True, jarak lompatan lurus (4 arah) tiap sel
+        dihitung sekali di awal (JPS+), cocok untuk peta statis.
+        packed: lompatan lurus memakai operasi word pada mask bit per
+        baris/kolom, sehingga satu lompatan tidak lagi berjalan sel demi sel.
+        clearance, safety_margin: sama seperti ArrayAStarPathfinder; sel di
+            dalam margin menjadi obstacle pada mask lompatan.
+            clearance_weight tidak didukung karena JPS membutuhkan biaya
+            langkah seragam (pakai variant "astar").
+        field_cache: sama seperti ArrayAStarPathfinder (dibaca per jump point).
+        """
+        super().__init__(grid, clearance=clearance, safety_margin=safety_margin, field_cache=field_cache)
+        self.width = self.cols + 2
+        padded = np.zeros((self.rows + 2, self.cols + 2), dtype=bool)
+        passable = self.passable
+        padded[1:-1, 1:-1] = passable.to_array() if isinstance(passable, PackedGrid) else passable.reshape(self.rows, self.cols)
+        self.free = bytearray(padded.tobytes())
+        self.jump_table = _build_jump_table(padded) if precompute else None
+        self.line_masks = _build_line_masks(padded, self.width) if packed else None
+
+    def _to_padded(self, node):
+        return (node[0] + 1) * self.width + node[1] + 1
+
+    def _padded_to_node(self, p):
+        row, col = divmod(p, self.width)
+        return row - 1, col - 1
+
+    def _jump_straight(self, p, s, o, goal_p):
+        """Melompat lurus dengan langkah s (o = offset tegak lurus)"""
+        free = self.free
+        if self.jump_table is not None:
+            distance = self.jump_table[s][p]
+            reach = distance if distance > 0 else -distance
+            # Goal yang berada di lintasan lompatan dicek tersendiri
+            delta = goal_p - p
+            if s == 1 or s == -1:
+                on_line = goal_p // self.width == p // self.width
+            else:
+                on_line = delta % s == 0
+            if on_line and 0 < delta // s <= reach:
+                return goal_p
+            return p + distance * s if distance > 0 else -1
+        if self.line_masks is not None:
+            return self._jump_straight_packed(p, s, goal_p)
+
+        while True:
+            p += s
+            if not free[p]:
+                return -1
+            if p == goal_p:
+                return p
+            if (not free[p + o] and free[p + o + s]) or (not free[p - o] and free[p - o + s]):
+                return p
+
+    def _jump_straight_packed(self, p, s, goal_p):
+        """
+        Lompatan lurus dengan mask bit satu baris (s = ±1) atau satu kolom
+        (s = ±width): jump point adalah bit forced/goal pertama sebelum
+        obstacle pertama searah s.
+        """
+        free_lines, forced_lines = self.line_masks[s]
+        if s == 1 or s == -1:
+            line, position = divmod(p, self.width)
+            goal_line, goal_position = divmod(goal_p, self.width)
+        else:
+            position, line = divmod(p, self.width)
+            goal_position, goal_line = divmod(goal_p, self.width)
+        candidates = forced_lines[line]
+        if goal_line == line:
+            candidates |= 1 << goal_position
+        blocked = ~free_lines[line]
+
+        if s > 0:
+            reach = lowest_bit(blocked >> (position + 1))  # Jumlah sel bebas di depan
+            ahead = (candidates >> (position + 1)) & ((1 << reach) - 1)
+            return p + (lowest_bit(ahead) + 1) * s if ahead else -1
+        behind_mask = (1 << position) - 1
+        wall = highest_bit(blocked & behind_mask)  # Bingkai padded menjamin ada obstacle
+        behind = (candidates & behind_mask) >> (wall + 1)
+        return p + (position - wall - 1 - highest_bit(behind)) * s if behind else -1
+
+    def _jump_diagonal(self, p, sv, sh, goal_p):
+        """Melompat diagonal dengan komponen vertikal sv dan horizontal sh"""
+        free = self.free
+        s = sv + sh
+        while True:
+            p += s
+            if not free[p]:
+                return -1
+            if p == goal_p:
+                return p
+            if (not free[p - sh] and free[p - sh + sv]) or (not free[p - sv] and free[p - sv + sh]):
+                return p
+            # Berhenti jika salah satu lompatan lurus menemukan jump point
+            if self._jump_straight(p, sv, 1, goal_p) >= 0 or self._jump_straight(p, sh, self.width, goal_p) >= 0:
+                return p
+
+    def _successor_directions(self, p, parent_p):
+        """Arah (d_row, d_col) yang tersisa setelah pruning JPS"""
+        if parent_p < 0:
+            return [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+        free = self.free
+        width = self.width
+        row, col = divmod(p, width)
+        parent_row, parent_col = divmod(parent_p, width)
+        d_row = (row > parent_row) - (row < parent_row)
+        d_col = (col > parent_col) - (col < parent_col)
+
+        if d_row and d_col:
+            directions = [(d_row, 0), (0, d_col), (d_row, d_col)]
+            if not free[p - d_col]:
+                directions.append((d_row, -d_col))
+            if not free[p - d_row * width]:
+                directions.append((-d_row, d_col))
+        elif d_row:
+            directions = [(d_row, 0)]
+            if not free[p + 1]:
+                directions.append((d_row, 1))
+            if not free[p - 1]:
+                directions.append((d_row, -1))
+        else:
+            directions = [(0, d_col)]
+            if not free[p + width]:
+                directions.append((1, d_col))
+            if not free[p - width]:
+                directions.append((-1, d_col))
+        return directions
+
+    def find_path(self, start=None, goal=None, tracer=None, stats=None):
+        """
+        Mencari jalur dari start ke goal dengan Jump Point Search.
+        Parameter dan hasil sama dengan ArrayAStarPathfinder.find_path.
+        """
+        start, goal = self._endpoints(start, goal)
+        if not self._open_endpoints(self.to_id(start), self.to_id(goal))[0]:
+            return None
+
+        self._reset_state()
+        emit = get_emitter(tracer)
+        width = self.width
+        g_score = self.g_score
+        came_from = self.came_from
+        closed = self.closed
+        touched = self._touched
+        goal_row, goal_col = goal
+        goal_p = self._to_padded(goal)
+        distances = self._goal_distances(goal)
+
+        start_p = self._to_padded(start)
+        start_id = self.to_id(start)
+        g_score[start_id] = 0.0
+        touched.append(start_id)
+        open_list = [(0, start_id, start_p)]
+        heap_peak = 0
+        timing = stats is not None  # Waktu heuristik hanya diukur jika stats diminta
+        heuristic_time = 0.0
+        search_begin = time.perf_counter()
+
+        while open_list:
+            if stats is not None and len(open_list) > heap_peak:
+                heap_peak = len(open_list)
+            f_score, current_id, p = heapq.heappop(open_list)
+            if closed[current_id]:
+                continue  # Entri basi (lazy deletion)
+
+            if p == goal_p:
+                if emit is not None:
+                    emit(PATH_FOUND, goal, float(g_score[current_id]), float(g_score[current_id]))
+                return self._finish(stats, start_id, current_id, open_list, heap_peak, search_begin, heuristic_time)
+
+            closed[current_id] = True
+            current_g = float(g_score[current_id])
+            parent_id = int(came_from[current_id])
+            parent_p = self._to_padded(self.to_node(parent_id)) if parent_id >= 0 else -1
+            if emit is not None:
+                emit(NODE_EXPANDED, self._padded_to_node(p), current_g, f_score)
+
+            for d_row, d_col in self._successor_directions(p, parent_p):
+                if d_row and d_col:
+                    jump_p = self._jump_diagonal(p, d_row * width, d_col, goal_p)
+                elif d_row:
+                    jump_p = self._jump_straight(p, d_row * width, 1, goal_p)
+                else:
+                    jump_p = self._jump_straight(p, d_col, width, goal_p)
+                if jump_p < 0:
+                    continue
+
+                n_row, n_col = self._padded_to_node(jump_p)
+                neighbor_id = n_row * self.cols + n_col
+                if closed[neighbor_id]:
+                    continue
+
+                steps = max(abs(jump_p // width - p // width), abs(jump_p % width - p % width))
+                tentative_g_score = current_g + steps * (SQRT2 if d_row and d_col else 1.0)
+                if tentative_g_score < g_score[neighbor_id]:
+                    came_from[neighbor_id] = current_id
+                    g_score[neighbor_id] = tentative_g_score
+                    touched.append(neighbor_id)
+                    if timing:
+                        h_begin = time.perf_counter()
+                    if distances is not None:
+                        h_score = distances[neighbor_id]
+                    else:
+                        h_score = math.sqrt((n_row - goal_row) ** 2 + (n_col - goal_col) ** 2)
+                    if timing:
+                        heuristic_time += time.perf_counter() - h_begin
+                    heapq.heappush(open_list, (tentative_g_score + h_score, neighbor_id, jump_p))
+                    if emit is not None:
+                        emit(NODE_OPENED, (n_row, n_col), tentative_g_score, tentative_g_score + h_score)
+
+        return self._finish(stats, start_id, None, open_list, heap_peak, search_begin, heuristic_time)
+
+    def _reconstruct_path(self, start_id, goal_id):
+        """Jalur sel demi sel: jump point dari array parent lalu diisi sel di antaranya"""
+        return _expand_jump_points(super()._reconstruct_path(start_id, goal_id))
+
+
+def _expand_jump_points(jump_points):
+    """Mengisi sel di antara jump point berurutan (selalu lurus atau diagonal)"""
+    path = [jump_points[0]]
+    for (row, col), (next_row, next_col) in zip(jump_points, jump_points[1:]):
+        d_row = (next_row > row) - (next_row < row)
+        d_col = (next_col > col) - (next_col < col)
+        while (row, col) != (next_row, next_col):
+            row += d_row
+            col += d_col
+            path.append((row, col))
+    return path
+
+
+def _next_index(mask):
+    """Untuk tiap sel, kolom terkecil j > kolom sel dengan mask True (atau lebar baris)"""
+    cols = mask.shape[1]
+    index = np.where(mask, np.arange(cols), cols)
+    suffix_min = np.minimum.accumulate(index[:, ::-1], axis=1)[:, ::-1]
+    result = np.full_like(index, cols)
+    result[:, :-1] = suffix_min[:, 1:]
+    return result
+
+
+def _jump_distances_right(free):
+    """
+    Tabel JPS+ untuk arah kanan pada grid padded: k > 0 berarti jump point
+    k sel di kanan, k <= 0 berarti -k sel bebas sebelum obstacle.
+    """
+    forced = np.zeros_like(free)
+    forced[1:-1, :-1] = free[1:-1, :-1] & (
+        (~free[:-2, :-1] & free[:-2, 1:]) | (~free[2:, :-1] & free[2:, 1:])
+    )
+    next_forced = _next_index(forced)
+    next_wall = _next_index(~free)
+    cols = np.arange(free.shape[1])
+    distances = np.where(next_forced < next_wall, next_forced - cols, -(next_wall - cols - 1))
+    return distances.astype(np.int32)
+
+
+def _forced_masks(free_lines, shift):
+    """
+    Bit forced untuk gerak lurus sepanjang setiap garis: sel c forced jika
+    tetangga samping c terhalang tetapi tetangga samping c + arah bebas.
+    shift = 1 untuk arah naik indeks, -1 untuk arah turun.
+    """
+    forced = [0] * len(free_lines)
+    for line in range(1, len(free_lines) - 1):
+        mask = 0
+        for side in (free_lines[line - 1], free_lines[line + 1]):
+            mask |= ~side & (side >> 1 if shift > 0 else side << 1)
+        forced[line] = mask
+    return forced
+
+
+def _build_line_masks(free, width):
+    """Mask bebas dan forced per baris/kolom grid padded, diindeks dengan langkah padded"""
+    rows = line_masks(free)
+    cols = line_masks(free.T)
+    return {
+        1: (rows, _forced_masks(rows, 1)),
+        -1: (rows, _forced_masks(rows, -1)),
+        width: (cols, _forced_masks(cols, 1)),
+        -width: (cols, _forced_masks(cols, -1)),
+    }
+
+
+def _build_jump_table(free):
+    """Jarak lompatan lurus untuk keempat arah, diindeks dengan langkah padded"""
+    width = free.shape[1]
+    right = _jump_distances_right(free)
+    left = _jump_distances_right(free[:, ::-1])[:, ::-1]
+    down = _jump_distances_right(free.T).T
+    up = _jump_distances_right(free[::-1].T).T[::-1]
+    return {
+        1: memoryview(np.ascontiguousarray(right).ravel()),
+        -1: memoryview(np.ascontiguousarray(left).ravel()),
+        width: memoryview(np.ascontiguousarray(down).ravel()),
+        -width: memoryview(np.ascontiguousarray(up).ravel()),
+    }
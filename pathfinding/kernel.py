@@ -0,0 +1,144 @@
+import math
+import sys
+
+import numpy as np
+
+# Offset tetangga dengan urutan yang sama seperti AStarPathfinder.neighbors
+NEIGHBORS = [
+    (-1, 0),  # Atas
+    (1, 0),   # Bawah
+    (0, -1),  # Kiri
+    (0, 1),   # Kanan
+    (-1, -1), # Diagonal kiri atas
+    (-1, 1),  # Diagonal kanan atas
+    (1, -1),  # Diagonal kiri bawah
+    (1, 1)    # Diagonal kanan bawah
+]
+
+SQRT2 = math.sqrt(2)
+
+# Nilai g untuk obstacle, bingkai dan node yang sudah di-expand: g baru
+# (selalu >= 0) tidak pernah lebih kecil, jadi sel itu otomatis dilewati
+CLOSED = -1.0
+
+
+class ExpansionKernel:
+    def __init__(self, grid, passable=None):
+        """
+        Kernel ekspansi 8-arah untuk peta padat, dipakai oleh
+        ArrayAStarPathfinder (dan variannya) serta DistanceField.
+
+        Grid diberi bingkai obstacle selebar satu sel (padded) dan setiap
+        sel diberi id datar p = (row + 1) * width + (col + 1), sehingga
+        tetangga cukup p + offset tanpa pemeriksaan batas. offsets berisi
+        (offset id, d_row, d_col, biaya) dengan biaya konstan 1 / √2 dan
+        urutan yang sama seperti NEIGHBORS.
+
+        template berisi g awal setiap sel: inf untuk sel bebas, CLOSED untuk
+        obstacle dan bingkai (dua objek float yang dipakai bersama, jadi
+        template hanya 8 byte per sel). State disimpan dalam list Python
+        karena akses skalar list jauh lebih murah daripada elemen array
+        NumPy.
+
+        passable: mask bool (rows, cols) opsional, mis. dengan safety_margin
+            sudah diterapkan; default grid != 1.
+        """
+        passable = np.asarray(grid) != 1 if passable is None else np.asarray(passable, dtype=bool)
+        self.rows, self.cols = passable.shape
+        self.width = self.cols + 2
+        padded = np.zeros((self.rows + 2, self.width), dtype=bool)
+        padded[1:-1, 1:-1] = passable
+        self.size = padded.size
+        values = (CLOSED, math.inf)
+        self.template = [values[free] for free in padded.ravel().tolist()]
+        self.no_parent = [-1] * self.size
+        self.offsets = tuple(
+            (d_row * self.width + d_col, d_row, d_col, SQRT2 if d_row and d_col else 1.0)
+            for d_row, d_col in NEIGHBORS
+        )
+
+    def to_padded(self, node):
+        return (int(node[0]) + 1) * self.width + int(node[1]) + 1
+
+    def to_node(self, p):
+        row, col = divmod(p, self.width)
+        return row - 1, col - 1
+
+    def new_state(self):
+        return KernelState(self)
+
+    def path(self, parent, start_p, goal_p):
+        """Jalur (row, col) dari start ke goal lewat list parent"""
+        width = self.width
+        path = []
+        current = goal_p
+        while current != start_p:
+            row, col = divmod(current, width)
+            path.append((row - 1, col - 1))
+            current = parent[current]
+        row, col = divmod(start_p, width)
+        path.append((row - 1, col - 1))
+        return path[::-1]
+
+
+class KernelState:
+    def __init__(self, kernel):
+        """
+        State satu arah pencarian di atas ExpansionKernel: g, parent dan
+        closed per id padded. Reset hanya mengembalikan sel yang disentuh,
+        atau menyalin ulang template jika yang disentuh banyak. parent ikut
+        di-reset agar objek int query sebelumnya tidak tertahan.
+        """
+        self.template = kernel.template
+        self.no_parent = kernel.no_parent
+        self.g = list(kernel.template)
+        self.parent = list(kernel.no_parent)
+        self.closed = bytearray(kernel.size)  # Hanya dipakai bidirectional
+        self.touched = []
+
+    def reset(self):
+        touched = self.touched
+        if not touched:
+            return
+        g, parent, closed, template = self.g, self.parent, self.closed, self.template
+        if len(touched) > len(g) // 8:
+            g[:] = template
+            parent[:] = self.no_parent
+            closed[:] = bytes(len(closed))
+        else:
+            for p in touched:
+                g[p] = template[p]
+                parent[p] = -1
+                closed[p] = 0
+        touched.clear()
+
+    def visited(self):
+        """Jumlah node yang punya state (g/parent) pada query terakhir"""
+        return len(set(self.touched))
+
+    def expanded(self):
+        """Jumlah node yang di-expand pada query terakhir"""
+        g, closed = self.g, self.closed
+        return sum(1 for p in set(self.touched) if g[p] == CLOSED or closed[p])
+
+    @property
+    def nbytes(self):
+        """
+        Footprint nyata state: array pointer list g dan parent, bytearray
+        closed, ditambah objek float (g) dan int (parent) yang dibuat untuk
+        sel yang disentuh query terakhir. Nilai template dan int kecil yang
+        di-cache interpreter dipakai bersama sehingga tidak dihitung;
+        template dan no_parent milik ExpansionKernel (masing-masing 8 byte
+        per sel, dipakai bersama semua state) juga tidak.
+        """
+        g, parent, template = self.g, self.parent, self.template
+        objects = {}
+        for p in set(self.touched):
+            if g[p] is not template[p] and g[p] is not CLOSED:
+                objects[id(g[p])] = g[p]
+            if not -5 <= parent[p] <= 256:
+                objects[id(parent[p])] = parent[p]
+        return (
+            sys.getsizeof(g) + sys.getsizeof(parent) + sys.getsizeof(self.closed)
+            + sum(sys.getsizeof(value) for value in objects.values())
+        )
@@ -0,0 +1,195 @@
+import mmap
+from collections import OrderedDict
+
+import numpy as np
+
+MAP_MAGIC = b"PFMAP001"
+FORMAT_VERSION = 1
+# Header berukuran tetap; data sel dimulai di HEADER_SIZE agar selaras
+HEADER_SIZE = 64
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u2"),
+    ("encoding", "<u2"),
+    ("rows", "<u8"),
+    ("cols", "<u8"),
+    ("tile_rows", "<u4"),
+    ("tile_cols", "<u4"),
+])
+
+# uint8: nilai sel apa adanya (0-255); bits: 1 bit per sel, 1 = obstacle
+ENCODINGS = {"uint8": 0, "bits": 1}
+ENCODING_NAMES = {code: name for name, code in ENCODINGS.items()}
+
+
+def _tile_nbytes(encoding, tile_rows, tile_cols):
+    cells = tile_rows * tile_cols
+    return cells if encoding == "uint8" else (cells + 7) // 8
+
+
+def save_map(file_path, grid, encoding="uint8", tile_shape=None):
+    """
+    Menyimpan grid ke format biner peta: header 64 byte lalu data sel per
+    tile (urutan baris tile). Tanpa tile_shape seluruh peta menjadi satu
+    tile. Tile di tepi diisi obstacle sampai ukuran penuh.
+
+    grid boleh berupa np.memmap; data dibaca per pita tile sehingga peta
+    besar tidak perlu dimuat seluruhnya.
+    encoding: "uint8" (nilai sel utuh, termasuk 2/3) atau "bits"
+        (hanya status obstacle, 8x lebih kecil)
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown encoding '{encoding}', expected one of {sorted(ENCODINGS)}")
+    rows, cols = grid.shape
+    tile_rows, tile_cols = tile_shape if tile_shape is not None else (rows, cols)
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header[0] = (MAP_MAGIC, FORMAT_VERSION, ENCODINGS[encoding], rows, cols, tile_rows, tile_cols)
+
+    with open(file_path, "wb") as file:
+        file.write(header.tobytes().ljust(HEADER_SIZE, b"\0"))
+        for row in range(0, rows, tile_rows):
+            band = np.asarray(grid[row:row + tile_rows])
+            for col in range(0, cols, tile_cols):
+                tile = np.ones((tile_rows, tile_cols), dtype=np.uint8)
+                block = band[:, col:col + tile_cols]
+                tile[:block.shape[0], :block.shape[1]] = block
+                if encoding == "bits":
+                    tile = np.packbits(tile == 1)
+                file.write(tile.tobytes())
+
+
+class MapFile:
+    def __init__(self, file_path, cache_tiles=64):
+        """
+        Membuka peta biner lewat mmap. Tidak ada data sel yang dibaca
+        sampai tile-nya diminta; tile yang sudah di-decode disimpan dalam
+        cache LRU berisi paling banyak cache_tiles tile.
+        """
+        header = np.fromfile(file_path, dtype=HEADER_DTYPE, count=1)
+        if header.size == 0 or header[0]["magic"] != MAP_MAGIC:
+            raise ValueError(f"'{file_path}' is not a map file")
+        header = header[0]
+        if header["version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported map format version {header['version']}")
+
+        self.file_path = file_path
+        self.encoding = ENCODING_NAMES[int(header["encoding"])]
+        self.rows, self.cols = int(header["rows"]), int(header["cols"])
+        self.tile_rows, self.tile_cols = int(header["tile_rows"]), int(header["tile_cols"])
+        self.tile_grid = (-(-self.rows // self.tile_rows), -(-self.cols // self.tile_cols))
+        tile_count = self.tile_grid[0] * self.tile_grid[1]
+        tile_nbytes = _tile_nbytes(self.encoding, self.tile_rows, self.tile_cols)
+        with open(file_path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.tiles = np.frombuffer(
+            self._mmap, dtype=np.uint8, count=tile_count * tile_nbytes, offset=HEADER_SIZE,
+        ).reshape(tile_count, tile_nbytes)
+        self.cache_tiles = cache_tiles
+        self._cache = OrderedDict()
+        self.tile_loads = 0  # Jumlah tile yang di-decode dari disk
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def closed(self):
+        return self._mmap is None
+
+    def close(self):
+        """Melepas mapping file; tile yang sudah dikembalikan tetap bisa dipakai (berupa salinan)"""
+        if self._mmap is None:
+            return
+        self._cache.clear()
+        self.tiles = None  # View ke mmap harus dilepas sebelum mmap ditutup
+        self._mmap.close()
+        self._mmap = None
+
+    def tile(self, tile_row, tile_col):
+        """Isi satu tile (tile_rows, tile_cols) uint8; tile tepi berisi obstacle di luar peta"""
+        if self._mmap is None:
+            raise ValueError(f"Map file '{self.file_path}' is closed")
+        index = tile_row * self.tile_grid[1] + tile_col
+        tile = self._cache.get(index)
+        if tile is not None:
+            self._cache.move_to_end(index)
+            return tile
+        data = self.tiles[index]
+        if self.encoding == "bits":
+            tile = np.unpackbits(data, count=self.tile_rows * self.tile_cols)
+        else:
+            tile = np.array(data)
+        tile = tile.reshape(self.tile_rows, self.tile_cols)
+        tile.flags.writeable = False
+        self.tile_loads += 1
+        self._cache[index] = tile
+        if len(self._cache) > self.cache_tiles:
+            self._cache.popitem(last=False)
+        return tile
+
+    def read_region(self, row_min, col_min, row_max, col_max):
+        """Sub-grid [row_min:row_max, col_min:col_max], hanya tile yang beririsan yang dibaca"""
+        row_min, col_min = max(row_min, 0), max(col_min, 0)
+        row_max, col_max = min(row_max, self.rows), min(col_max, self.cols)
+        region = np.empty((max(row_max - row_min, 0), max(col_max - col_min, 0)), dtype=np.uint8)
+        for tile_row in range(row_min // self.tile_rows, -(-row_max // self.tile_rows)):
+            for tile_col in range(col_min // self.tile_cols, -(-col_max // self.tile_cols)):
+                top, left = tile_row * self.tile_rows, tile_col * self.tile_cols
+                r0, r1 = max(row_min, top), min(row_max, top + self.tile_rows)
+                c0, c1 = max(col_min, left), min(col_max, left + self.tile_cols)
+                region[r0 - row_min:r1 - row_min, c0 - col_min:c1 - col_min] = (
+                    self.tile(tile_row, tile_col)[r0 - top:r1 - top, c0 - left:c1 - left]
+                )
+        return region
+
+    def read(self):
+        """Seluruh peta sebagai array uint8 (membaca semua tile)"""
+        return self.read_region(0, 0, self.rows, self.cols)
+
+    def passable(self):
+        """Mask passable datar yang memuat tile hanya saat selnya diakses"""
+        return LazyPassability(self)
+
+
+class LazyPassability:
+    def __init__(self, map_file):
+        """
+        Pengganti mask passable datar untuk engine: passable[id] memuat
+        tile yang memuat sel id saat pertama kali diakses. Tile yang sudah
+        disentuh disimpan sebagai mask bool (1 byte per sel).
+        """
+        self.map_file = map_file
+        self.cols = map_file.cols
+        self.size = map_file.rows * map_file.cols
+        self._tiles = {}  # indeks tile -> mask passable datar
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def tiles_loaded(self):
+        return len(self._tiles)
+
+    def __getitem__(self, node_id):
+        map_file = self.map_file
+        row, col = divmod(int(node_id), self.cols)
+        tile_row, local_row = divmod(row, map_file.tile_rows)
+        tile_col, local_col = divmod(col, map_file.tile_cols)
+        index = tile_row * map_file.tile_grid[1] + tile_col
+        mask = self._tiles.get(index)
+        if mask is None:
+            mask = (map_file.tile(tile_row, tile_col) != 1).ravel()
+            self._tiles[index] = mask
+        return mask[local_row * map_file.tile_cols + local_col]
+
+
+def load_map(file_path):
+    """Membaca seluruh file peta menjadi array uint8 di memori"""
+    with MapFile(file_path) as map_file:
+        return map_file.read()
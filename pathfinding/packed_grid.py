@@ -0,0 +1,108 @@
+import numpy as np
+
+
+class PackedGrid:
+    def __init__(self, grid=None, mask=None):
+        """
+        Mask passable dengan 1 bit per sel (bit 1 = bisa dilalui), 8x lebih
+        kecil dari mask bool dan 64x lebih kecil dari grid int64.
+
+        Bit disusun datar mengikuti id sel (row * cols + col, urutan bit
+        little-endian), sehingga engine bisa memakainya langsung sebagai
+        pengganti mask passable: passable[id]. PackedGrid juga bisa
+        diberikan sebagai grid engine (seperti MapFile); karena tidak
+        menyimpan sel 2/3, start dan goal harus diberikan ke find_path.
+
+        grid: grid 2D (obstacle = 1), atau
+        mask: mask passable bool 2D yang sudah jadi
+        """
+        if mask is None:
+            mask = np.asarray(grid) != 1
+        mask = np.asarray(mask, dtype=bool)
+        self.rows, self.cols = mask.shape
+        self.size = self.rows * self.cols
+        self.bits = bytearray(np.packbits(mask.ravel(), bitorder="little").tobytes())
+
+    @property
+    def nbytes(self):
+        return len(self.bits)
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, node_id):
+        return self.bits[node_id >> 3] >> (node_id & 7) & 1
+
+    def passable(self):
+        """PackedGrid sudah berupa mask passable (lihat ArrayAStarPathfinder._build_passable)"""
+        return self
+
+    def set_cell(self, cell, passable):
+        node_id = int(cell[0]) * self.cols + int(cell[1])
+        if passable:
+            self.bits[node_id >> 3] |= 1 << (node_id & 7)
+        else:
+            self.bits[node_id >> 3] &= ~(1 << (node_id & 7)) & 0xFF
+
+    def to_array(self):
+        """Mask passable bool (rows, cols)"""
+        flat = np.unpackbits(np.frombuffer(bytes(self.bits), dtype=np.uint8), count=self.size, bitorder="little")
+        return flat.reshape(self.rows, self.cols).astype(bool)
+
+    def read(self):
+        """Grid uint8 (rows, cols) dengan 0 = bebas, 1 = obstacle (seperti MapFile.read)"""
+        return (~self.to_array()).astype(np.uint8)
+
+    def row_mask(self, row):
+        """Satu baris sebagai int Python: bit col = 1 jika sel bebas"""
+        start = row * self.cols
+        end = start + self.cols
+        chunk = int.from_bytes(self.bits[start >> 3:(end + 7) >> 3], "little")
+        return (chunk >> (start & 7)) & ((1 << self.cols) - 1)
+
+    def row_words(self):
+        """Semua baris sebagai array uint64 (rows, ceil(cols / 64)) untuk operasi word vektor"""
+        return pack_rows(self.to_array())
+
+    def next_blocked(self, row, col, step=1):
+        """
+        Kolom obstacle pertama dari col (eksklusif) searah step (+1/-1)
+        pada baris row, atau -1 / cols jika tidak ada. Dihitung dengan
+        operasi word, bukan per sel.
+        """
+        blocked = ~self.row_mask(row) & ((1 << self.cols) - 1)
+        if step > 0:
+            ahead = blocked >> (col + 1)
+            return col + 1 + lowest_bit(ahead) if ahead else self.cols
+        behind = blocked & ((1 << col) - 1)
+        return highest_bit(behind) if behind else -1
+
+
+def pack_rows(mask):
+    """Mask bool 2D -> array uint64 (rows, words); bit col % 64 dari word col // 64"""
+    mask = np.asarray(mask, dtype=bool)
+    rows, cols = mask.shape
+    words = -(-cols // 64)
+    padded = np.zeros((rows, words * 64), dtype=bool)
+    padded[:, :cols] = mask
+    return np.packbits(padded, axis=1, bitorder="little").view("<u8")
+
+
+def line_masks(mask):
+    """Setiap baris mask bool 2D sebagai int Python (bit col = nilai sel)"""
+    packed = np.packbits(np.asarray(mask, dtype=bool), axis=1, bitorder="little")
+    return [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+
+def lowest_bit(mask):
+    """Indeks bit 1 terendah (mask > 0)"""
+    return (mask & -mask).bit_length() - 1
+
+
+def highest_bit(mask):
+    """Indeks bit 1 tertinggi (mask > 0)"""
+    return mask.bit_length() - 1
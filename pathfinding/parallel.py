@@ -0,0 +1,143 @@
+import math
+import os
+import numpy as np
+
+from .batch import BatchPlanner, PackedPaths, check_options
+from .grid_map import GridMap
+
+# concurrent.futures dan multiprocessing di-import di dalam fungsi agar
+# `import pathfinding` tidak membayar ~30 ms untuk planner yang jarang dipakai
+
+# State per proses worker, diisi oleh _init_worker
+_worker_memory = None
+_worker_planner = None
+
+
+def _init_worker(memory_name, shape, dtype, variant, options):
+    """Menempelkan grid dari shared memory dan membangun BatchPlanner sekali per worker"""
+    from multiprocessing import shared_memory
+
+    global _worker_memory, _worker_planner
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    grid = np.ndarray(shape, dtype=dtype, buffer=_worker_memory.buf)
+    grid.flags.writeable = False
+    _worker_planner = BatchPlanner(GridMap(grid, copy=False), variant, **options)
+
+
+def _solve_chunk(first_index, pairs):
+    """Menyelesaikan satu chunk query; hasil dikirim balik dalam bentuk padat"""
+    packed = _worker_planner.find_paths(pairs)
+    return first_index, packed.coords, packed.offsets, packed.costs
+
+
+class ParallelPlanner:
+    def __init__(self, grid_map, variant="astar", workers=None, chunk_size=None, **options):
+        """
+        Menyebar query (start, goal) yang saling bebas ke process pool.
+
+        Grid disalin sekali ke multiprocessing.shared_memory; setiap worker
+        menempelkannya saat start dan membangun engine sendiri, sehingga
+        yang dikirim per task hanya potongan array pairs dan yang kembali
+        hanya jalur padat.
+
+        variant, options: sama dengan BatchPlanner
+        workers: jumlah proses (default os.cpu_count())
+        chunk_size: jumlah query per task; default dipilih agar setiap
+            worker mendapat sekitar 4 task
+
+        Worker melayani snapshot grid saat planner dibuat. Jika grid_map
+        berupa GridMap yang kemudian diubah (set_cell/set_cells), query
+        berikutnya ditolak dengan RuntimeError; buat planner baru untuk
+        peta yang sudah berubah.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        check_options(variant, {name: value for name, value in options.items() if name != "clearance_max_distance"})
+        grid = grid_map.grid if isinstance(grid_map, GridMap) else np.asarray(grid_map)
+        self.grid_map = grid_map if isinstance(grid_map, GridMap) else None
+        self._version = grid_map.version if self.grid_map is not None else None
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.shape = grid.shape
+
+        self._executor = None
+        self._memory = shared_memory.SharedMemory(create=True, size=max(grid.nbytes, 1))
+        try:
+            shared_grid = np.ndarray(grid.shape, dtype=grid.dtype, buffer=self._memory.buf)
+            shared_grid[...] = grid
+            del shared_grid  # Tidak boleh ada view ke buffer saat close
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self._memory.name, grid.shape, grid.dtype.str, variant, options),
+            )
+        except BaseException:
+            self.close()  # Segmen shared memory tidak boleh bocor
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Mematikan worker dan melepas shared memory"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+    def _chunks(self, pairs):
+        chunk_size = self.chunk_size or max(1, math.ceil(len(pairs) / (self.workers * 4)))
+        for first_index in range(0, len(pairs), chunk_size):
+            yield first_index, pairs[first_index:first_index + chunk_size]
+
+    def imap_unordered(self, pairs):
+        """
+        Menghasilkan (index, path, cost) begitu chunk-nya selesai, urut
+        berdasarkan waktu selesai. path berupa array (n, 2) atau None.
+        Paling banyak 2 * workers chunk menunggu di antrian sekaligus.
+        """
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        if self._executor is None:
+            raise RuntimeError("ParallelPlanner is closed")
+        if self.grid_map is not None and self.grid_map.version != self._version:
+            raise RuntimeError("GridMap changed after ParallelPlanner was created; create a new planner")
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 4)
+        chunks = self._chunks(pairs)
+        pending = set()
+        while True:
+            for first_index, chunk in chunks:
+                pending.add(self._executor.submit(_solve_chunk, first_index, chunk))
+                if len(pending) >= 2 * self.workers:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                first_index, coords, offsets, costs = future.result()
+                packed = PackedPaths(coords, offsets, costs)
+                for offset, path in enumerate(packed):
+                    yield first_index + offset, path, float(costs[offset])
+
+    def find_paths(self, pairs):
+        """Seperti BatchPlanner.find_paths: PackedPaths dengan urutan sama seperti pairs"""
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 4)
+        paths = [None] * len(pairs)
+        costs = np.full(len(pairs), math.inf)
+        for index, path, cost in self.imap_unordered(pairs):
+            paths[index] = path
+            costs[index] = cost
+
+        lengths = np.array([0 if path is None else len(path) for path in paths], dtype=np.int64)
+        offsets = np.zeros(len(pairs) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        found = [path for path in paths if path is not None]
+        coords = np.concatenate(found) if found else np.empty((0, 2), dtype=np.int32)
+        return PackedPaths(coords, offsets, costs)
@@ -0,0 +1,213 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from .batch import BatchPlanner
+from .grid_map import GridMap, grid_digest
+
+# Perkiraan overhead per entri (kunci, tuple entri, slot OrderedDict) dalam byte
+ENTRY_OVERHEAD = 256
+
+
+class PathCache:
+    def __init__(self, max_bytes=16 * 2**20, max_entries=None):
+        """
+        Cache hasil pencarian jalur dengan eviction LRU dan batas memori.
+
+        Kunci: (map_key, start, goal, variant, params) dengan map_key berupa
+        (GridMap.map_id, GridMap.version) atau hash isi grid (grid_digest).
+        Setiap entri
+        menyimpan jalur sebagai array int32 (n, 2) beserta bounding box-nya;
+        invalidate_cells membuang entri yang bounding box-nya memuat sel
+        yang berubah. Hasil "tidak ada jalur" disimpan tanpa bounding box
+        dan dibuang oleh perubahan sel mana pun pada peta tersebut.
+
+        max_bytes: batas perkiraan memori seluruh jalur + overhead entri
+        max_entries: batas jumlah entri opsional
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (path array atau None, bbox, nbytes)
+        self._keys_by_map = {}  # map_key -> set kunci
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def lookup(self, key):
+        """(True, path) jika ada di cache (path bisa None = tidak ada jalur), (False, None) jika tidak"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[0]
+
+    def store(self, key, path):
+        """Menyimpan path (list koordinat, array (n, 2) atau None) untuk key"""
+        if key in self._entries:
+            self._discard(key)
+        if path is None:
+            bbox = None
+            nbytes = ENTRY_OVERHEAD
+        else:
+            path = np.array(path, dtype=np.int32).reshape(-1, 2)
+            path.flags.writeable = False
+            bbox = (path.min(axis=0), path.max(axis=0))
+            nbytes = path.nbytes + ENTRY_OVERHEAD
+        if nbytes > self.max_bytes:
+            return path  # Terlalu besar untuk di-cache
+        self._entries[key] = (path, bbox, nbytes)
+        self._keys_by_map.setdefault(key[0], set()).add(key)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes or (self.max_entries is not None and len(self._entries) > self.max_entries):
+            self._discard(next(iter(self._entries)))  # Entri paling lama tidak dipakai
+            self.evictions += 1
+        return path
+
+    def get_or_compute(self, key, compute):
+        """Hasil cache untuk key, atau compute() yang kemudian disimpan"""
+        found, path = self.lookup(key)
+        if found:
+            return path
+        return self.store(key, compute())
+
+    def _discard(self, key):
+        path, bbox, nbytes = self._entries.pop(key)
+        self.nbytes -= nbytes
+        keys = self._keys_by_map[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_map[key[0]]
+
+    def invalidate_cells(self, map_key, cells):
+        """Membuang entri map_key yang bounding box-nya memuat salah satu cells (n, 2)"""
+        keys = self._keys_by_map.get(map_key)
+        if not keys:
+            return 0
+        cells = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+        stale = []
+        for key in keys:
+            bbox = self._entries[key][1]
+            if bbox is None or np.any(np.all((cells >= bbox[0]) & (cells <= bbox[1]), axis=1)):
+                stale.append(key)
+        for key in stale:
+            self._discard(key)
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def invalidate_map(self, map_key):
+        """Membuang semua entri milik map_key"""
+        keys = list(self._keys_by_map.get(map_key, ()))
+        for key in keys:
+            self._discard(key)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def rekey_map(self, old_map_key, new_map_key):
+        """
+        Memindahkan entri old_map_key ke new_map_key dengan urutan LRU
+        tetap. Entri yang kuncinya sudah ada di new_map_key dibuang.
+        Mengembalikan jumlah entri yang dipindahkan.
+        """
+        keys = self._keys_by_map.pop(old_map_key, None)
+        if not keys:
+            return 0
+        moved = set()
+        entries = OrderedDict()
+        for key, entry in self._entries.items():
+            if key in keys:
+                key = (new_map_key,) + key[1:]
+                if key in self._entries:
+                    self.nbytes -= entry[2]
+                    continue
+                moved.add(key)
+            entries[key] = entry
+        self._entries = entries
+        self._keys_by_map.setdefault(new_map_key, set()).update(moved)
+        return len(moved)
+
+    def clear(self):
+        self._entries.clear()
+        self._keys_by_map.clear()
+        self.nbytes = 0
+
+
+class CachedPlanner:
+    def __init__(self, grid_map, cache=None, variant="astar", **options):
+        """
+        BatchPlanner dengan PathCache. Planner berlangganan perubahan sel
+        GridMap, sehingga entri yang bounding box-nya terkena perubahan
+        obstacle langsung dibuang; jalur lain tetap bebas tabrakan dan
+        dipakai ulang.
+
+        Kunci memuat GridMap.version. Entri hanya dipindahkan ke version
+        baru oleh planner yang berlangganan selama perubahan tersebut,
+        sehingga entri dari planner yang sudah close (atau dari GridMap
+        lain dengan isi sama) tidak pernah terbaca untuk peta yang sudah
+        berubah.
+
+        options: parameter engine (ikut menjadi bagian kunci cache)
+        """
+        self.grid_map = grid_map if isinstance(grid_map, GridMap) else GridMap(grid_map)
+        self.cache = cache if cache is not None else PathCache()
+        self.planner = BatchPlanner(self.grid_map, variant, **options)
+        self.variant = variant
+        self.params = tuple(sorted(options.items()))
+        self._version = self.grid_map.version  # Version tempat entri planner ini disimpan
+        self.grid_map.subscribe(self._on_cells_changed)
+
+    def _on_cells_changed(self, cells):
+        self.cache.invalidate_cells((self.grid_map.map_id, self._version), cells)
+
+    def _map_key(self):
+        """(map_id, version) saat ini; entri yang lolos invalidasi ikut dipindahkan ke version baru"""
+        map_id = self.grid_map.map_id
+        version = self.grid_map.version
+        if version != self._version:
+            self.cache.rekey_map((map_id, self._version), (map_id, version))
+            self._version = version
+        return map_id, version
+
+    def close(self):
+        """Berhenti berlangganan perubahan GridMap"""
+        self.grid_map.unsubscribe(self._on_cells_changed)
+
+    def key(self, start, goal):
+        start = (int(start[0]), int(start[1]))
+        goal = (int(goal[0]), int(goal[1]))
+        return self._map_key(), start, goal, self.variant, self.params
+
+    def find_path(self, start, goal):
+        """Seperti engine.find_path(start, goal), dengan hasil dari cache jika ada"""
+        path = self.cache.get_or_compute(self.key(start, goal), lambda: self.planner.find_path(start, goal))
+        return None if path is None else [tuple(cell) for cell in path.tolist()]
+
+
+def script_key(grid, variant, **params):
+    """
+    Kunci cache untuk fungsi skrip yang membaca start/goal dari grid
+    (mis. a_star_search pada perhitungan-barrier.py). Hash isi grid sudah
+    mencakup posisi sel 2 dan 3, jadi perubahan grid selalu menghasilkan
+    kunci baru.
+    """
+    return grid_digest(grid), None, None, variant, tuple(sorted(params.items()))
@@ -0,0 +1,146 @@
+import numpy as np
+
+
+def supercover_cells(start, end):
+    """
+    Semua sel yang bagian dalamnya dilewati segmen dari pusat sel start ke
+    pusat sel end. Titik potong garis batas dihitung sekaligus dengan NumPy.
+    Segmen yang hanya menyentuh sudut sel tidak dihitung, sama seperti
+    langkah diagonal pada A* yang boleh melewati sudut obstacle.
+    """
+    r0, c0 = start
+    r1, c1 = end
+    d_row, d_col = r1 - r0, c1 - c0
+    crossings = [np.array([0.0, 1.0])]
+    if d_row:
+        bounds = np.arange(min(r0, r1), max(r0, r1)) + 0.5
+        crossings.append((bounds - r0) / d_row)
+    if d_col:
+        bounds = np.arange(min(c0, c1), max(c0, c1)) + 0.5
+        crossings.append((bounds - c0) / d_col)
+    t = np.unique(np.concatenate(crossings))
+    middle = (t[:-1] + t[1:]) / 2
+    rows = np.floor(r0 + d_row * middle + 0.5).astype(np.int64)
+    cols = np.floor(c0 + d_col * middle + 0.5).astype(np.int64)
+    return rows, cols
+
+
+def bresenham_cells(start, end):
+    """Sel pada garis Bresenham (satu sel per langkah sumbu dominan)"""
+    r0, c0 = start
+    r1, c1 = end
+    steps = max(abs(r1 - r0), abs(c1 - c0))
+    t = np.arange(steps + 1)
+    if steps == 0:
+        return np.array([r0]), np.array([c0])
+    rows = r0 + np.floor((r1 - r0) * t / steps + 0.5).astype(np.int64)
+    cols = c0 + np.floor((c1 - c0) * t / steps + 0.5).astype(np.int64)
+    return rows, cols
+
+
+LINE_METHODS = {
+    "supercover": supercover_cells,
+    "bresenham": bresenham_cells,
+}
+
+
+def path_length(path):
+    """Panjang Euclidean dari polyline"""
+    if path is None or len(path) < 2:
+        return 0.0
+    points = np.asarray(path, dtype=np.float64)
+    return float(np.hypot(*np.diff(points, axis=0).T).sum())
+
+
+class SmoothingResult:
+    def __init__(self, waypoints, original_count, length_before, length_after):
+        self.waypoints = waypoints
+        self.original_count = original_count
+        self.length_before = length_before
+        self.length_after = length_after
+
+    @property
+    def removed(self):
+        """Jumlah waypoint yang dibuang"""
+        return self.original_count - len(self.waypoints)
+
+    @property
+    def length_change(self):
+        """Perubahan panjang jalur (negatif berarti lebih pendek)"""
+        return self.length_after - self.length_before
+
+    def __repr__(self):
+        return (
+            f"SmoothingResult(waypoints={len(self.waypoints)}, removed={self.removed}, "
+            f"length {self.length_before:.3f} -> {self.length_after:.3f})"
+        )
+
+
+class PathSmoother:
+    def __init__(self, grid, method="supercover"):
+        """
+        Tahap pascaproses jalur (Polyline Optimization).
+
+        Jalur sel demi sel dari _reconstruct_path diringkas menjadi
+        waypoint: titik belok diambil dulu secara vektor, lalu waypoint
+        yang saling terlihat (line of sight bebas obstacle) digabung.
+        method: "supercover" (konservatif) atau "bresenham".
+        """
+        if method not in LINE_METHODS:
+            raise ValueError(f"Metode line of sight tidak dikenal: {method}")
+        self.free = np.asarray(grid) != 1
+        self.line_cells = LINE_METHODS[method]
+
+    def line_of_sight(self, start, end):
+        """True jika segmen start-end tidak melewati obstacle"""
+        rows, cols = self.line_cells(start, end)
+        return bool(self.free[rows, cols].all())
+
+    def _farthest_visible(self, points, anchor):
+        """Indeks terjauh setelah anchor yang terlihat dari anchor (galloping)"""
+        last = len(points) - 1
+        visible, step = anchor + 1, 1
+        while visible < last:
+            candidate = min(anchor + 2 * step, last)
+            if not self.line_of_sight(points[anchor], points[candidate]):
+                break
+            visible, step = candidate, step * 2
+        else:
+            return visible
+        # Pencarian biner antara titik terlihat terakhir dan kandidat yang gagal
+        low, high = visible, candidate
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.line_of_sight(points[anchor], points[middle]):
+                low = middle
+            else:
+                high = middle
+        return low
+
+    def smooth(self, path):
+        """Meringkas jalur menjadi waypoint; mengembalikan SmoothingResult"""
+        if path is None:
+            return None
+        points = np.asarray(path, dtype=np.int64).reshape(-1, 2)
+        length_before = path_length(points)
+        if len(points) <= 2:
+            waypoints = [tuple(int(v) for v in point) for point in points]
+            return SmoothingResult(waypoints, len(points), length_before, length_before)
+
+        # Buang titik di tengah ruas lurus: pertahankan hanya titik belok
+        directions = np.diff(points, axis=0)
+        turns = np.any(directions[1:] != directions[:-1], axis=1)
+        corners = points[np.concatenate(([True], turns, [True]))]
+
+        keep = [0]
+        while keep[-1] < len(corners) - 1:
+            keep.append(self._farthest_visible(corners, keep[-1]))
+        waypoints = [tuple(int(v) for v in corners[index]) for index in keep]
+        return SmoothingResult(waypoints, len(points), length_before, path_length(waypoints))
+
+    __call__ = smooth
+
+
+def smooth_path(grid, path, method="supercover"):
+    """Pintasan untuk PathSmoother(grid, method).smooth(path)"""
+    return PathSmoother(grid, method).smooth(path)
@@ -0,0 +1,70 @@
+import heapq
+
+
+class PriorityQueue:
+    def __init__(self):
+        """
+        Priority queue (min-heap) dengan indeks keanggotaan O(1).
+
+        Setiap item hanya punya satu prioritas aktif yang disimpan di dict.
+        Mengubah prioritas cukup dengan push ulang; entri lama di heap
+        menjadi basi dan dibuang saat di-pop (lazy deletion), sehingga
+        push dan pop tetap O(log n).
+        """
+        self._heap = []
+        self._priority = {}  # item -> prioritas aktif
+        self.stale_pops = 0  # Jumlah entri basi yang dibuang
+        self.pushes = 0      # Jumlah push (termasuk penggantian prioritas)
+        self.peak_size = 0   # Ukuran heap maksimum, termasuk entri basi
+
+    def __len__(self):
+        return len(self._priority)
+
+    def __bool__(self):
+        return bool(self._priority)
+
+    def __contains__(self, item):
+        return item in self._priority
+
+    def push(self, item, priority):
+        """Menambahkan item atau mengganti prioritasnya jika sudah ada"""
+        self._priority[item] = priority
+        heap = self._heap
+        heapq.heappush(heap, (priority, item))
+        self.pushes += 1
+        if len(heap) > self.peak_size:
+            self.peak_size = len(heap)
+
+    def priority(self, item):
+        """Prioritas aktif dari item (KeyError jika tidak ada)"""
+        return self._priority[item]
+
+    def remove(self, item):
+        """Menghapus item dari antrian; entri heap-nya dibuang saat di-pop"""
+        del self._priority[item]
+
+    def pop(self):
+        """Mengambil item dengan prioritas terendah"""
+        return self.pop_with_priority()[1]
+
+    def pop_with_priority(self):
+        """Mengambil (prioritas, item) dengan prioritas terendah"""
+        heap = self._heap
+        while heap:
+            priority, item = heapq.heappop(heap)
+            if self._priority.get(item) == priority:
+                del self._priority[item]
+                return priority, item
+            self.stale_pops += 1
+        raise IndexError("pop from an empty priority queue")
+
+    def peek_priority(self):
+        """Prioritas terendah tanpa mengambil item, None jika kosong"""
+        heap = self._heap
+        while heap:
+            priority, item = heap[0]
+            if self._priority.get(item) == priority:
+                return priority
+            heapq.heappop(heap)
+            self.stale_pops += 1
+        return None
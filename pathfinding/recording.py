@@ -0,0 +1,151 @@
+import os
+import struct
+import zlib
+
+import numpy as np
+
+from .tracing import NODE_EXPANDED, NODE_OPENED, PATH_NODE, TRACE_DTYPE, Tracer
+
+# Warna sama dengan animasi*.py: nilai grid (0 bebas, 1 obstacle, 2 start, 3 goal)
+CELL_COLORS = {0: (255, 255, 255), 1: (0, 0, 0), 2: (0, 255, 0), 3: (255, 0, 0)}
+# Status node: 1 open, 2 close, 3 path; status lebih tinggi menimpa yang lebih rendah
+STATE_COLORS = [(0, 0, 255), (255, 255, 0), (0, 255, 255)]
+EVENT_STATES = {NODE_OPENED: 1, NODE_EXPANDED: 2, PATH_NODE: 3}
+
+
+class TraceRecorder:
+    """Subscriber yang menampung event di memori (untuk record_search)"""
+
+    def __init__(self):
+        self._events = []
+
+    def __call__(self, event, node, g, f):
+        self._events.append((event, node[0], node[1], g, f))
+
+    def __len__(self):
+        return len(self._events)
+
+    def add_path(self, path):
+        """Menambahkan event PATH_NODE untuk setiap node jalur hasil"""
+        for node in path or ():
+            self._events.append((PATH_NODE, node[0], node[1], 0.0, 0.0))
+
+    def events(self):
+        return np.array(self._events, dtype=TRACE_DTYPE)
+
+
+def save_recording(file_path, grid, events):
+    """
+    Menyimpan rekaman pencarian: grid (uint8) dan event (TRACE_DTYPE, 17
+    byte per event) dalam satu file .npz terkompresi.
+    """
+    with open(file_path, "wb") as file:
+        np.savez_compressed(file, grid=np.asarray(grid, dtype=np.uint8), events=np.asarray(events, dtype=TRACE_DTYPE))
+
+
+def load_recording(file_path):
+    """(grid, events) dari file save_recording"""
+    with np.load(file_path) as data:
+        return data["grid"], data["events"]
+
+
+def record_search(file_path, grid, find_path):
+    """
+    Menjalankan find_path(tracer) (mis. lambda tracer: engine.find_path(
+    start, goal, tracer=tracer)) sambil merekam event open/close, lalu
+    menambahkan jalur hasil sebagai PATH_NODE dan menyimpan rekamannya.
+    Mengembalikan jalur.
+    """
+    recorder = TraceRecorder()
+    path = find_path(Tracer(recorder))
+    recorder.add_path(path)
+    save_recording(file_path, grid, recorder.events())
+    return path
+
+
+def _palette():
+    """Lookup table (256 + 4, 3): nilai grid 0-255, lalu status 1-3 di indeks 256 + status"""
+    lut = np.full((260, 3), 255, dtype=np.uint8)
+    for value, color in CELL_COLORS.items():
+        lut[value] = color
+    lut[257:260] = STATE_COLORS
+    return lut
+
+
+def _scaled(image, scale):
+    return image if scale == 1 else image.repeat(scale, axis=0).repeat(scale, axis=1)
+
+
+def render_frames(grid, events, events_per_frame=1000, scale=1):
+    """
+    Generator frame RGB (rows * scale, cols * scale, 3) uint8 dari rekaman,
+    tanpa pygame. Setiap frame menerapkan events_per_frame event berikutnya;
+    hanya sel yang disentuh event yang diwarnai ulang. Frame terakhir
+    memuat seluruh event (termasuk jalur). Setiap frame adalah array
+    sendiri, jadi aman dikumpulkan (mis. untuk ekspor GIF/video).
+    """
+    grid = np.asarray(grid)
+    lut = _palette()
+    states = np.zeros(grid.shape, dtype=np.uint16)
+    image = lut[grid.astype(np.uint8)]
+    event_states = np.zeros(256, dtype=np.uint16)
+    for event, state in EVENT_STATES.items():
+        event_states[event] = state
+    codes = event_states[events["event"]]
+    keep = codes > 0
+    rows, cols, codes = events["row"][keep], events["col"][keep], codes[keep]
+
+    yield image.copy() if scale == 1 else _scaled(image, scale)
+    for begin in range(0, len(codes), events_per_frame):
+        row = rows[begin:begin + events_per_frame]
+        col = cols[begin:begin + events_per_frame]
+        np.maximum.at(states, (row, col), codes[begin:begin + events_per_frame])
+        image[row, col] = lut[256 + states[row, col]]
+        yield image.copy() if scale == 1 else _scaled(image, scale)
+
+
+def expansion_heatmap(grid, events, scale=1):
+    """
+    Gambar RGB urutan expand: sel yang di-expand lebih awal berwarna biru,
+    yang terakhir merah; obstacle hitam, sel yang tidak di-expand putih,
+    jalur hasil cyan.
+    """
+    grid = np.asarray(grid)
+    image = _palette()[grid.astype(np.uint8)]
+    expanded = events[events["event"] == NODE_EXPANDED]
+    if len(expanded):
+        # Urutan expand pertama setiap sel, dinormalisasi ke 0..1
+        cells, first = np.unique(expanded["row"].astype(np.int64) * grid.shape[1] + expanded["col"], return_index=True)
+        order = np.argsort(np.argsort(first)) / max(len(first) - 1, 1)
+        colors = np.stack([255 * order, 64 * (1 - np.abs(2 * order - 1)), 255 * (1 - order)], axis=1)
+        image.reshape(-1, 3)[cells] = colors.astype(np.uint8)
+    path = events[events["event"] == PATH_NODE]
+    image[path["row"], path["col"]] = STATE_COLORS[2]
+    return _scaled(image, scale)
+
+
+def write_png(file_path, image):
+    """Menulis gambar RGB (h, w, 3) uint8 sebagai PNG (tanpa dependensi selain zlib)"""
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width, _ = image.shape
+    raw = np.zeros((height, width * 3 + 1), dtype=np.uint8)  # Byte filter 0 per baris
+    raw[:, 1:] = image.reshape(height, -1)
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    with open(file_path, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n")
+        file.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        file.write(chunk(b"IDAT", zlib.compress(raw.tobytes(), 1)))
+        file.write(chunk(b"IEND", b""))
+
+
+def render_png_sequence(recording_path, output_dir, events_per_frame=1000, scale=1):
+    """Merender rekaman ke output_dir/frame_00000.png, ...; mengembalikan jumlah frame"""
+    grid, events = load_recording(recording_path)
+    os.makedirs(output_dir, exist_ok=True)
+    count = 0
+    for count, image in enumerate(render_frames(grid, events, events_per_frame, scale), 1):
+        write_png(os.path.join(output_dir, f"frame_{count - 1:05d}.png"), image)
+    return count
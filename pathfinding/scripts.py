@@ -0,0 +1,59 @@
+"""
+Akses impor ke skrip perhitungan*.py dan animasi*.py di root repositori.
+
+Nama file berisi '-' sehingga tidak bisa di-import langsung; modul ini
+memuatnya lewat importlib saat atribut pertama kali dibaca, mis.
+pathfinding.scripts.barrier.a_star_search. Skrip tidak menjalankan demo
+atau pygame.init saat dimuat (keduanya ada di bawah __main__ / main()),
+jadi memuat animasi* tidak ikut memuat pygame.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPTS = {
+    "astar": "perhitungan.py",
+    "barrier": "perhitungan-barrier.py",
+    "guideline": "perhitungan-guidline.py",
+    "bidirectional": "perhitungan-bidirectional.py",
+    "animasi": "animasi.py",
+    "animasi_barrier": "animasi-barrier.py",
+    "animasi_guideline": "animasi-guidline.py",
+    "animasi_bidirectional": "animasi-bidirectional.py",
+}
+
+
+def load_script(name):
+    """
+    Modul untuk skrip name (kunci SCRIPTS atau nama file, mis.
+    "perhitungan-barrier.py"). Setiap skrip hanya dimuat sekali.
+    """
+    file_name = SCRIPTS.get(name, name)
+    module_name = f"{__name__}.{Path(file_name).stem.replace('-', '_')}"
+    module = sys.modules.get(module_name)
+    if module is None:
+        path = ROOT / file_name
+        if not path.is_file():
+            raise ImportError(f"Unknown script '{name}', expected one of {sorted(SCRIPTS)}")
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+    return module
+
+
+def __getattr__(name):
+    if name in SCRIPTS:
+        return load_script(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *SCRIPTS])
@@ -0,0 +1,137 @@
+import sys
+import time
+
+
+class SearchStats:
+    def __init__(self):
+        """
+        Statistik kerja pencarian; berikan lewat parameter stats pada
+        find_path. Setiap query menambahkan angkanya ke objek ini, sehingga
+        satu objek bisa mengumpulkan total untuk banyak query (nilai puncak
+        diambil maksimumnya).
+
+        Penghitung diturunkan dari state setelah pencarian selesai, bukan
+        dihitung di loop utama; loop hanya mencatat ukuran heap saat pop.
+        heuristic_time diakumulasi di loop dengan perf_counter di sekitar
+        setiap evaluasi heuristik (dan faktor per node yang di-expand, mis.
+        koefisien barrier), hanya jika stats diberikan. Overhead
+        perf_counter ikut terhitung, jadi angkanya sedikit lebih besar dari
+        biaya heuristik sebenarnya; expansion_time adalah sisa waktu loop.
+        """
+        self.reset()
+
+    def reset(self):
+        self.queries = 0
+        self.found = 0
+        self.expanded = 0           # Node yang di-expand (masuk closed list)
+        self.pushed = 0             # Entri yang dimasukkan ke open list
+        self.stale_pops = 0         # Entri basi yang dibuang saat pop
+        self.heap_peak = 0          # Ukuran heap maksimum, termasuk entri basi
+        self.state_peak = 0         # Node maksimum yang punya state (g/parent) dalam satu query
+        self.state_bytes = 0        # Ukuran maksimum struktur state (g/parent/closed) dalam byte
+        self.search_time = 0.0      # Loop pencarian: heuristik + expansion
+        self.heuristic_time = 0.0
+        self.reconstruction_time = 0.0
+
+    @property
+    def expansion_time(self):
+        return self.search_time - self.heuristic_time
+
+    @property
+    def total_time(self):
+        return self.search_time + self.reconstruction_time
+
+    def record(self, found, expanded, pushed, stale_pops, heap_peak, state_peak, state_bytes,
+               search_time, heuristic_time=0.0, reconstruction_time=0.0):
+        """Menambahkan hasil satu query"""
+        self.queries += 1
+        self.found += bool(found)
+        self.expanded += expanded
+        self.pushed += pushed
+        self.stale_pops += stale_pops
+        self.heap_peak = max(self.heap_peak, heap_peak)
+        self.state_peak = max(self.state_peak, state_peak)
+        self.state_bytes = max(self.state_bytes, state_bytes)
+        self.search_time += search_time
+        self.heuristic_time += heuristic_time
+        self.reconstruction_time += reconstruction_time
+
+    def merge(self, other):
+        """Menggabungkan SearchStats lain (mis. dari worker lain) ke objek ini"""
+        for name in ("queries", "found", "expanded", "pushed", "stale_pops",
+                     "search_time", "heuristic_time", "reconstruction_time"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for name in ("heap_peak", "state_peak", "state_bytes"):
+            setattr(self, name, max(getattr(self, name), getattr(other, name)))
+        return self
+
+    def as_dict(self):
+        return {
+            "queries": self.queries,
+            "found": self.found,
+            "expanded": self.expanded,
+            "pushed": self.pushed,
+            "stale_pops": self.stale_pops,
+            "heap_peak": self.heap_peak,
+            "state_peak": self.state_peak,
+            "state_bytes": self.state_bytes,
+            "search_time": self.search_time,
+            "heuristic_time": self.heuristic_time,
+            "expansion_time": self.expansion_time,
+            "reconstruction_time": self.reconstruction_time,
+            "total_time": self.total_time,
+        }
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={value:.6f}" if isinstance(value, float) else f"{name}={value}"
+            for name, value in self.as_dict().items()
+        )
+        return f"SearchStats({fields})"
+
+
+class HeuristicTimer:
+    def __init__(self):
+        """
+        Mengakumulasi waktu pemanggilan fungsi heuristik di loop pencarian
+        skrip perhitungan*: panggil fungsi hasil wrap di tempat fungsi
+        aslinya, lalu berikan total sebagai heuristic_time.
+        """
+        self.total = 0.0
+
+    def wrap(self, function):
+        """Fungsi yang sama dengan function, dengan waktu setiap panggilan ditambahkan ke total"""
+        perf_counter = time.perf_counter
+
+        def timed(*args):
+            begin = perf_counter()
+            result = function(*args)
+            self.total += perf_counter() - begin
+            return result
+
+        return timed
+
+
+def record_dict_search(stats, open_lists, closed_lists, g_scores, other_state, found,
+                       search_time, heuristic_time, reconstruction_time=0.0, closed_goal=False):
+    """
+    Mencatat satu query dari pencarian berbasis dict (skrip perhitungan*).
+    Setiap argumen berisi satu elemen per arah pencarian (dua untuk
+    bidirectional): open_lists berupa PriorityQueue, closed_lists berupa
+    set, g_scores berupa dict g_score, other_state berisi dict lain
+    (f_score, came_from) yang ikut dihitung ke state_bytes.
+    closed_goal: True jika goal sudah dimasukkan ke closed list sebelum
+        diperiksa (tidak dihitung sebagai expanded).
+    """
+    stats.record(
+        found=found,
+        expanded=sum(len(closed) for closed in closed_lists) - int(found and closed_goal),
+        pushed=sum(queue.pushes for queue in open_lists),
+        stale_pops=sum(queue.stale_pops for queue in open_lists),
+        heap_peak=sum(queue.peak_size for queue in open_lists),
+        state_peak=sum(len(g_score) for g_score in g_scores),
+        state_bytes=sum(sys.getsizeof(structure) for structure in (*closed_lists, *g_scores, *other_state)),
+        search_time=search_time,
+        heuristic_time=heuristic_time,
+        reconstruction_time=reconstruction_time,
+    )
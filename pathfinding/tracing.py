@@ -0,0 +1,159 @@
+import json
+
+import numpy as np
+
+# Jenis event pencarian
+NODE_EXPANDED = 0  # Node diambil dari open list dan masuk closed list
+NODE_OPENED = 1    # Node ditambahkan ke open list (atau prioritasnya diperbarui)
+PATH_FOUND = 2     # Goal tercapai; g berisi biaya jalur
+PATH_NODE = 3      # Satu node jalur hasil (dicatat setelah pencarian, mis. oleh record_search)
+
+EVENT_NAMES = {
+    NODE_EXPANDED: "expanded",
+    NODE_OPENED: "opened",
+    PATH_FOUND: "path_found",
+    PATH_NODE: "path_node",
+}
+
+# Format satu event pada log biner: 17 byte per event
+TRACE_DTYPE = np.dtype([
+    ("event", "u1"),
+    ("row", "<i4"),
+    ("col", "<i4"),
+    ("g", "<f4"),
+    ("f", "<f4"),
+])
+TRACE_MAGIC = b"PFTRACE1"
+
+
+class Tracer:
+    def __init__(self, *subscribers):
+        """
+        Penyalur event pencarian ke subscriber.
+
+        Subscriber adalah callable subscriber(event, node, g, f). Fungsi
+        pencarian hanya memanggil emit jika tracer diberikan dan memiliki
+        subscriber, sehingga tanpa subscriber loop utama tidak membayar
+        biaya apa pun selain satu pemeriksaan None.
+        """
+        self.subscribers = list(subscribers)
+
+    def __bool__(self):
+        return bool(self.subscribers)
+
+    def subscribe(self, subscriber):
+        self.subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        self.subscribers.remove(subscriber)
+
+    def emit(self, event, node, g=0.0, f=0.0):
+        for subscriber in self.subscribers:
+            subscriber(event, node, g, f)
+
+
+def get_emitter(tracer):
+    """Mengembalikan tracer.emit, atau None jika tidak ada subscriber"""
+    if tracer is None or not tracer:
+        return None
+    if len(tracer.subscribers) == 1:
+        return tracer.subscribers[0]
+    return tracer.emit
+
+
+def print_event(event, node, g, f):
+    """Subscriber untuk debugging: mencetak setiap event ke stdout"""
+    node = tuple(int(v) for v in node)
+    if event == NODE_EXPANDED:
+        print(f"\nExamining node {node} (g = {g:.3f})")
+    elif event == NODE_OPENED:
+        print(f"  Neighbor {node}: g = {g:.3f}, h = {f - g:.3f}, f = {f:.3f}")
+    elif event == PATH_FOUND:
+        print(f"\nGoal {node} reached! Path cost = {g:.3f}")
+
+
+class EventCounter:
+    """Subscriber yang hanya menghitung jumlah event per jenis"""
+
+    def __init__(self):
+        self.counts = dict.fromkeys(EVENT_NAMES, 0)
+
+    def __call__(self, event, node, g, f):
+        self.counts[event] += 1
+
+
+class NdjsonTraceWriter:
+    def __init__(self, file_path, buffer_size=4096):
+        """
+        Subscriber yang menulis event sebagai NDJSON (satu objek JSON per
+        baris). Event ditampung dan ditulis sekaligus per buffer_size event.
+        """
+        self.file = open(file_path, "w", encoding="utf-8")
+        self.buffer_size = buffer_size
+        self._buffer = []
+
+    def __call__(self, event, node, g, f):
+        self._buffer.append((event, int(node[0]), int(node[1]), float(g), float(f)))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        lines = [
+            json.dumps({"event": EVENT_NAMES[event], "node": [row, col], "g": g, "f": f})
+            for event, row, col, g, f in self._buffer
+        ]
+        if lines:
+            self.file.write("\n".join(lines) + "\n")
+        self._buffer = []
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class BinaryTraceWriter:
+    def __init__(self, file_path, buffer_size=65536):
+        """
+        Subscriber yang menulis event ke log biner ringkas: header
+        TRACE_MAGIC lalu record TRACE_DTYPE (17 byte per event). Event
+        ditampung dan ditulis sekaligus per buffer_size event.
+        """
+        self.file = open(file_path, "wb")
+        self.file.write(TRACE_MAGIC)
+        self.buffer_size = buffer_size
+        self._buffer = []
+
+    def __call__(self, event, node, g, f):
+        self._buffer.append((event, node[0], node[1], g, f))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self.file.write(np.array(self._buffer, dtype=TRACE_DTYPE).tobytes())
+        self._buffer = []
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_binary_trace(file_path):
+    """Membaca log dari BinaryTraceWriter sebagai structured array NumPy"""
+    with open(file_path, "rb") as trace_file:
+        if trace_file.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+            raise ValueError(f"'{file_path}' bukan file trace yang valid")
+        return np.frombuffer(trace_file.read(), dtype=TRACE_DTYPE)
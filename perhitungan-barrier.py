@@ -1,6 +1,12 @@
 import numpy as np
-import heapq
 import math
+import time
+
+from pathfinding.barrier_index import BarrierIndex
+from pathfinding.clearance import clearance_costs
+from pathfinding.priority_queue import PriorityQueue
+from pathfinding.search_stats import HeuristicTimer, record_dict_search
+from pathfinding.tracing import NODE_EXPANDED, NODE_OPENED, PATH_FOUND, Tracer, get_emitter, print_event
 
 # Representasi peta: 2 = Start, 3 = Goal, 1 = Obstacle, 0 = Free space
 map_grid = np.array([
@@ -21,7 +27,11 @@ def find_coordinates(grid, value):
     return tuple(result[0]) if result.size > 0 else None
 
 # Fungsi untuk menghitung Barrier Raster Coefficient (P)
-def compute_barrier_coefficient(current, goal, grid):
+# Jika index (BarrierIndex) diberikan, jumlah obstacle dihitung dalam O(1)
+def compute_barrier_coefficient(current, goal, grid, index=None):
+    if index is not None:
+        return index.coefficient(current, goal)
+    
     x1, y1 = current
     x2, y2 = goal
     x_min, x_max = min(x1, x2), max(x1, x2)
@@ -34,7 +44,9 @@ def compute_barrier_coefficient(current, goal, grid):
     return max(P, 0.01)  # Ensure P is non-zero to avoid log issues
 
 # A* Algorithm with Barrier Raster Coefficient and Turn Penalty
-def a_star_search(grid, turn_penalty_coefficient=1.0):
+# clearance, safety_margin, clearance_weight: sama seperti ArrayAStarPathfinder (lihat clearance_costs)
+def a_star_search(grid, turn_penalty_coefficient=1.0, tracer=None, barrier_index=None, stats=None,
+                  clearance=None, safety_margin=0.0, clearance_weight=0.0):
     # Temukan titik start dan goal
     start = find_coordinates(grid, 2)
     goal = find_coordinates(grid, 3)
@@ -43,8 +55,13 @@ def a_star_search(grid, turn_penalty_coefficient=1.0):
         raise ValueError("Start or Goal node not found in the grid.")
     
     rows, cols = grid.shape
-    open_list = []
-    heapq.heappush(open_list, (0, start))  # Priority queue (f_score, node)
+    blocked, step_penalty = clearance_costs(clearance, safety_margin, clearance_weight)
+    # Prefix-sum obstacle dibangun sekali per peta (bisa dipakai ulang antar query)
+    if barrier_index is None:
+        barrier_index = BarrierIndex(grid)
+    emit = get_emitter(tracer)  # None jika tidak ada subscriber
+    open_list = PriorityQueue()
+    open_list.push(start, 0)  # Priority queue (node, f_score)
     came_from = {}  # Untuk melacak jalur
 
     # G-score (biaya dari start ke node saat ini)
@@ -57,20 +74,49 @@ def a_star_search(grid, turn_penalty_coefficient=1.0):
 
     # Set neighbor offsets (horizontal, vertical, diagonal)
     neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+    # Statistik (stats): heuristik = koefisien barrier per node yang di-expand + jarak
+    # ke goal per neighbor, diakumulasi di loop lewat HeuristicTimer
+    timer = HeuristicTimer()
+    barrier_coefficient = compute_barrier_coefficient
+    goal_distance = euclidean_distance
+    if stats is not None:
+        barrier_coefficient = timer.wrap(compute_barrier_coefficient)
+        goal_distance = timer.wrap(euclidean_distance)
+
+    def record_stats(found, search_time, reconstruction_time=0.0):
+        record_dict_search(stats, [open_list], [closed_list], [g_score], [f_score, came_from],
+                           found, search_time, timer.total, reconstruction_time, closed_goal=True)
     
+    search_begin = time.perf_counter()
     while open_list:
         # Ambil node dengan f_score terendah
-        current = heapq.heappop(open_list)[1]
+        current = open_list.pop()
         closed_list.add(current)  # Tambahkan ke closed list
         
         # Jika goal tercapai, rekonstruksi jalur
         if current == goal:
+            if emit is not None:
+                emit(PATH_FOUND, current, g_score[current], f_score[current])
+            search_time = time.perf_counter() - search_begin
+            reconstruction_begin = time.perf_counter()
             path = []
             while current in came_from:
                 path.append(current)
                 current = came_from[current]
             path.append(start)
-            return path[::-1]  # Balikkan jalur
+            path = path[::-1]  # Balikkan jalur
+            if stats is not None:
+                record_stats(True, search_time, time.perf_counter() - reconstruction_begin)
+            return path
+        
+        if emit is not None:
+            emit(NODE_EXPANDED, current, g_score[current], f_score[current])
+        
+        # Barrier Raster Coefficient (P) hanya bergantung pada current dan goal,
+        # jadi cukup dihitung sekali per node yang di-expand
+        P = barrier_coefficient(current, goal, grid, barrier_index)
+        barrier_factor = 1 - math.log(P)
         
         # Proses semua neighbor
         for offset in neighbors:
@@ -80,13 +126,16 @@ def a_star_search(grid, turn_penalty_coefficient=1.0):
             if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and grid[neighbor] != 1:
                 if neighbor in closed_list:
                     continue  # Skip jika sudah di closed list
+                if blocked is not None and blocked[neighbor]:
+                    continue  # Di dalam safety margin
                 
                 # Hitung g_score baru
                 tentative_g_score = g_score[current] + (euclidean_distance(current, neighbor) if offset[0] != 0 and offset[1] != 0 else 1)
+                if step_penalty is not None:
+                    tentative_g_score += step_penalty[neighbor]  # Biaya clearance
                 
-                # Hitung Barrier Raster Coefficient (P)
-                P = compute_barrier_coefficient(current, goal, grid)
-                h = (1 - math.log(P)) * euclidean_distance(neighbor, goal)
+                # Heuristik dengan Barrier Raster Coefficient
+                h = barrier_factor * goal_distance(neighbor, goal)
                 
                 # Hitung Turn Penalty
                 if current in came_from:
@@ -107,21 +156,13 @@ def a_star_search(grid, turn_penalty_coefficient=1.0):
                     g_score[neighbor] = tentative_g_score
                     f_score[neighbor] = f
 
-                    # Tambahkan neighbor ke open_list jika belum ada
-                    if not any(neighbor == item[1] for item in open_list):
-                        heapq.heappush(open_list, (f_score[neighbor], neighbor))
-                        print(f"Added to open list: {neighbor}")
-                
-                # Tampilkan perhitungan g, h, f
-                print(f"Neighbor: {neighbor}")
-                print(f"  g = {tentative_g_score:.2f}")
-                print(f"  h = {h:.2f} (P = {P:.2f})")
-                print(f"  Turn Penalty = {turn_penalty:.2f}")
-                print(f"  f = {f:.2f}")
-        
-        print(f"Closed list: {list(closed_list)}")
-        print('=========================================')
+                    # Tambahkan ke open list, atau perbarui prioritasnya jika sudah ada
+                    open_list.push(neighbor, f_score[neighbor])
+                    if emit is not None:
+                        emit(NODE_OPENED, neighbor, tentative_g_score, f)
     
+    if stats is not None:
+        record_stats(False, time.perf_counter() - search_begin)
     return None  # Tidak ada jalur ditemukan
 
 # Fungsi untuk mengganti path dengan nilai 5
@@ -132,16 +173,17 @@ def mark_path_on_map(grid, path):
             output_grid[step] = 5
     return output_grid
 
-# Jalankan algoritma A*
-path = a_star_search(map_grid, turn_penalty_coefficient=1.0)
+if __name__ == "__main__":
+    # Jalankan algoritma A*
+    path = a_star_search(map_grid, turn_penalty_coefficient=1.0, tracer=Tracer(print_event))
 
-# Tampilkan hasil
-if path:
-    print("Path found:")
-    print([tuple(map(int, step)) for step in path])  # Format koordinat sebagai angka biasa
-    # Tandai path pada peta
-    result_grid = mark_path_on_map(map_grid, path)
-    print("\nMap with path marked as 5:")
-    print(result_grid)
-else:
-    print("No path found.")
+    # Tampilkan hasil
+    if path:
+        print("Path found:")
+        print([tuple(map(int, step)) for step in path])  # Format koordinat sebagai angka biasa
+        # Tandai path pada peta
+        result_grid = mark_path_on_map(map_grid, path)
+        print("\nMap with path marked as 5:")
+        print(result_grid)
+    else:
+        print("No path found.")
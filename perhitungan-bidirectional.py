@@ -1,6 +1,11 @@
 import numpy as np
-import heapq
 import math
+import time
+
+from pathfinding.clearance import clearance_costs
+from pathfinding.priority_queue import PriorityQueue
+from pathfinding.search_stats import HeuristicTimer, record_dict_search
+from pathfinding.tracing import NODE_EXPANDED, NODE_OPENED, PATH_FOUND, get_emitter
 
 # Representasi peta: 2 = Start, 3 = Goal, 1 = Obstacle, 0 = Free space
 map_grid = np.array([
@@ -21,7 +26,9 @@ def find_coordinates(grid, value):
     return tuple(result[0]) if result.size > 0 else None
 
 # Bidirectional A* Algorithm
-def bidirectional_a_star(grid):
+# clearance, safety_margin, clearance_weight: sama seperti ArrayAStarPathfinder (lihat clearance_costs);
+# biaya clearance dikenakan pada sel yang dimasuki dalam arah start -> goal
+def bidirectional_a_star(grid, tracer=None, stats=None, clearance=None, safety_margin=0.0, clearance_weight=0.0):
     # Temukan titik start dan goal
     start = find_coordinates(grid, 2)
     goal = find_coordinates(grid, 3)
@@ -31,12 +38,16 @@ def bidirectional_a_star(grid):
     
     # Inisialisasi struktur data
     rows, cols = grid.shape
+    blocked, step_penalty = clearance_costs(clearance, safety_margin, clearance_weight)
+    emit = get_emitter(tracer)  # None jika tidak ada subscriber
     
     # Open lists and closed lists for both directions
-    open_list_start = []
-    open_list_goal = []
-    heapq.heappush(open_list_start, (0, start))
-    heapq.heappush(open_list_goal, (0, goal))
+    open_list_start = PriorityQueue()
+    open_list_goal = PriorityQueue()
+    open_list_start.push(start, 0)
+    # Goal di dalam safety margin tidak pernah tercapai, sama seperti A* satu arah
+    if blocked is None or not blocked[goal] or start == goal:
+        open_list_goal.push(goal, 0)
     closed_list_start = set()
     closed_list_goal = set()
 
@@ -54,68 +65,117 @@ def bidirectional_a_star(grid):
     neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
     
     def reconstruct_path(meeting_point):
-        # Rekonstruksi jalur dari start ke goal
-        path_start = []
+        # Rekonstruksi jalur: start -> meeting point -> goal
+        path_start = [meeting_point]
         current = meeting_point
         while current in came_from_start:
-            path_start.append(current)
             current = came_from_start[current]
-        path_start = path_start[::-1]
+            path_start.append(current)
+        path = path_start[::-1]
 
-        path_goal = []
         current = meeting_point
         while current in came_from_goal:
-            path_goal.append(current)
             current = came_from_goal[current]
-        
-        return path_start + path_goal[1:]  # Hindari duplikasi titik meeting point
+            path.append(current)
+        return path
+
+    # Statistik (stats): heuristik = jarak ke ujung lawan per node yang di-push di kedua arah,
+    # diakumulasi di loop lewat HeuristicTimer
+    timer = HeuristicTimer()
+    heuristic = timer.wrap(euclidean_distance) if stats is not None else euclidean_distance
+
+    def record_stats(found, search_time, reconstruction_time=0.0):
+        record_dict_search(stats, [open_list_start, open_list_goal], [closed_list_start, closed_list_goal],
+                           [g_score_start, g_score_goal], [f_score_start, f_score_goal, came_from_start, came_from_goal],
+                           found, search_time, timer.total, reconstruction_time)
     
+    # mu: biaya jalur terbaik yang sudah ditemukan lewat meeting point
+    best_cost = 0 if start == goal else math.inf
+    meeting_point = start if start == goal else None
+    
+    search_begin = time.perf_counter()
     while open_list_start and open_list_goal:
-        # Proses dari arah start
-        current_start = heapq.heappop(open_list_start)[1]
-        closed_list_start.add(current_start)
-        
-        # Proses dari arah goal
-        current_goal = heapq.heappop(open_list_goal)[1]
-        closed_list_goal.add(current_goal)
+        # Berhenti jika tidak ada jalur yang bisa lebih murah dari mu
+        if open_list_start.peek_priority() >= best_cost or open_list_goal.peek_priority() >= best_cost:
+            break
         
-        # Jika kedua sisi bertemu
-        if current_start in closed_list_goal or current_goal in closed_list_start:
-            meeting_point = current_start if current_start in closed_list_goal else current_goal
-            return reconstruct_path(meeting_point)
-
-        # Proses neighbors untuk arah start
-        for offset in neighbors:
-            neighbor = (current_start[0] + offset[0], current_start[1] + offset[1])
-            if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and grid[neighbor] != 1:
-                if neighbor in closed_list_start:
-                    continue
-                
-                tentative_g_score = g_score_start[current_start] + (euclidean_distance(current_start, neighbor) if offset[0] != 0 and offset[1] != 0 else 1)
-                if neighbor not in g_score_start or tentative_g_score < g_score_start[neighbor]:
-                    came_from_start[neighbor] = current_start
-                    g_score_start[neighbor] = tentative_g_score
-                    f_score_start[neighbor] = tentative_g_score + euclidean_distance(neighbor, goal)
+        if len(open_list_start) <= len(open_list_goal):
+            # Proses dari arah start (frontier lebih kecil)
+            current_start = open_list_start.pop()
+            closed_list_start.add(current_start)
+            if emit is not None:
+                emit(NODE_EXPANDED, current_start, g_score_start[current_start], f_score_start[current_start])
+            
+            for offset in neighbors:
+                neighbor = (current_start[0] + offset[0], current_start[1] + offset[1])
+                if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and grid[neighbor] != 1:
+                    if neighbor in closed_list_start:
+                        continue
+                    if blocked is not None and blocked[neighbor]:
+                        continue  # Di dalam safety margin
                     
-                    if not any(neighbor == item[1] for item in open_list_start):
-                        heapq.heappush(open_list_start, (f_score_start[neighbor], neighbor))
-        
-        # Proses neighbors untuk arah goal
-        for offset in neighbors:
-            neighbor = (current_goal[0] + offset[0], current_goal[1] + offset[1])
-            if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and grid[neighbor] != 1:
-                if neighbor in closed_list_goal:
-                    continue
-                
-                tentative_g_score = g_score_goal[current_goal] + (euclidean_distance(current_goal, neighbor) if offset[0] != 0 and offset[1] != 0 else 1)
-                if neighbor not in g_score_goal or tentative_g_score < g_score_goal[neighbor]:
-                    came_from_goal[neighbor] = current_goal
-                    g_score_goal[neighbor] = tentative_g_score
-                    f_score_goal[neighbor] = tentative_g_score + euclidean_distance(neighbor, start)
+                    tentative_g_score = g_score_start[current_start] + (euclidean_distance(current_start, neighbor) if offset[0] != 0 and offset[1] != 0 else 1)
+                    if step_penalty is not None:
+                        tentative_g_score += step_penalty[neighbor]  # Biaya clearance saat memasuki neighbor
+                    if neighbor not in g_score_start or tentative_g_score < g_score_start[neighbor]:
+                        came_from_start[neighbor] = current_start
+                        g_score_start[neighbor] = tentative_g_score
+                        f_score_start[neighbor] = tentative_g_score + heuristic(neighbor, goal)
+                        
+                        # Tambahkan ke open list, atau perbarui prioritasnya jika sudah ada
+                        open_list_start.push(neighbor, f_score_start[neighbor])
+                        if emit is not None:
+                            emit(NODE_OPENED, neighbor, tentative_g_score, f_score_start[neighbor])
+                        
+                        # Perbarui mu jika neighbor sudah dicapai dari arah goal
+                        if neighbor in g_score_goal and tentative_g_score + g_score_goal[neighbor] < best_cost:
+                            best_cost = tentative_g_score + g_score_goal[neighbor]
+                            meeting_point = neighbor
+        else:
+            # Proses dari arah goal (frontier lebih kecil)
+            current_goal = open_list_goal.pop()
+            closed_list_goal.add(current_goal)
+            if emit is not None:
+                emit(NODE_EXPANDED, current_goal, g_score_goal[current_goal], f_score_goal[current_goal])
+            
+            for offset in neighbors:
+                neighbor = (current_goal[0] + offset[0], current_goal[1] + offset[1])
+                if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and grid[neighbor] != 1:
+                    if neighbor in closed_list_goal:
+                        continue
+                    if blocked is not None and blocked[neighbor]:
+                        continue  # Di dalam safety margin
                     
-                    if not any(neighbor == item[1] for item in open_list_goal):
-                        heapq.heappush(open_list_goal, (f_score_goal[neighbor], neighbor))
+                    tentative_g_score = g_score_goal[current_goal] + (euclidean_distance(current_goal, neighbor) if offset[0] != 0 and offset[1] != 0 else 1)
+                    if step_penalty is not None:
+                        tentative_g_score += step_penalty[current_goal]  # Arah start -> goal memasuki current_goal
+                    if neighbor not in g_score_goal or tentative_g_score < g_score_goal[neighbor]:
+                        came_from_goal[neighbor] = current_goal
+                        g_score_goal[neighbor] = tentative_g_score
+                        f_score_goal[neighbor] = tentative_g_score + heuristic(neighbor, start)
+                        
+                        # Tambahkan ke open list, atau perbarui prioritasnya jika sudah ada
+                        open_list_goal.push(neighbor, f_score_goal[neighbor])
+                        if emit is not None:
+                            emit(NODE_OPENED, neighbor, tentative_g_score, f_score_goal[neighbor])
+                        
+                        # Perbarui mu jika neighbor sudah dicapai dari arah start
+                        if neighbor in g_score_start and tentative_g_score + g_score_start[neighbor] < best_cost:
+                            best_cost = tentative_g_score + g_score_start[neighbor]
+                            meeting_point = neighbor
+    
+    search_time = time.perf_counter() - search_begin
+    if meeting_point is not None:
+        if emit is not None:
+            emit(PATH_FOUND, goal, best_cost, best_cost)
+        reconstruction_begin = time.perf_counter()
+        path = reconstruct_path(meeting_point)
+        if stats is not None:
+            record_stats(True, search_time, time.perf_counter() - reconstruction_begin)
+        return path
     
+    if stats is not None:
+        record_stats(False, search_time)
     return None  # Tidak ada jalur ditemukan
 
 # Fungsi untuk mengganti path dengan nilai 5
@@ -126,16 +186,17 @@ def mark_path_on_map(grid, path):
             output_grid[step] = 5
     return output_grid
 
-# Jalankan algoritma A*
-path = bidirectional_a_star(map_grid)
+if __name__ == "__main__":
+    # Jalankan algoritma A*
+    path = bidirectional_a_star(map_grid)
 
-# Tampilkan hasil
-if path:
-    print("Path found:")
-    print([tuple(map(int, step)) for step in path])  # Format koordinat sebagai angka biasa
-    # Tandai path pada peta
-    result_grid = mark_path_on_map(map_grid, path)
-    print("\nMap with path marked as 5:")
-    print(result_grid)
-else:
-    print("No path found.")
+    # Tampilkan hasil
+    if path:
+        print("Path found:")
+        print([tuple(map(int, step)) for step in path])  # Format koordinat sebagai angka biasa
+        # Tandai path pada peta
+        result_grid = mark_path_on_map(map_grid, path)
+        print("\nMap with path marked as 5:")
+        print(result_grid)
+    else:
+        print("No path found.")
@@ -1,6 +1,12 @@
 import numpy as np
-import heapq
 import math
+import time
+
+from pathfinding.clearance import clearance_costs
+from pathfinding.heuristic_fields import guideline_heuristic_field
+from pathfinding.priority_queue import PriorityQueue
+from pathfinding.search_stats import HeuristicTimer, record_dict_search
+from pathfinding.tracing import NODE_EXPANDED, NODE_OPENED, PATH_FOUND, Tracer, get_emitter, print_event
 
 # Representasi peta: 2 = Start, 3 = Goal, 1 = Obstacle, 0 = Free space
 map_grid = np.array([
@@ -30,7 +36,13 @@ def find_coordinates(grid, value):
     return tuple(result[0]) if result.size > 0 else None
 
 # A* Algorithm dengan guideline
-def a_star_with_guideline(grid):
+# precompute=True: jarak ke goal + guideline cost dihitung sekali sebagai array
+# seluruh grid; field_cache (GoalDistanceCache) memakai ulang field jarak ke goal
+# antar query dengan goal yang sama (field_cache mengaktifkan precompute).
+# f dijumlahkan sebagai g + (h + c), jadi seri f yang sangat tipis bisa pecah berbeda.
+# clearance, safety_margin, clearance_weight: sama seperti ArrayAStarPathfinder (lihat clearance_costs)
+def a_star_with_guideline(grid, tracer=None, stats=None, precompute=False, field_cache=None,
+                          clearance=None, safety_margin=0.0, clearance_weight=0.0):
     # Temukan titik start dan goal
     start = find_coordinates(grid, 2)
     goal = find_coordinates(grid, 3)
@@ -40,38 +52,73 @@ def a_star_with_guideline(grid):
     
     # Inisialisasi struktur data
     rows, cols = grid.shape
-    open_list = []
-    heapq.heappush(open_list, (0, start))  # Priority queue (f_score, node)
+    blocked, step_penalty = clearance_costs(clearance, safety_margin, clearance_weight)
+    heuristic_field = None
+    field_time = 0.0
+    if precompute or field_cache is not None:
+        field_begin = time.perf_counter()
+        heuristic_field = guideline_heuristic_field(grid.shape, start, goal, field_cache)
+        field_time = time.perf_counter() - field_begin
+    emit = get_emitter(tracer)  # None jika tidak ada subscriber
+    open_list = PriorityQueue()
+    open_list.push(start, 0)  # Priority queue (node, f_score)
     came_from = {}  # Untuk melacak jalur
 
     # G-score (biaya dari start ke node saat ini)
     g_score = {start: 0}
     # F-score (g_score + heuristic + guideline_cost)
-    f_score = {start: euclidean_distance(start, goal) + guideline_cost(start, start, goal)}
+    if heuristic_field is not None:
+        f_score = {start: heuristic_field[start]}
+    else:
+        f_score = {start: euclidean_distance(start, goal) + guideline_cost(start, start, goal)}
     
     # Closed list untuk melacak node yang sudah diproses
     closed_list = set()
 
     # Set neighbor offsets (horizontal, vertical, diagonal)
     neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+    # Statistik (stats): heuristik = jarak ke goal + guideline cost (atau baca field) per
+    # neighbor, diakumulasi di loop lewat HeuristicTimer, ditambah waktu membangun field
+    timer = HeuristicTimer()
+    goal_distance = euclidean_distance
+    line_cost = guideline_cost
+    field_value = heuristic_field.__getitem__ if heuristic_field is not None else None
+    if stats is not None:
+        goal_distance = timer.wrap(euclidean_distance)
+        line_cost = timer.wrap(guideline_cost)
+        field_value = timer.wrap(field_value) if field_value is not None else None
+
+    def record_stats(found, search_time, reconstruction_time=0.0):
+        # Waktu membangun field termasuk waktu pencarian
+        record_dict_search(stats, [open_list], [closed_list], [g_score], [f_score, came_from],
+                           found, search_time + field_time, field_time + timer.total, reconstruction_time,
+                           closed_goal=True)
     
-    step = 1
+    search_begin = time.perf_counter()
     while open_list:
         # Ambil node dengan f_score terendah
-        current = heapq.heappop(open_list)[1]
+        current = open_list.pop()
         closed_list.add(current)  # Tambahkan ke closed list
         
         # Jika goal tercapai, rekonstruksi jalur
         if current == goal:
+            if emit is not None:
+                emit(PATH_FOUND, current, g_score[current], f_score[current])
+            search_time = time.perf_counter() - search_begin
+            reconstruction_begin = time.perf_counter()
             path = []
             while current in came_from:
                 path.append(current)
                 current = came_from[current]
             path.append(start)
-            return path[::-1]  # Balikkan jalur
+            path = path[::-1]  # Balikkan jalur
+            if stats is not None:
+                record_stats(True, search_time, time.perf_counter() - reconstruction_begin)
+            return path
         
-        print(f"Step {step}: Processing node {current}")
-        step += 1
+        if emit is not None:
+            emit(NODE_EXPANDED, current, g_score[current], f_score[current])
         
         # Proses semua neighbor
         for offset in neighbors:
@@ -81,32 +128,31 @@ def a_star_with_guideline(grid):
             if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and grid[neighbor] != 1:
                 if neighbor in closed_list:
                     continue
+                if blocked is not None and blocked[neighbor]:
+                    continue  # Di dalam safety margin
 
                 # Hitung G, H, dan C
                 g_new = g_score[current] + (euclidean_distance(current, neighbor) if offset[0] != 0 and offset[1] != 0 else 1)
-                h_new = euclidean_distance(neighbor, goal)
-                c_new = guideline_cost(neighbor, start, goal)
-
-                f_new = g_new + h_new + c_new  # Total evaluasi F
+                if step_penalty is not None:
+                    g_new += step_penalty[neighbor]  # Biaya clearance
+                if heuristic_field is not None:
+                    f_new = g_new + field_value(neighbor)  # H + C dari field
+                else:
+                    h_new = goal_distance(neighbor, goal)
+                    c_new = line_cost(neighbor, start, goal)
+                    f_new = g_new + h_new + c_new  # Total evaluasi F
 
                 if neighbor not in g_score or g_new < g_score[neighbor]:
                     came_from[neighbor] = current
                     g_score[neighbor] = g_new
                     f_score[neighbor] = f_new
-                    if not any(neighbor == item[1] for item in open_list):
-                        heapq.heappush(open_list, (f_new, neighbor))
-                        print(f"Added to open list: {neighbor}")
-                
-                # Tampilkan perhitungan g, h, f
-                print(f"Neighbor: {neighbor}")
-                print(f"  g = {g_new:.2f}")
-                print(f"  h = {h_new:.2f}")
-                print(f"  c = {c_new:.2f}")
-                print(f"  f = {f_new:.2f}")
-        
-        print(f"Closed list: {list(closed_list)}")
-        print('=========================================')
+                    # Tambahkan ke open list, atau perbarui prioritasnya jika sudah ada
+                    open_list.push(neighbor, f_new)
+                    if emit is not None:
+                        emit(NODE_OPENED, neighbor, g_new, f_new)
     
+    if stats is not None:
+        record_stats(False, time.perf_counter() - search_begin)
     return None  # Tidak ada jalur ditemukan
 
 # Fungsi untuk mengganti path dengan nilai 5
@@ -117,16 +163,17 @@ def mark_path_on_map(grid, path):
             output_grid[step] = 5
     return output_grid
 
-# Jalankan algoritma A*
-path = a_star_with_guideline(map_grid)
+if __name__ == "__main__":
+    # Jalankan algoritma A*
+    path = a_star_with_guideline(map_grid, tracer=Tracer(print_event))
 
-# Tampilkan hasil
-if path:
-    print("Path found:")
-    print([tuple(map(int, step)) for step in path])  # Format koordinat sebagai angka biasa
-    # Tandai path pada peta
-    result_grid = mark_path_on_map(map_grid, path)
-    print("\nMap with path marked as 5:")
-    print(result_grid)
-else:
-    print("No path found.")
+    # Tampilkan hasil
+    if path:
+        print("Path found:")
+        print([tuple(map(int, step)) for step in path])  # Format koordinat sebagai angka biasa
+        # Tandai path pada peta
+        result_grid = mark_path_on_map(map_grid, path)
+        print("\nMap with path marked as 5:")
+        print(result_grid)
+    else:
+        print("No path found.")
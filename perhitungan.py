@@ -1,9 +1,14 @@
 import numpy as np
-import heapq
 import math
+import time
+
+from pathfinding.clearance import clearance_costs
+from pathfinding.priority_queue import PriorityQueue
+from pathfinding.search_stats import HeuristicTimer, record_dict_search
+from pathfinding.tracing import NODE_EXPANDED, NODE_OPENED, PATH_FOUND, Tracer, get_emitter, print_event
 
 class AStarPathfinder:
-    def __init__(self, grid):
+    def __init__(self, grid, clearance=None, safety_margin=0.0, clearance_weight=0.0):
         """
         Inisialisasi A* pathfinder
         grid: numpy array dengan format:
@@ -11,8 +16,12 @@ class AStarPathfinder:
             1 = Obstacle/Wall
             2 = Start point
             3 = Goal/Target
+        clearance: ClearanceMap (atau array jarak ke obstacle) opsional,
+            dengan safety_margin dan clearance_weight seperti pada
+            ArrayAStarPathfinder (lihat clearance_costs)
         """
         self.grid = grid
+        self.blocked, self.step_penalty = clearance_costs(clearance, safety_margin, clearance_weight)
         self.rows, self.cols = grid.shape
         self.start = self._find_coordinates(2)  # Start point (value 2)
         self.goal = self._find_coordinates(3)   # Goal point (value 3)
@@ -44,38 +53,53 @@ class AStarPathfinder:
         """Menghitung biaya pergerakan (1 untuk orthogonal, √2 untuk diagonal)"""
         return math.sqrt(offset[0]**2 + offset[1]**2)
 
-    def find_path(self, debug=True):
+    def find_path(self, debug=False, tracer=None, stats=None):
         """
         Mencari jalur menggunakan algoritma A*
         debug: Boolean untuk menampilkan informasi debugging
+        tracer: Tracer opsional yang menerima event expanded/opened/path_found
+        stats: SearchStats opsional yang menerima statistik kerja pencarian
         """
         if debug:
             print("Starting A* pathfinding...")
             print(f"Start position: {self.start}")
             print(f"Goal position: {self.goal}")
+            tracer = Tracer(print_event, *(tracer.subscribers if tracer else []))
+        emit = get_emitter(tracer)
 
         # Inisialisasi struktur data
-        open_list = []  # Priority queue untuk node yang akan diperiksa
-        heapq.heappush(open_list, (0, self.start))
+        open_list = PriorityQueue()  # Priority queue untuk node yang akan diperiksa
+        open_list.push(self.start, 0)
         came_from = {}  # Untuk melacak jalur
         g_score = {self.start: 0}  # Biaya dari start ke setiap node
         f_score = {self.start: self._euclidean_distance(self.start, self.goal)}
         closed_list = set()  # Set untuk node yang sudah diperiksa
+
+        # Statistik (stats): waktu heuristik diakumulasi di loop lewat HeuristicTimer
+        timer = HeuristicTimer()
+        heuristic = timer.wrap(self._euclidean_distance) if stats is not None else self._euclidean_distance
+
+        def record_stats(found, search_time, reconstruction_time=0.0):
+            record_dict_search(stats, [open_list], [closed_list], [g_score], [f_score, came_from],
+                               found, search_time, timer.total, reconstruction_time)
         
-        step = 1
+        search_begin = time.perf_counter()
         while open_list:
-            current = heapq.heappop(open_list)[1]
+            current = open_list.pop()
             
             if current == self.goal:
-                if debug:
-                    print("\nGoal reached! Reconstructing path...")
-                return self._reconstruct_path(came_from)
+                if emit is not None:
+                    emit(PATH_FOUND, current, g_score[current], f_score[current])
+                search_time = time.perf_counter() - search_begin
+                reconstruction_begin = time.perf_counter()
+                path = self._reconstruct_path(came_from)
+                if stats is not None:
+                    record_stats(True, search_time, time.perf_counter() - reconstruction_begin)
+                return path
             
             closed_list.add(current)
-            
-            if debug:
-                print(f"\nStep {step}: Examining node {current}")
-                print(f"Current g_score: {g_score[current]:.3f}")
+            if emit is not None:
+                emit(NODE_EXPANDED, current, g_score[current], f_score[current])
             
             # Periksa semua tetangga
             for offset in self.neighbors:
@@ -86,6 +110,8 @@ class AStarPathfinder:
                        0 <= neighbor[1] < self.cols and 
                        self.grid[neighbor] != 1):
                     continue
+                if self.blocked is not None and self.blocked[neighbor]:
+                    continue  # Di dalam safety margin
                 
                 if neighbor in closed_list:
                     continue
@@ -93,30 +119,23 @@ class AStarPathfinder:
                 # Hitung skor
                 movement_cost = self._get_movement_cost(offset)
                 tentative_g_score = g_score[current] + movement_cost
+                if self.step_penalty is not None:
+                    tentative_g_score += self.step_penalty[neighbor]  # Biaya clearance
                 
                 if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
                     # Ditemukan jalur yang lebih baik ke neighbor
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g_score
-                    h_score = self._euclidean_distance(neighbor, self.goal)
+                    h_score = heuristic(neighbor, self.goal)
                     f_score[neighbor] = tentative_g_score + h_score
                     
-                    if not any(neighbor == item[1] for item in open_list):
-                        heapq.heappush(open_list, (f_score[neighbor], neighbor))
-                        
-                        if debug:
-                            print(f"\nNeighbor {neighbor}:")
-                            print(f"  Movement cost: {movement_cost:.3f}")
-                            print(f"  g_score: {tentative_g_score:.3f}")
-                            print(f"  h_score: {h_score:.3f}")
-                            print(f"  f_score: {f_score[neighbor]:.3f}")
-            
-            if debug:
-                print(f"Closed list: {list(closed_list)}")
-                print("=" * 80)
-            
-            step += 1
+                    # Tambah ke open list, atau perbarui prioritasnya jika sudah ada
+                    open_list.push(neighbor, f_score[neighbor])
+                    if emit is not None:
+                        emit(NODE_OPENED, neighbor, tentative_g_score, f_score[neighbor])
         
+        if stats is not None:
+            record_stats(False, time.perf_counter() - search_begin)
         if debug:
             print("\nNo path found!")
         return None
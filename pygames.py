@@ -1,8 +1,5 @@
 import pygame
 
-# Pygame Initialization
-pygame.init()
-
 # Screen settings
 WIDTH, HEIGHT = 400, 400
 TILE_SIZE = 100  # Ukuran tile/grid
@@ -15,15 +12,10 @@ RED = (255, 0, 0)
 GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 
-# Initialize screen
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Pygame Coordinate System")
-clock = pygame.time.Clock()
-
 # Poin-poin untuk membuktikan
 grid_points = [(0, 0), (1,2)]  # (row, col)
 
-def draw_grid():
+def draw_grid(screen):
     """Draw the grid."""
     for row in range(ROWS):
         for col in range(COLS):
@@ -31,7 +23,7 @@ def draw_grid():
             pygame.draw.rect(screen, WHITE, (x, y, TILE_SIZE, TILE_SIZE))
             pygame.draw.rect(screen, GREY, (x, y, TILE_SIZE, TILE_SIZE), 1)
 
-def draw_points(points):
+def draw_points(screen, points):
     """Draw points on the grid."""
     for row, col in points:
         x = row * TILE_SIZE
@@ -39,6 +31,12 @@ def draw_points(points):
         pygame.draw.rect(screen, RED, (x, y, TILE_SIZE, TILE_SIZE))
 
 def main():
+    # Pygame Initialization (hanya saat demo dijalankan, bukan saat di-import)
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Pygame Coordinate System")
+    clock = pygame.time.Clock()
+
     running = True
     while running:
         for event in pygame.event.get():
@@ -46,8 +44,8 @@ def main():
                 running = False
 
         screen.fill(WHITE)
-        draw_grid()
-        draw_points(grid_points)
+        draw_grid(screen)
+        draw_points(screen, grid_points)
         pygame.display.flip()
         clock.tick(60)
 
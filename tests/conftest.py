@@ -0,0 +1,66 @@
+import math
+import sys
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Paket pathfinding ada di root repositori (tanpa instalasi)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pathfinding import (  # noqa: E402
+    ArrayAStarPathfinder,
+    BarrierAStarPathfinder,
+    BidirectionalAStarPathfinder,
+    GuidelineAStarPathfinder,
+    JumpPointPathfinder,
+)
+from pathfinding.batch import path_cost  # noqa: E402
+
+# Semua engine find_path(start, goal): default (loop array NumPy) dan ExpansionKernel (kernel=True)
+ENGINES = {
+    "astar": ArrayAStarPathfinder,
+    "astar-kernel": partial(ArrayAStarPathfinder, kernel=True),
+    "barrier": BarrierAStarPathfinder,
+    "barrier-kernel": partial(BarrierAStarPathfinder, kernel=True),
+    "bidirectional": BidirectionalAStarPathfinder,
+    "bidirectional-kernel": partial(BidirectionalAStarPathfinder, kernel=True),
+    "guideline": GuidelineAStarPathfinder,
+    "guideline-kernel": partial(GuidelineAStarPathfinder, kernel=True),
+    "jps": JumpPointPathfinder,
+}
+
+
+@pytest.fixture
+def random_grid():
+    """Pembuat peta acak: random_grid(size, density, seed) dengan sudut kiri atas dan kanan bawah bebas"""
+
+    def make(size=32, density=0.25, seed=0):
+        rng = np.random.default_rng(seed)
+        grid = (rng.random((size, size)) < density).astype(np.uint8)
+        grid[0, 0] = grid[-1, -1] = 0
+        return grid
+
+    return make
+
+
+def random_pairs(grid, count, seed=0):
+    """count pasangan (start_row, start_col, goal_row, goal_col) acak di sel bebas"""
+    rng = np.random.default_rng(seed)
+    free = np.argwhere(grid == 0)
+    return np.hstack([free[rng.integers(len(free), size=count)], free[rng.integers(len(free), size=count)]])
+
+
+def assert_valid_path(grid, path, start, goal):
+    """Jalur sel demi sel dari start ke goal: langkah 8 arah, tidak melewati obstacle"""
+    assert tuple(path[0]) == tuple(start) and tuple(path[-1]) == tuple(goal)
+    steps = np.abs(np.diff(np.asarray(path), axis=0))
+    assert steps.max(initial=1) == 1 and steps.sum(axis=1).min(initial=1) > 0
+    assert all(grid[tuple(cell)] != 1 for cell in path)
+
+
+def astar_cost(grid, start, goal):
+    """Biaya jalur optimal menurut ArrayAStarPathfinder (loop array), inf jika tidak ada jalur"""
+    path = ArrayAStarPathfinder(grid).find_path(start, goal)
+    return math.inf if path is None else path_cost(np.array(path))
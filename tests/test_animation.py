@@ -0,0 +1,62 @@
+import os
+
+import numpy as np
+import pytest
+
+from pathfinding.animation import MAX_DIRTY_RECTS, GridRenderer, StepPlayer, with_path_events
+
+pygame = pytest.importorskip("pygame")
+
+CELL_COLORS = {0: (255, 255, 255), 1: (0, 0, 0), 2: (0, 255, 0), 3: (255, 0, 0)}
+STATE_COLORS = [("open", (0, 0, 255)), ("close", (255, 255, 0)), ("path", (0, 255, 255))]
+GREY = (200, 200, 200)
+
+
+@pytest.fixture
+def screen():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    yield pygame.display.set_mode((120, 120))
+    pygame.display.quit()
+
+
+@pytest.mark.parametrize("size, tile", [(5, 24), (40, 3), (120, 1)])
+def test_draw_all_matches_per_cell_paint(screen, size, tile):
+    rng = np.random.default_rng(size)
+    renderer = GridRenderer(screen, rng.integers(0, 5, (size, size)), tile, tile, CELL_COLORS, STATE_COLORS, GREY)
+    renderer.states[:] = rng.integers(0, 4, (size, size))
+    renderer.draw_all()
+    expected = pygame.surfarray.array3d(screen).copy()
+
+    screen.fill((9, 9, 9))
+    for row in range(size):
+        for col in range(size):
+            rank = renderer.states[row, col]
+            renderer._paint(row, col, renderer.colors[rank] if rank else None)
+    assert np.array_equal(pygame.surfarray.array3d(screen), expected)
+
+
+def test_busy_frame_paints_only_changed_cells(screen, monkeypatch):
+    renderer = GridRenderer(screen, np.zeros((120, 120), dtype=int), 1, 1, CELL_COLORS, STATE_COLORS, GREY)
+    assert renderer.present() is None  # Frame pertama: seluruh grid
+    monkeypatch.setattr(renderer, "draw_all", lambda: pytest.fail("full redraw"))
+
+    cells = [(row, col) for row in range(120) for col in range(120)][:MAX_DIRTY_RECTS + 10]
+    renderer.apply(("open", cell) for cell in cells)
+    assert renderer.present() is None  # Terlalu banyak rect: flip
+    renderer.apply([("close", (0, 0))])
+    assert len(renderer.present()) == 1
+    assert tuple(screen.get_at((0, 0)))[:3] == (255, 255, 0)
+
+
+def test_step_player_returns_generator_result():
+    def steps():
+        yield "open", (0, 0)
+        yield "close", (0, 0)
+        return [(0, 0)]
+
+    player = StepPlayer(with_path_events(steps()))
+    player.fast_forward = True
+    events = player.advance(0.0)
+    assert player.finished and player.result == [(0, 0)]
+    assert events[-1] == ("path", (0, 0))
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from pathfinding import BarrierIndex, GridMap
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_single_cell_updates_match_fresh_index(seed, random_grid):
+    grid = random_grid(20, 0.3, seed)
+    index = BarrierIndex(grid)
+    rng = np.random.default_rng(seed)
+    for row, col, value in zip(rng.integers(20, size=60), rng.integers(20, size=60), rng.integers(2, size=60)):
+        grid[row, col] = value
+        index.update_cell((int(row), int(col)), int(value))
+        assert np.array_equal(index.table, BarrierIndex(grid).table)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_batched_updates_match_fresh_index(seed, random_grid):
+    grid_map = GridMap(random_grid(25, 0.3, seed))
+    index = grid_map.barrier_index()
+    rng = np.random.default_rng(seed)
+    for _ in range(10):
+        # Sel yang sama bisa muncul dua kali; nilai terakhir yang berlaku
+        cells = rng.integers(25, size=(int(rng.integers(1, 12)), 2)).tolist()
+        grid_map.set_cells([((row, col), int(rng.integers(2))) for row, col in cells])
+        fresh = BarrierIndex(grid_map.grid)
+        assert np.array_equal(index.table, fresh.table)
+        row_min, col_min = rng.integers(25, size=2)
+        assert index.count(row_min, col_min, 24, 24) == np.count_nonzero(grid_map.grid[row_min:, col_min:] == 1)
@@ -0,0 +1,58 @@
+import math
+
+import numpy as np
+import pytest
+
+from conftest import random_pairs
+from pathfinding import BatchPlanner, CachedPlanner, GridMap, ParallelPlanner
+from pathfinding.batch import VARIANTS, path_cost
+
+
+@pytest.mark.parametrize("variant", ["astar", "bidirectional", "jps"])
+def test_safety_margin_matches_astar(random_grid, variant):
+    grid = random_grid(40, density=0.1, seed=4)
+    pairs = random_pairs(grid, 30)
+    expected = BatchPlanner(grid, "astar", safety_margin=1.5).find_paths(pairs)
+    result = BatchPlanner(grid, variant, safety_margin=1.5).find_paths(pairs)
+    assert np.array_equal(result.found, expected.found)
+    assert np.allclose(result.costs, expected.costs)
+
+
+def test_jps_safety_margin_in_every_entry_point(random_grid):
+    grid = random_grid(24, density=0.1, seed=5)
+    pairs = random_pairs(grid, 8)
+    expected = BatchPlanner(grid, "astar", safety_margin=1.5).find_paths(pairs)
+    cached = CachedPlanner(grid, variant="jps", safety_margin=1.5)
+    for (start_row, start_col, goal_row, goal_col), cost in zip(pairs.tolist(), expected.costs):
+        path = cached.find_path((start_row, start_col), (goal_row, goal_col))
+        assert (path is None) == math.isinf(cost)
+        if path is not None:
+            assert math.isclose(path_cost(np.array(path)), cost)
+    with ParallelPlanner(GridMap(grid), "jps", workers=2, safety_margin=1.5) as planner:
+        assert np.allclose(planner.find_paths(pairs).costs, expected.costs)
+
+
+@pytest.mark.parametrize("variant, options", [
+    ("jps", {"clearance_weight": 1.0}),
+    ("astar", {"turn_penalty_coefficient": 1.0}),
+    ("bidirectional", {"precompute": True}),
+])
+def test_unsupported_options_are_rejected_up_front(variant, options):
+    grid = np.zeros((8, 8), dtype=np.uint8)
+    for planner in (BatchPlanner, CachedPlanner):
+        with pytest.raises(ValueError, match="does not support"):
+            planner(grid, variant=variant, **options)
+    with pytest.raises(ValueError, match="does not support"):
+        ParallelPlanner(grid, variant, workers=1, **options)
+
+
+@pytest.mark.parametrize("variant", sorted(VARIANTS))
+def test_find_path_and_find_paths_agree_on_blocked_endpoints(variant):
+    grid = np.zeros((8, 8), dtype=np.uint8)
+    grid[0, 0] = grid[7, 7] = 1
+    planner = BatchPlanner(grid, variant)
+    pairs = [(0, 0, 4, 4), (4, 4, 7, 7), (1, 1, 6, 6)]
+    packed = planner.find_paths(pairs).to_lists()
+    single = [planner.find_path(pair[:2], pair[2:]) for pair in pairs]
+    assert packed[:2] == single[:2] == [None, None]
+    assert single[2] is not None and packed[2] == single[2]
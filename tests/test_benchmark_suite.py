@@ -0,0 +1,50 @@
+import json
+import math
+
+import numpy as np
+import pytest
+
+from pathfinding import ArrayAStarPathfinder
+from pathfinding.scripts import load_script
+
+suite = load_script("benchmark-suite.py")
+
+# Varian yang menjamin jalur optimal; barrier dan guideline boleh lebih mahal
+OPTIMAL = ["astar", "astar-script", "bidirectional", "bidirectional-script", "jps"]
+
+
+@pytest.mark.parametrize("family", sorted(suite.MAP_FAMILIES))
+def test_maps_are_reproducible_and_solvable(family):
+    grid, start, goal = suite.make_map(family, 64, seed=5)
+    again, start_again, goal_again = suite.make_map(family, 64, seed=5)
+    assert np.array_equal(grid, again) and (start, goal) == (start_again, goal_again)
+    assert not np.array_equal(grid, suite.make_map(family, 64, seed=6)[0])
+    assert grid[start] == 0 and grid[goal] == 0
+    assert ArrayAStarPathfinder(grid).find_path(start, goal) is not None
+
+
+def test_suite_runs_every_variant_and_writes_results(tmp_path, capsys):
+    variants = suite.build_variants()
+    results = suite.run_suite(variants, ["rooms"], [32], list(variants), seed=1, repeat=2, script_max_size=32)
+    assert [result["variant"] for result in results] == list(variants)
+    assert all(result["found"] and result["expanded"] > 0 and result["time_s"] > 0 for result in results)
+    costs = {result["variant"]: result["path_cost"] for result in results}
+    assert all(math.isclose(costs[name], costs["astar"]) for name in OPTIMAL)
+    assert all(costs[name] >= costs["astar"] - 1e-9 for name in costs)
+
+    # Varian skrip dilewati di atas script_max_size
+    skipped = suite.run_suite(variants, ["open"], [64], ["astar-script", "astar"], 1, 1, script_max_size=32)
+    assert [result["variant"] for result in skipped] == ["astar"]
+
+    suite.write_results(results, {"seed": 1}, tmp_path / "out")
+    saved = json.loads((tmp_path / "out.json").read_text())
+    assert saved["metadata"] == {"seed": 1} and len(saved["results"]) == len(results)
+    assert len((tmp_path / "out.csv").read_text().splitlines()) == len(results) + 1
+    capsys.readouterr()
+
+
+def test_path_metrics():
+    assert suite.path_metrics(None) == (0, None, 0)
+    assert suite.path_metrics([(0, 0)]) == (1, 0.0, 0)
+    cells, cost, turns = suite.path_metrics([(0, 0), (1, 1), (2, 2), (2, 3)])
+    assert (cells, turns) == (4, 1) and cost == pytest.approx(2 * math.sqrt(2) + 1)
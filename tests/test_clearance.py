@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+from conftest import ENGINES
+from pathfinding import ArrayAStarPathfinder, ClearanceMap, scripts
+from pathfinding.batch import path_cost
+
+SCRIPTS = {
+    "astar": lambda grid, **options: scripts.astar.AStarPathfinder(grid, **options).find_path(),
+    "barrier": lambda grid, **options: scripts.barrier.a_star_search(grid, **options),
+    "guideline": lambda grid, **options: scripts.guideline.a_star_with_guideline(grid, **options),
+    "bidirectional": lambda grid, **options: scripts.bidirectional.bidirectional_a_star(grid, **options),
+}
+OPTIONS = [{"safety_margin": 1.5}, {"clearance_weight": 2.0}, {"safety_margin": 1.5, "clearance_weight": 2.0}]
+
+
+def clearance_cost(path, clearance, weight):
+    """Biaya jalur termasuk biaya clearance untuk setiap sel yang dimasuki"""
+    cells = np.array(path)
+    return path_cost(cells) + sum(weight / max(clearance.field[tuple(cell)], 1.0) for cell in cells[1:])
+
+
+@pytest.mark.parametrize("options", OPTIONS, ids=str)
+@pytest.mark.parametrize("variant", sorted(SCRIPTS))
+def test_scripts_and_engines_apply_clearance(variant, options, random_grid):
+    grid = random_grid(32, 0.08, seed=0)
+    grid[:3, :3] = grid[-3:, -3:] = 0
+    clearance = ClearanceMap(grid)
+    marked = grid.copy()
+    marked[0, 0], marked[-1, -1] = 2, 3
+    expected = SCRIPTS[variant](marked, clearance=clearance, **options)
+    assert expected is not None
+    weight = options.get("clearance_weight", 0.0)
+    for name in (variant, f"{variant}-kernel"):
+        path = ENGINES[name](grid, clearance=clearance, **options).find_path((0, 0), (31, 31))
+        if variant == "bidirectional":
+            assert clearance_cost(path, clearance, weight) == pytest.approx(clearance_cost(expected, clearance, weight))
+        else:
+            assert path == expected
+    if "safety_margin" in options:
+        field = clearance.field
+        assert all(field[cell] >= options["safety_margin"] for cell in expected[1:])
+
+
+def test_jps_safety_margin_matches_astar_cost(random_grid):
+    grid = random_grid(32, 0.08, seed=0)
+    grid[:3, :3] = grid[-3:, -3:] = 0
+    clearance = ClearanceMap(grid)
+    astar = ENGINES["astar"](grid, clearance=clearance, safety_margin=1.5).find_path((0, 0), (31, 31))
+    jps = ENGINES["jps"](grid, clearance=clearance, safety_margin=1.5).find_path((0, 0), (31, 31))
+    assert path_cost(np.array(jps)) == pytest.approx(path_cost(np.array(astar)))
+    with pytest.raises(TypeError):
+        ENGINES["jps"](grid, clearance=clearance, clearance_weight=1.0)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_start_inside_margin_is_expanded_goal_inside_margin_is_unreachable(engine):
+    grid = np.zeros((9, 9), dtype=np.uint8)
+    grid[0, 4] = 1  # Sel (0, 3) dan (1, 4) berjarak 1 dari obstacle
+    clearance = ClearanceMap(grid)
+    pathfinder = ENGINES[engine](grid, clearance=clearance, safety_margin=2.0)
+    path = pathfinder.find_path((0, 3), (8, 8))
+    assert path is not None and path[0] == (0, 3)
+    assert pathfinder.find_path((8, 8), (1, 4)) is None
+
+
+def test_margin_options_require_clearance():
+    grid = np.zeros((4, 4), dtype=np.uint8)
+    with pytest.raises(ValueError, match="require a clearance map"):
+        ArrayAStarPathfinder(grid, safety_margin=1.0)
+    marked = grid.copy()
+    marked[0, 0], marked[3, 3] = 2, 3
+    with pytest.raises(ValueError, match="require a clearance map"):
+        scripts.barrier.a_star_search(marked, clearance_weight=1.0)
+
+
+@pytest.mark.parametrize("max_distance", [None, 2.0, 3.5])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_update_cells_matches_rebuilt_map(seed, max_distance, random_grid):
+    grid = random_grid(30, 0.15, seed)
+    clearance = ClearanceMap(grid, max_distance)
+    rng = np.random.default_rng(seed)
+    for _ in range(5):
+        # Perubahan berkelompok dan tersebar, menambah maupun membuang obstacle
+        cells = np.vstack([rng.integers(30, size=(4, 2)), rng.integers(10, 14, size=(4, 2))])
+        updates = [((int(row), int(col)), int(rng.integers(2))) for row, col in cells]
+        for cell, value in updates:
+            grid[cell] = value
+        clearance.update_cells(updates)
+        assert np.array_equal(clearance.field, ClearanceMap(grid, max_distance).field)
+
+
+@pytest.mark.parametrize("density", [0.0, 0.02, 0.3])
+def test_uncapped_update_matches_rebuilt_map(density, random_grid):
+    grid = random_grid(48, density, seed=7)
+    clearance = ClearanceMap(grid)
+    rng = np.random.default_rng(7)
+    for _ in range(10):
+        updates = [((int(row), int(col)), int(rng.integers(2))) for row, col in rng.integers(48, size=(2, 2))]
+        for cell, value in updates:
+            grid[cell] = value
+        clearance.update_cells(updates)
+        assert np.array_equal(clearance.field, ClearanceMap(grid).field)
+
+
+def test_uncapped_update_stays_local_on_dense_map(monkeypatch, random_grid):
+    from pathfinding import clearance as module
+
+    grid = random_grid(200, 0.3, seed=8)
+    clearance = ClearanceMap(grid)
+    windows = []
+    original = module._chamfer_window
+
+    def recording(obstacles, *args):
+        windows.append(obstacles.shape)
+        return original(obstacles, *args)
+
+    monkeypatch.setattr(module, "_chamfer_window", recording)
+    grid[100, 100] = 1 - grid[100, 100]
+    clearance.update_cells([((100, 100), int(grid[100, 100]))])
+    # Bukan hitung ulang seluruh peta: jendela terbesar jauh lebih kecil dari 200 x 200
+    assert windows and max(rows * cols for rows, cols in windows) < 200 * 200 // 10
+    monkeypatch.undo()
+    assert np.array_equal(clearance.field, ClearanceMap(grid).field)
@@ -0,0 +1,34 @@
+import math
+
+import numpy as np
+import pytest
+
+from pathfinding import ArrayAStarPathfinder, DistanceFieldPlanner
+from pathfinding.batch import path_cost
+
+
+def test_paths_match_astar_cost(random_grid):
+    grid = random_grid(24, seed=3)
+    planner = DistanceFieldPlanner(grid)
+    engine = ArrayAStarPathfinder(grid)
+    goal = (23, 23)
+    starts = [tuple(int(v) for v in cell) for cell in np.argwhere(grid == 0)[::17]]
+    for start, path in zip(starts, planner.find_paths(starts, goal)):
+        expected = engine.find_path(start, goal)
+        if expected is None:
+            assert path is None
+        else:
+            assert path[0] == start and path[-1] == goal
+            assert all(grid[cell] != 1 for cell in path)
+            assert math.isclose(path_cost(np.array(path)), path_cost(np.array(expected)))
+
+
+@pytest.mark.parametrize("start", [(0, 10), (-1, 0), (8, 3)])
+def test_starts_outside_grid_are_rejected(start):
+    planner = DistanceFieldPlanner(np.zeros((8, 8), dtype=np.uint8))
+    with pytest.raises(ValueError, match="outside the grid"):
+        planner.find_paths([start], (7, 7))
+    with pytest.raises(ValueError, match="outside the grid"):
+        planner.find_path(start, (7, 7))
+    with pytest.raises(ValueError, match="outside the grid"):
+        planner.field((7, 7)).cost(start)
@@ -0,0 +1,60 @@
+import math
+
+import numpy as np
+import pytest
+
+from conftest import assert_valid_path, astar_cost
+from pathfinding import DStarLitePlanner, GridMap
+from pathfinding.batch import path_cost
+
+
+def assert_matches_astar(grid, path, start, goal):
+    expected = astar_cost(grid, start, goal)
+    if path is None:
+        assert math.isinf(expected)
+    else:
+        assert_valid_path(grid, path, start, goal)
+        assert path_cost(np.array(path)) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_replanning_matches_astar_after_each_change(seed, random_grid):
+    grid_map = GridMap(random_grid(32, 0.25, seed))
+    start, goal = (0, 0), (31, 31)
+    planner = DStarLitePlanner(grid_map, start, goal)
+    path = planner.find_path()
+    assert_matches_astar(grid_map.grid, path, start, goal)
+
+    rng = np.random.default_rng(seed)
+    for _ in range(6):
+        # Tutup sel di tengah jalur saat ini dan buka beberapa obstacle acak
+        updates = []
+        if path is not None and len(path) > 2:
+            updates.append((path[len(path) // 2], 1))
+        for cell in np.argwhere(grid_map.grid == 1)[rng.integers(np.count_nonzero(grid_map.grid == 1), size=3)]:
+            updates.append((tuple(int(v) for v in cell), 0))
+        path = planner.update_cells(updates)
+        assert_matches_astar(grid_map.grid, path, start, goal)
+    planner.close()
+
+
+def test_moving_start_keeps_paths_optimal(random_grid):
+    grid_map = GridMap(random_grid(24, 0.2, seed=4))
+    goal = (23, 23)
+    planner = DStarLitePlanner(grid_map, (0, 0), goal)
+    path = planner.find_path()
+    while path is not None and len(path) > 1:
+        planner.move_start(path[1])
+        if len(path) > 4:
+            grid_map.set_cell(path[len(path) // 2], 1)  # Agen bergerak sambil peta berubah
+        path = planner.find_path()
+        assert_matches_astar(grid_map.grid, path, planner.start, goal)
+    planner.close()
+
+
+def test_changes_from_other_writers_are_seen():
+    grid_map = GridMap(np.zeros((5, 5), dtype=np.uint8))
+    planner = DStarLitePlanner(grid_map, (2, 0), (2, 4))
+    assert planner.find_path() == [(2, 0), (2, 1), (2, 2), (2, 3), (2, 4)]
+    grid_map.set_cells([((row, 2), 1) for row in range(5)])
+    assert planner.find_path() is None
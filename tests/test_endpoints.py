@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from conftest import ENGINES
+from pathfinding import (
+    BatchPlanner,
+    CachedPlanner,
+    ClearanceMap,
+    DistanceFieldPlanner,
+    DStarLitePlanner,
+    HierarchicalPathfinder,
+)
+from pathfinding.batch import VARIANTS
+
+OUTSIDE = [(0, 9), (0, -1), (-1, 3), (8, 0)]
+# (start, goal) dengan obstacle di (0, 0) dan (7, 7); pasangan terakhir terbuka
+BLOCKED = [((0, 0), (4, 4)), ((4, 4), (7, 7)), ((0, 0), (0, 0))]
+OPEN = ((4, 4), (4, 4))
+
+# Semua cara mencari satu jalur: planner -> fungsi(grid, start, goal) -> path
+PLANNERS = {
+    **{f"engine {name}": lambda grid, start, goal, name=name: ENGINES[name](grid).find_path(start, goal)
+       for name in ENGINES},
+    **{f"batch {variant}": lambda grid, start, goal, variant=variant: BatchPlanner(grid, variant).find_path(start, goal)
+       for variant in VARIANTS},
+    "find_paths": lambda grid, start, goal: BatchPlanner(grid).find_paths([(*start, *goal)]).to_lists()[0],
+    "cached": lambda grid, start, goal: CachedPlanner(grid).find_path(start, goal),
+    "hpa": lambda grid, start, goal: HierarchicalPathfinder(grid, cluster_size=4).find_path(start, goal),
+    "dstar": lambda grid, start, goal: DStarLitePlanner(grid, start, goal).find_path(),
+    "distance field": lambda grid, start, goal: DistanceFieldPlanner(grid).find_path(start, goal),
+}
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("node", OUTSIDE)
+def test_engines_reject_endpoints_outside_grid(engine, node):
+    pathfinder = ENGINES[engine](np.zeros((8, 8), dtype=np.uint8))
+    with pytest.raises(ValueError, match="outside the grid"):
+        pathfinder.find_path(node, (7, 7))
+    with pytest.raises(ValueError, match="outside the grid"):
+        pathfinder.find_path((0, 0), node)
+
+
+@pytest.mark.parametrize("node", OUTSIDE)
+def test_planners_reject_endpoints_outside_grid(node):
+    grid = np.zeros((8, 8), dtype=np.uint8)
+    cached = CachedPlanner(grid)
+    for planner in (BatchPlanner(grid), cached, HierarchicalPathfinder(grid, cluster_size=4)):
+        with pytest.raises(ValueError, match="outside the grid"):
+            planner.find_path(node, (7, 7))
+    assert len(cached.cache) == 0
+    with pytest.raises(ValueError, match="outside the grid"):
+        DStarLitePlanner(grid, node, (7, 7))
+
+
+@pytest.mark.parametrize("planner", PLANNERS)
+def test_obstacle_endpoints_give_none_everywhere(planner):
+    grid = np.zeros((8, 8), dtype=np.uint8)
+    grid[0, 0] = grid[7, 7] = 1
+    for start, goal in BLOCKED:
+        assert PLANNERS[planner](grid, start, goal) is None
+    assert PLANNERS[planner](grid, *OPEN) == [OPEN[0]]
+
+
+@pytest.mark.parametrize("variant", sorted(VARIANTS))
+def test_safety_margin_blocks_goal_but_not_start(variant):
+    grid = np.zeros((9, 9), dtype=np.uint8)
+    grid[0, 4] = 1
+    clearance = ClearanceMap(grid)
+    engine = VARIANTS[variant](grid, clearance=clearance, safety_margin=2.0)
+    planner = BatchPlanner(grid, variant, safety_margin=2.0)
+    for find_path in (engine.find_path, planner.find_path):
+        path = find_path((0, 3), (8, 8))  # Start di dalam margin: tetap dicari
+        assert path is not None and path[0] == (0, 3)
+        assert find_path((8, 8), (1, 4)) is None
+        assert find_path((1, 4), (1, 4)) is None
+    assert planner.find_paths([(0, 3, 8, 8), (8, 8, 1, 4)]).found.tolist() == [True, False]
@@ -0,0 +1,107 @@
+import math
+import sys
+from functools import partial
+
+import numpy as np
+import pytest
+
+from conftest import ENGINES, assert_valid_path, astar_cost, random_pairs
+from pathfinding import ArrayAStarPathfinder, BidirectionalAStarPathfinder, JumpPointPathfinder, SearchStats, scripts
+from pathfinding.batch import path_cost
+
+SEEDS = [0, 1, 2, 3]
+
+# Engine optimal: biaya jalurnya harus sama dengan ArrayAStarPathfinder
+OPTIMAL = {
+    "astar": ArrayAStarPathfinder,
+    "astar-packed": partial(ArrayAStarPathfinder, packed=True),
+    "bidirectional": BidirectionalAStarPathfinder,
+    "bidirectional-kernel": partial(BidirectionalAStarPathfinder, kernel=True),
+    "jps": JumpPointPathfinder,
+    "jps+": partial(JumpPointPathfinder, precompute=True),
+    "jps-packed": partial(JumpPointPathfinder, packed=True),
+}
+
+# Varian -> fungsi skrip perhitungan*(grid bertanda 2/3) -> path
+SCRIPTS = {
+    "astar": lambda grid: scripts.astar.AStarPathfinder(grid).find_path(),
+    "barrier": lambda grid: scripts.barrier.a_star_search(grid),
+    "guideline": lambda grid: scripts.guideline.a_star_with_guideline(grid),
+    "bidirectional": lambda grid: scripts.bidirectional.bidirectional_a_star(grid),
+}
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("variant", sorted(SCRIPTS))
+def test_kernel_and_array_loops_match_script(variant, seed, random_grid):
+    grid = random_grid(40, 0.25, seed)
+    marked = grid.copy()
+    marked[0, 0], marked[-1, -1] = 2, 3
+    expected = SCRIPTS[variant](marked)
+    kernel_engine = ENGINES[f"{variant}-kernel"](grid)
+    array_engine = ENGINES[variant](grid)
+    assert kernel_engine.kernel is not None and array_engine.kernel is None
+    path = kernel_engine.find_path((0, 0), (39, 39))
+    assert array_engine.find_path((0, 0), (39, 39)) == path
+    if variant == "bidirectional":
+        # Potensial rata-rata engine berbeda dari skrip: biaya sama, tie-break bisa beda
+        assert path_cost(np.array(path)) == pytest.approx(path_cost(np.array(expected)))
+    else:
+        assert path == expected
+
+
+@pytest.mark.parametrize("variant", ["astar", "barrier", "bidirectional", "guideline"])
+def test_kernel_is_skipped_where_it_cannot_run(variant, random_grid):
+    grid = random_grid(16, 0.2)
+    engine = ENGINES[f"{variant}-kernel"]
+    assert engine(grid, packed=True).kernel is None
+    assert engine(grid, clearance=np.full(grid.shape, 2.0), clearance_weight=1.0).kernel is None
+    assert engine(grid, clearance=np.full(grid.shape, 2.0), safety_margin=1.0).kernel is not None
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("engine", OPTIMAL)
+def test_optimal_engines_match_astar_cost(engine, seed, random_grid):
+    grid = random_grid(40, 0.3, seed)
+    pathfinder = OPTIMAL[engine](grid)
+    for start_row, start_col, goal_row, goal_col in random_pairs(grid, 12, seed).tolist():
+        start, goal = (start_row, start_col), (goal_row, goal_col)
+        path = pathfinder.find_path(start, goal)
+        expected = astar_cost(grid, start, goal)
+        if path is None:
+            assert math.isinf(expected)
+        else:
+            assert_valid_path(grid, path, start, goal)
+            assert path_cost(np.array(path)) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("engine", ["barrier", "barrier-kernel", "guideline", "guideline-kernel"])
+def test_weighted_engines_find_valid_paths(engine, seed, random_grid):
+    # Heuristik tidak admissible: jalur boleh lebih panjang, tetapi harus ada jika A* menemukannya
+    grid = random_grid(40, 0.3, seed)
+    pathfinder = ENGINES[engine](grid)
+    for start_row, start_col, goal_row, goal_col in random_pairs(grid, 12, seed).tolist():
+        start, goal = (start_row, start_col), (goal_row, goal_col)
+        path = pathfinder.find_path(start, goal)
+        expected = astar_cost(grid, start, goal)
+        assert (path is None) == math.isinf(expected)
+        if path is not None:
+            assert_valid_path(grid, path, start, goal)
+            assert path_cost(np.array(path)) >= expected - 1e-9
+
+
+@pytest.mark.parametrize("variant", ["astar", "barrier", "bidirectional", "guideline"])
+def test_kernel_is_opt_in_and_reports_its_footprint(variant, random_grid):
+    grid = random_grid(48, 0.2, seed=5)
+    assert ENGINES[variant](grid).kernel is None
+    engine = ENGINES[f"{variant}-kernel"](grid)
+    pointers = engine.state.nbytes  # Belum ada query: hanya list pointer dan bytearray
+    assert pointers >= 17 * engine.kernel.size
+    stats = SearchStats()
+    engine.find_path((0, 0), (47, 47), stats=stats)
+    # Objek float g dan int parent untuk sel yang disentuh ikut dihitung
+    assert stats.state_bytes > (2 if variant == "bidirectional" else 1) * pointers
+    # Reset membuang objek query sebelumnya; tersisa g = 0.0 milik start
+    engine.find_path((0, 0), (0, 0))
+    assert engine.state.nbytes == pointers + sys.getsizeof(0.0)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from pathfinding.grid_view import MAX_CELL, GridView, color_lut
+
+COLORS = {0: "#FFFFFF", 1: "#17252a", 2: (58, 175, 169)}
+
+
+def test_color_lut_accepts_hex_and_rgb():
+    lut = color_lut(COLORS, default=(1, 2, 3))
+    assert lut.shape == (256, 3) and lut.dtype == np.uint8
+    assert lut[1].tolist() == [0x17, 0x25, 0x2A] and lut[2].tolist() == [58, 175, 169]
+    assert lut[9].tolist() == [1, 2, 3]
+
+
+def test_zoom_keeps_pivot_cell_and_pan_is_clamped():
+    view = GridView((50, 80), (400, 250), COLORS)
+    assert view.cell_size == 5 and view.visible_range() == (0, 50, 0, 80)
+    cell = view.screen_to_cell(123, 77)
+    view.zoom(4, pivot=(123, 77))
+    assert view.cell_size == 20 and view.screen_to_cell(123, 77) == cell
+    view.pan(10 ** 6, 10 ** 6)
+    row_begin, row_end, col_begin, col_end = view.visible_range()
+    assert (row_end, col_end) == (50, 80) and (row_end - row_begin, col_end - col_begin) == (13, 20)
+    assert view.screen_to_cell(399, 249) == (49, 79)
+    assert view.screen_to_cell(*view.cell_center((45, 70))) == (45, 70)
+    view.zoom(10 ** 6)
+    assert view.cell_size == MAX_CELL
+    view.zoom(1e-6)
+    assert view.cell_size == view.min_cell and (view.origin_row, view.origin_col) == (0.0, 0.0)
+
+
+@pytest.mark.parametrize("shape, zoom", [((20, 30), 1), ((20, 30), 3), ((2000, 1500), 1)])
+def test_draw_colors_cells_through_lut(shape, zoom):
+    pygame = pytest.importorskip("pygame")
+    grid = np.random.default_rng(0).integers(3, size=shape).astype(np.uint8)
+    view = GridView(shape, (300, 200), COLORS)
+    view.zoom(zoom, pivot=(0, 0))
+    surface = pygame.Surface((300, 200))
+    view.draw(surface, grid)
+    pixels = pygame.surfarray.pixels3d(surface)
+    row_begin, row_end, col_begin, col_end = view.visible_range()
+    # Peta lebih besar dari viewport: satu piksel mewakili sel kelipatan stride
+    stride = max(int(1 / view.cell_size), 1)
+    for row in range(row_begin, row_end, stride * max((row_end - row_begin) // stride // 7, 1)):
+        for col in range(col_begin, col_end, stride * max((col_end - col_begin) // stride // 7, 1)):
+            x, y = view.cell_center((row, col))
+            if x < 300 and y < 200:
+                assert pixels[x, y].tolist() == view.lut[grid[row, col]].tolist()
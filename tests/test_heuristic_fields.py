@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from conftest import ENGINES
+from pathfinding import BatchPlanner, GoalDistanceCache, goal_distance_field
+
+
+def test_flat_list_entry_matches_field():
+    cache = GoalDistanceCache()
+    field = cache.get((5, 7), (2, 3))
+    assert cache.get((5, 7), (2, 3), flat_list=True) == field.ravel().tolist()
+    assert np.array_equal(field, goal_distance_field((5, 7), (2, 3)))
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 2)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_field_cache_gives_same_paths(engine, random_grid):
+    grid = random_grid(32, 0.2, seed=2)
+    free = np.argwhere(grid == 0)[::97].tolist()
+    cache = GoalDistanceCache()
+    plain = ENGINES[engine](grid)
+    cached = ENGINES[engine](grid, field_cache=cache)
+    for start in free:
+        assert cached.find_path(start, (31, 31)) == plain.find_path(start, (31, 31))
+    # Satu field per goal; query berikutnya ke goal yang sama memakai ulang
+    assert (cache.misses, cache.hits) == (1, len(free) - 1)
+
+
+@pytest.mark.parametrize("variant", ["astar", "bidirectional", "jps"])
+def test_find_paths_shares_goal_distance_field(variant, random_grid):
+    grid = random_grid(32, 0.2, seed=6)
+    free = np.argwhere(grid == 0)
+    pairs = np.hstack([free[::40], np.tile([31, 31], (len(free[::40]), 1))])
+    planner = BatchPlanner(grid, variant)
+    expected = planner.find_paths(pairs)
+    cache = GoalDistanceCache()
+    result = planner.find_paths(pairs, field_cache=cache)
+    assert result.to_lists() == expected.to_lists()
+    # Satu field per goal, juga untuk bidirectional (jarak ke start dihitung langsung)
+    assert (cache.misses, cache.hits) == (1, len(pairs) - 1)
+    assert planner.engine.field_cache is None
+    # Sebagai option engine: dipakai semua query planner
+    optioned = BatchPlanner(grid, variant, field_cache=GoalDistanceCache())
+    assert optioned.find_paths(pairs).to_lists() == expected.to_lists()
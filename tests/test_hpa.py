@@ -0,0 +1,43 @@
+import math
+
+import numpy as np
+import pytest
+
+from conftest import assert_valid_path, astar_cost, random_pairs
+from pathfinding import GridMap, HierarchicalPathfinder
+from pathfinding.batch import path_cost
+
+
+def assert_near_astar(grid, planner, pairs):
+    # HPA* mendekati optimal: jalur ada tepat jika A* menemukannya, biaya >= optimal
+    for start_row, start_col, goal_row, goal_col in pairs.tolist():
+        start, goal = (start_row, start_col), (goal_row, goal_col)
+        path = planner.find_path(start, goal)
+        if grid[start] == 1 or grid[goal] == 1:
+            assert path is None  # Endpoint obstacle tidak dicari (A* tetap meng-expand start)
+            continue
+        expected = astar_cost(grid, start, goal)
+        assert (path is None) == math.isinf(expected)
+        if path is not None:
+            assert_valid_path(grid, path, start, goal)
+            assert path_cost(np.array(path)) >= expected - 1e-9
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("cluster_size", [5, 8, 16])
+def test_paths_exist_exactly_when_astar_finds_one(cluster_size, seed, random_grid):
+    grid = random_grid(45, 0.3, seed)
+    assert_near_astar(grid, HierarchicalPathfinder(grid, cluster_size), random_pairs(grid, 20, seed))
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_cell_changes_rebuild_affected_clusters(seed, random_grid):
+    grid_map = GridMap(random_grid(40, 0.25, seed))
+    planner = HierarchicalPathfinder(grid_map, cluster_size=8)
+    pairs = random_pairs(grid_map.grid, 15, seed)
+    rng = np.random.default_rng(seed)
+    for _ in range(4):
+        cells = rng.integers(40, size=(12, 2)).tolist()
+        grid_map.set_cells([((row, col), int(rng.integers(2))) for row, col in cells])
+        assert_near_astar(grid_map.grid, planner, pairs)
+    planner.close()
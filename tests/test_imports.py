@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pathfinding.scripts import ROOT, SCRIPTS, load_script
+
+benchmark_import = load_script("benchmark-import.py")
+
+
+def loaded_modules(code):
+    """Modul yang dimuat code pada interpreter baru"""
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{code}\nprint(' '.join(sys.modules))"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+        env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1", "SDL_VIDEODRIVER": "dummy"},
+    )
+    return set(result.stdout.split())
+
+
+def test_package_import_skips_pygame_and_process_pools():
+    modules = loaded_modules("import pathfinding")
+    assert "pathfinding" in modules
+    assert not {"pygame", "concurrent.futures", "multiprocessing"} & modules
+
+
+@pytest.mark.parametrize("name", sorted(SCRIPTS))
+def test_scripts_load_without_pygame(name):
+    assert "pygame" not in loaded_modules(f"from pathfinding import scripts; scripts.{name}")
+
+
+@pytest.mark.parametrize("file_name", ["map_making.py", "pygames.py"])
+def test_editors_do_not_open_a_window_on_import(file_name):
+    pytest.importorskip("pygame")
+    modules = loaded_modules(
+        f"from pathfinding.scripts import load_script; import pygame; load_script({file_name!r})\n"
+        "assert not pygame.display.get_init()"
+    )
+    assert "pygame" in modules
+
+
+def test_import_benchmark_flags_headless_targets():
+    assert set(benchmark_import.HEADLESS_TARGETS) == set(benchmark_import.TARGETS) - {"pygame"}
+    elapsed, loaded_pygame = benchmark_import.measure(benchmark_import.TARGETS["scripts.animasi"], repeat=1)
+    assert elapsed > 0 and not loaded_pygame
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from pathfinding import ArrayAStarPathfinder, MapFile, load_map, save_map
+
+
+@pytest.mark.parametrize("encoding", ["uint8", "bits"])
+def test_round_trip_with_edge_tiles(tmp_path, random_grid, encoding):
+    grid = random_grid(37, seed=2)
+    path = tmp_path / "peta.pfmap"
+    save_map(path, grid, encoding=encoding, tile_shape=(16, 16))
+    assert np.array_equal(load_map(path), grid)
+    with MapFile(path) as map_file:
+        assert np.array_equal(map_file.read_region(10, 5, 30, 37), grid[10:30, 5:37])
+
+
+def test_engine_on_map_file_matches_array(tmp_path, random_grid):
+    grid = random_grid(40, seed=6)
+    path = tmp_path / "peta.pfmap"
+    save_map(path, grid, tile_shape=(8, 8))
+    with MapFile(path) as map_file:
+        result = ArrayAStarPathfinder(map_file).find_path((0, 0), (39, 39))
+    assert result == ArrayAStarPathfinder(grid).find_path((0, 0), (39, 39))
+
+
+def test_closed_map_file_raises_clear_error(tmp_path):
+    path = tmp_path / "peta.pfmap"
+    save_map(path, np.zeros((4, 4), dtype=np.uint8))
+    map_file = MapFile(path)
+    tile = map_file.tile(0, 0)
+    map_file.close()
+    map_file.close()  # Menutup dua kali tidak error
+    assert map_file.closed
+    assert tile.shape == (4, 4)
+    with pytest.raises(ValueError, match="is closed"):
+        map_file.tile(0, 0)
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from pathfinding import ArrayAStarPathfinder, JumpPointPathfinder, PackedGrid
+
+
+@pytest.mark.parametrize("engine", [ArrayAStarPathfinder, JumpPointPathfinder])
+def test_engines_accept_packed_grid(random_grid, engine):
+    grid = random_grid(33, seed=7)
+    packed = PackedGrid(grid)
+    assert packed.shape == grid.shape
+    assert np.array_equal(packed.read(), grid)
+
+    pathfinder = engine(packed)
+    path = pathfinder.find_path((0, 0), (32, 32))
+    assert path == engine(grid).find_path((0, 0), (32, 32))
+    marked = pathfinder.mark_path_on_grid(path)
+    assert np.count_nonzero(marked == 5) == len(path)
+    with pytest.raises(ValueError, match="not found"):
+        pathfinder.find_path()
+
+
+def test_packed_jps_matches_array_jps(random_grid):
+    grid = random_grid(70, density=0.3, seed=8)
+    expected = JumpPointPathfinder(grid).find_path((0, 0), (69, 69))
+    assert JumpPointPathfinder(grid, packed=True).find_path((0, 0), (69, 69)) == expected
+    assert JumpPointPathfinder(PackedGrid(grid), packed=True).find_path((0, 0), (69, 69)) == expected
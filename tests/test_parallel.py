@@ -0,0 +1,72 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from conftest import random_pairs
+from pathfinding import BatchPlanner, GridMap, ParallelPlanner
+
+
+@pytest.mark.parametrize("variant", ["astar", "bidirectional", "jps"])
+@pytest.mark.parametrize("chunk_size", [None, 1, 7])
+def test_results_match_batch_planner(variant, chunk_size, random_grid):
+    grid = random_grid(32, 0.2, seed=3)
+    pairs = random_pairs(grid, 25, seed=3)
+    expected = BatchPlanner(grid, variant).find_paths(pairs)
+    with ParallelPlanner(GridMap(grid), variant, workers=2, chunk_size=chunk_size) as planner:
+        result = planner.find_paths(pairs)
+        indices = sorted(index for index, _, _ in planner.imap_unordered(pairs))
+    assert result.to_lists() == expected.to_lists()
+    assert np.array_equal(result.costs, expected.costs)
+    assert indices == list(range(len(pairs)))
+
+
+def test_empty_input_gives_empty_result(random_grid):
+    with ParallelPlanner(random_grid(8), workers=1) as planner:
+        result = planner.find_paths(np.empty((0, 4), dtype=np.int64))
+        assert len(result) == 0 and result.coords.shape == (0, 2)
+        assert list(planner.imap_unordered([])) == []
+
+
+def test_close_releases_shared_memory(random_grid):
+    planner = ParallelPlanner(random_grid(8), workers=1)
+    name = planner._memory.name
+    planner.close()
+    planner.close()  # Idempoten
+    with pytest.raises(RuntimeError):
+        planner.find_paths([[0, 0, 7, 7]])
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_failed_pool_start_releases_shared_memory(monkeypatch, random_grid):
+    import concurrent.futures
+
+    created = []
+    original = shared_memory.SharedMemory
+
+    def recording(*args, **kwargs):
+        memory = original(*args, **kwargs)
+        created.append(memory.name)
+        return memory
+
+    def failing(*args, **kwargs):
+        raise OSError("no processes")
+
+    monkeypatch.setattr(shared_memory, "SharedMemory", recording)
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", failing)
+    with pytest.raises(OSError):
+        ParallelPlanner(random_grid(8), workers=1)
+    monkeypatch.undo()
+    assert len(created) == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=created[0])
+
+
+def test_changed_grid_map_is_rejected(random_grid):
+    grid_map = GridMap(random_grid(8))
+    with ParallelPlanner(grid_map, workers=1) as planner:
+        assert planner.find_paths([[0, 0, 7, 7]]).found.all()
+        grid_map.set_cell((3, 3), 1)
+        with pytest.raises(RuntimeError, match="create a new planner"):
+            planner.find_paths([[0, 0, 7, 7]])
@@ -0,0 +1,73 @@
+import math
+
+import numpy as np
+import pytest
+
+from conftest import assert_valid_path, astar_cost, random_pairs
+from pathfinding import CachedPlanner, GridMap, PathCache
+from pathfinding.batch import path_cost
+
+
+def test_shared_cache_does_not_mix_maps_with_equal_content():
+    grid = np.zeros((5, 5), dtype=np.uint8)
+    cache = PathCache()
+    a = CachedPlanner(GridMap(grid), cache)
+    b = CachedPlanner(GridMap(grid), cache)
+    a.find_path((4, 0), (4, 4))  # map_id a dihitung sebelum perubahan
+
+    a.grid_map.set_cell((0, 2), 1)
+    assert b.find_path((0, 0), (0, 4)) == [(0, 0), (0, 1), (0, 2), (0, 3), (0, 4)]
+    path = a.find_path((0, 0), (0, 4))
+    assert (0, 2) not in path
+    assert path[0] == (0, 0) and path[-1] == (0, 4)
+
+
+def test_closed_planner_entries_are_not_reused_after_change():
+    grid_map = GridMap(np.zeros((5, 5), dtype=np.uint8))
+    cache = PathCache()
+    first = CachedPlanner(grid_map, cache)
+    first.find_path((0, 0), (0, 4))
+    first.close()
+
+    grid_map.set_cell((0, 2), 1)
+    second = CachedPlanner(grid_map, cache)
+    assert (0, 2) not in second.find_path((0, 0), (0, 4))
+
+
+def test_unaffected_paths_survive_a_change():
+    grid_map = GridMap(np.zeros((8, 8), dtype=np.uint8))
+    planner = CachedPlanner(grid_map)
+    top = planner.find_path((0, 0), (0, 7))
+    planner.find_path((7, 0), (7, 7))
+
+    grid_map.set_cell((7, 3), 1)
+    assert planner.cache.invalidations == 1
+    hits = planner.cache.hits
+    assert planner.find_path((0, 0), (0, 7)) == top
+    assert planner.cache.hits == hits + 1
+    assert (7, 3) not in planner.find_path((7, 0), (7, 7))
+
+
+@pytest.mark.parametrize("variant", ["astar", "jps"])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_cached_paths_stay_optimal_while_map_changes(seed, variant, random_grid):
+    grid_map = GridMap(random_grid(32, 0.2, seed))
+    planner = CachedPlanner(grid_map, variant=variant)
+    pairs = random_pairs(grid_map.grid, 25, seed)
+    rng = np.random.default_rng(seed)
+    for _ in range(5):
+        for start_row, start_col, goal_row, goal_col in pairs.tolist():
+            start, goal = (start_row, start_col), (goal_row, goal_col)
+            path = planner.find_path(start, goal)
+            if grid_map.grid[start] == 1 or grid_map.grid[goal] == 1:
+                assert path is None
+                continue
+            expected = astar_cost(grid_map.grid, start, goal)
+            assert (path is None) == math.isinf(expected)
+            if path is not None:
+                assert_valid_path(grid_map.grid, path, start, goal)
+                # Perubahan hanya menambah obstacle, jadi entri yang lolos invalidasi tetap optimal
+                assert path_cost(np.array(path)) == pytest.approx(expected)
+        cells = rng.integers(32, size=(6, 2)).tolist()
+        grid_map.set_cells([((row, col), 1) for row, col in cells])
+    assert planner.cache.hits > 0 and planner.cache.invalidations > 0
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from conftest import random_pairs
+from pathfinding import ArrayAStarPathfinder, PathSmoother, smooth_path
+from pathfinding.polyline import LINE_METHODS, path_length
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("method", sorted(LINE_METHODS))
+def test_waypoints_keep_endpoints_and_line_of_sight(method, seed, random_grid):
+    grid = random_grid(40, 0.2, seed)
+    engine = ArrayAStarPathfinder(grid)
+    smoother = PathSmoother(grid, method)
+    for start_row, start_col, goal_row, goal_col in random_pairs(grid, 10, seed).tolist():
+        path = engine.find_path((start_row, start_col), (goal_row, goal_col))
+        if path is None:
+            assert smoother.smooth(path) is None
+            continue
+        result = smoother.smooth(path)
+        waypoints = result.waypoints
+        assert waypoints[0] == path[0] and waypoints[-1] == path[-1]
+        assert set(waypoints) <= set(path)
+        for begin, end in zip(waypoints, waypoints[1:]):
+            rows, cols = LINE_METHODS[method](begin, end)
+            assert (grid[rows, cols] != 1).all()
+        assert result.length_after <= result.length_before + 1e-9
+        assert result.length_before == pytest.approx(path_length(path))
+
+
+def test_straight_run_collapses_to_endpoints():
+    grid = np.zeros((3, 6), dtype=np.uint8)
+    result = smooth_path(grid, [(1, col) for col in range(6)])
+    assert result.waypoints == [(1, 0), (1, 5)]
+    assert result.removed == 4 and result.length_change == 0.0
+
+
+def test_supercover_does_not_cut_between_diagonal_obstacles():
+    grid = np.zeros((3, 3), dtype=np.uint8)
+    grid[0, 1] = grid[1, 2] = 1
+    smoother = PathSmoother(grid)
+    # Segmen (0, 0) -> (1, 2) melewati bagian dalam (0, 1)
+    assert not smoother.line_of_sight((0, 0), (1, 2))
+    assert smoother.line_of_sight((0, 0), (2, 2))
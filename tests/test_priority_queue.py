@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from pathfinding.priority_queue import PriorityQueue
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_pops_in_priority_order_after_updates_and_removals(seed):
+    rng = np.random.default_rng(seed)
+    queue = PriorityQueue()
+    expected = {}
+    for _ in range(300):
+        item = (int(rng.integers(20)), int(rng.integers(20)))
+        if item in expected and rng.random() < 0.2:
+            queue.remove(item)
+            del expected[item]
+        else:
+            priority = float(rng.integers(100))
+            queue.push(item, priority)
+            expected[item] = priority
+        assert len(queue) == len(expected)
+
+    popped = []
+    while queue:
+        assert queue.peek_priority() == min(expected.values())
+        priority, item = queue.pop_with_priority()
+        assert expected.pop(item) == priority and item not in queue
+        popped.append(priority)
+    assert popped == sorted(popped) and not expected
+    assert queue.peek_priority() is None
+    # Setiap push yang diganti atau dihapus menjadi tepat satu entri basi
+    assert queue.pushes == len(popped) + queue.stale_pops
+
+
+def test_push_replaces_priority():
+    queue = PriorityQueue()
+    queue.push("a", 5)
+    queue.push("b", 3)
+    queue.push("a", 1)
+    assert queue.priority("a") == 1 and len(queue) == 2
+    assert queue.pop() == "a" and queue.pop() == "b"
+    assert queue.peak_size == 3
+
+
+def test_empty_queue_errors():
+    queue = PriorityQueue()
+    assert not queue
+    with pytest.raises(IndexError):
+        queue.pop()
+    with pytest.raises(KeyError):
+        queue.priority("missing")
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from pathfinding import ArrayAStarPathfinder, load_recording, record_search, render_frames
+from pathfinding.recording import CELL_COLORS, EVENT_STATES, STATE_COLORS, render_png_sequence
+
+
+def replay(grid, events):
+    """Gambar yang diharapkan setelah events: status tertinggi per sel menimpa warna grid"""
+    image = np.array([[CELL_COLORS[value] for value in row] for row in grid.tolist()], dtype=np.uint8)
+    states = {}
+    for event in events:
+        state = EVENT_STATES.get(int(event["event"]), 0)
+        cell = (int(event["row"]), int(event["col"]))
+        if state > states.get(cell, 0):
+            states[cell] = state
+            image[cell] = STATE_COLORS[state - 1]
+    return image
+
+
+@pytest.fixture
+def recording(tmp_path, random_grid):
+    grid = random_grid(16, 0.2, seed=1)
+    engine = ArrayAStarPathfinder(grid)
+    path = record_search(tmp_path / "search.npz", grid, lambda tracer: engine.find_path((0, 0), (15, 15), tracer=tracer))
+    assert path is not None
+    return load_recording(tmp_path / "search.npz")
+
+
+@pytest.mark.parametrize("scale", [1, 3])
+def test_frame_k_shows_events_replayed_up_to_k(recording, scale):
+    grid, events = recording
+    per_frame = 7
+    frames = list(render_frames(grid, events, events_per_frame=per_frame, scale=scale))
+    events = events[np.isin(events["event"], list(EVENT_STATES))]  # Hanya event yang mewarnai sel
+    assert len(frames) == 1 + -(-len(events) // per_frame)
+    assert len({id(frame) for frame in frames}) == len(frames)
+    for index, frame in enumerate(frames):
+        expected = replay(grid, events[:index * per_frame])
+        assert np.array_equal(frame, expected.repeat(scale, axis=0).repeat(scale, axis=1))
+
+
+def test_png_sequence_writes_every_frame(tmp_path, recording):
+    grid, events = recording
+    np.savez(tmp_path / "copy.npz", grid=grid, events=events)
+    count = render_png_sequence(tmp_path / "copy.npz", tmp_path / "frames", events_per_frame=50)
+    files = sorted((tmp_path / "frames").iterdir())
+    drawn = np.count_nonzero(np.isin(events["event"], list(EVENT_STATES)))
+    assert count == len(files) == 1 + -(-drawn // 50)
+    assert all(file.read_bytes().startswith(b"\x89PNG") for file in files)
@@ -0,0 +1,29 @@
+import pytest
+
+from conftest import ENGINES
+from pathfinding import SearchStats, scripts
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_heuristic_time_is_part_of_search_time(engine, random_grid):
+    grid = random_grid(48, 0.2, seed=3)
+    stats = SearchStats()
+    assert ENGINES[engine](grid).find_path((0, 0), (47, 47), stats=stats) is not None
+    # Diukur di loop, jadi selalu bagian dari search_time (tanpa clamp)
+    assert 0.0 < stats.heuristic_time < stats.search_time
+    assert stats.expansion_time > 0.0
+
+
+@pytest.mark.parametrize("run", [
+    lambda grid, stats: scripts.astar.AStarPathfinder(grid).find_path(stats=stats),
+    lambda grid, stats: scripts.barrier.a_star_search(grid, stats=stats),
+    lambda grid, stats: scripts.guideline.a_star_with_guideline(grid, stats=stats),
+    lambda grid, stats: scripts.guideline.a_star_with_guideline(grid, stats=stats, precompute=True),
+    lambda grid, stats: scripts.bidirectional.bidirectional_a_star(grid, stats=stats),
+], ids=["astar", "barrier", "guideline", "guideline-precompute", "bidirectional"])
+def test_script_heuristic_time_is_part_of_search_time(run, random_grid):
+    grid = random_grid(24, 0.2, seed=3)
+    grid[0, 0], grid[-1, -1] = 2, 3
+    stats = SearchStats()
+    assert run(grid, stats) is not None
+    assert 0.0 < stats.heuristic_time < stats.search_time
@@ -0,0 +1,48 @@
+import json
+
+import numpy as np
+import pytest
+
+from pathfinding import ArrayAStarPathfinder, BinaryTraceWriter, NdjsonTraceWriter, Tracer, read_binary_trace
+from pathfinding.tracing import EVENT_NAMES, NODE_EXPANDED, PATH_FOUND, EventCounter, get_emitter
+
+
+@pytest.mark.parametrize("buffer_size", [1, 7, 65536])
+def test_writers_record_every_event(tmp_path, buffer_size, random_grid):
+    grid = random_grid(16, 0.2, seed=3)
+    events = []
+    counter = EventCounter()
+    with NdjsonTraceWriter(tmp_path / "trace.ndjson", buffer_size) as ndjson, \
+            BinaryTraceWriter(tmp_path / "trace.bin", buffer_size) as binary:
+        tracer = Tracer(lambda *event: events.append(event), counter, ndjson, binary)
+        path = ArrayAStarPathfinder(grid).find_path((0, 0), (15, 15), tracer=tracer)
+    assert path == ArrayAStarPathfinder(grid).find_path((0, 0), (15, 15))
+    assert events[-1][0] == PATH_FOUND and tuple(events[-1][1]) == (15, 15)
+    assert sum(counter.counts.values()) == len(events)
+    assert counter.counts[NODE_EXPANDED] == sum(event == NODE_EXPANDED for event, *_ in events)
+
+    lines = [json.loads(line) for line in (tmp_path / "trace.ndjson").read_text().splitlines()]
+    assert [(line["event"], tuple(line["node"])) for line in lines] == [
+        (EVENT_NAMES[event], tuple(int(v) for v in node)) for event, node, _, _ in events
+    ]
+    assert [line["g"] for line in lines] == pytest.approx([g for _, _, g, _ in events])
+
+    records = read_binary_trace(tmp_path / "trace.bin")
+    assert records["event"].tolist() == [event for event, *_ in events]
+    assert np.array_equal(np.column_stack([records["row"], records["col"]]), [node for _, node, _, _ in events])
+    # g dan f disimpan sebagai float32
+    assert np.allclose(records["f"], [f for *_, f in events], rtol=1e-6)
+
+
+def test_emitter_is_skipped_without_subscribers():
+    assert get_emitter(None) is None and get_emitter(Tracer()) is None
+    subscriber = EventCounter()
+    assert get_emitter(Tracer(subscriber)) is subscriber
+    tracer = Tracer(subscriber, EventCounter())
+    assert get_emitter(tracer) == tracer.emit
+
+
+def test_invalid_binary_trace_is_rejected(tmp_path):
+    (tmp_path / "other.bin").write_bytes(b"NOTATRACE")
+    with pytest.raises(ValueError):
+        read_binary_trace(tmp_path / "other.bin")
@@ -0,0 +1,89 @@
+import argparse
+import time
+
+import numpy as np
+
+from pathfinding.batch import VARIANTS
+from pathfinding.map_format import load_map
+from pathfinding.recording import (
+    expansion_heatmap,
+    load_recording,
+    record_search,
+    render_png_sequence,
+    write_png,
+)
+
+
+def load_grid(args):
+    """Peta dari --map (.pfmap atau .npy), atau peta acak --size/--seed"""
+    if args.map:
+        return np.load(args.map) if args.map.endswith(".npy") else load_map(args.map)
+    rng = np.random.default_rng(args.seed)
+    grid = (rng.random((args.size, args.size)) < args.density).astype(np.uint8)
+    grid[0, 0] = 2
+    grid[-1, -1] = 3
+    return grid
+
+
+def endpoint(grid, value, given):
+    if given is not None:
+        return tuple(given)
+    cells = np.argwhere(grid == value)
+    if cells.size == 0:
+        raise SystemExit("Start or Goal node not found in the grid.")
+    return tuple(int(v) for v in cells[0])
+
+
+def record(args):
+    grid = load_grid(args)
+    start = endpoint(grid, 2, args.start)
+    goal = endpoint(grid, 3, args.goal)
+    engine = VARIANTS[args.variant](grid)
+    begin = time.perf_counter()
+    path = record_search(args.output, grid, lambda tracer: engine.find_path(start, goal, tracer=tracer))
+    print(f"{args.variant}: jalur {len(path) if path else 0} sel, "
+          f"direkam ke '{args.output}' dalam {time.perf_counter() - begin:.3f} s")
+
+
+def render(args):
+    begin = time.perf_counter()
+    if args.frames:
+        count = render_png_sequence(args.recording, args.frames, args.events_per_frame, args.scale)
+        print(f"{count} frame disimpan ke '{args.frames}' dalam {time.perf_counter() - begin:.3f} s")
+    if args.heatmap:
+        grid, events = load_recording(args.recording)
+        write_png(args.heatmap, expansion_heatmap(grid, events, args.scale))
+        print(f"Heatmap expand disimpan ke '{args.heatmap}'")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merekam pencarian ke file trace dan merendernya tanpa jendela")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="jalankan pencarian dan rekam event-nya")
+    record_parser.add_argument("output", help="file rekaman (.npz)")
+    record_parser.add_argument("--map", help="file peta .pfmap atau .npy (bawaan: peta acak)")
+    record_parser.add_argument("--size", type=int, default=256)
+    record_parser.add_argument("--density", type=float, default=0.2)
+    record_parser.add_argument("--seed", type=int, default=0)
+    record_parser.add_argument("--variant", default="astar", choices=sorted(VARIANTS))
+    record_parser.add_argument("--start", type=int, nargs=2, help="row col (bawaan: sel bertanda 2)")
+    record_parser.add_argument("--goal", type=int, nargs=2, help="row col (bawaan: sel bertanda 3)")
+    record_parser.set_defaults(handler=record)
+
+    render_parser = commands.add_parser("render", help="render rekaman ke PNG")
+    render_parser.add_argument("recording")
+    render_parser.add_argument("--frames", help="folder untuk urutan frame PNG")
+    render_parser.add_argument("--events-per-frame", type=int, default=1000)
+    render_parser.add_argument("--heatmap", help="file PNG heatmap urutan expand")
+    render_parser.add_argument("--scale", type=int, default=1, help="piksel per sel")
+    render_parser.set_defaults(handler=render)
+
+    args = parser.parse_args()
+    if args.command == "render" and not (args.frames or args.heatmap):
+        parser.error("render membutuhkan --frames dan/atau --heatmap")
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()